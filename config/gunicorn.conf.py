@@ -2,3 +2,18 @@ bind = '127.0.0.1:8000'
 workers = 2
 user = "oleg"
 timeout = 120
+
+
+def on_starting(server):
+    # Counters of the previous run would be added to the new ones.
+    import glob
+    import os
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    directory = os.getenv('METRICS_DIRECTORY')
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+        for path in glob.glob(os.path.join(directory, 'metrics-*.json')):
+            os.remove(path)
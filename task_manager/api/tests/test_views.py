@@ -0,0 +1,170 @@
+import json
+from http import HTTPStatus
+
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.test import Client, TestCase
+from django.urls import reverse
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import Task
+
+User = get_user_model()
+
+
+class ApiTestCase(TestCase):
+
+    fixtures = ['labels.json', 'statuses.json', 'tasks.json', 'users.json']
+
+    def setUp(self) -> None:
+        for backend in caches.all():
+            backend.clear()
+        self.client = Client()
+        self.client.force_login(User.objects.get(pk=2))
+
+    def send(self, method, url, data):
+        return getattr(self.client, method)(
+            url, json.dumps(data), content_type='application/json',
+        )
+
+
+class TaskApiTest(ApiTestCase):
+    """Test case for the task API."""
+
+    def test_unauthorized_if_not_logged_in(self) -> None:
+        self.client.logout()
+        response = self.client.get(reverse('api_task_list'))
+        self.assertEqual(response.status_code, HTTPStatus.UNAUTHORIZED)
+
+    def test_list(self) -> None:
+        with self.assertNumQueries(4):
+            response = self.client.get(reverse('api_task_list'))
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        data = response.json()
+        self.assertEqual([task['id'] for task in data['results']], [1, 2, 3])
+        self.assertEqual(data['results'][2]['labels'], [2, 3])
+        self.assertEqual(data['results'][0]['executor'], 2)
+        self.assertIsNone(data['next'])
+
+    def test_sparse_fields(self) -> None:
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('api_task_list'),
+                                       {'fields': 'id,name'})
+        self.assertEqual(response.json()['results'][0],
+                         {'id': 1, 'name': 'task_1'})
+
+        response = self.client.get(reverse('api_task_list'),
+                                   {'fields': 'name,password'})
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(response.json()['fields'], ['password'])
+
+    def test_filters_and_pagination(self) -> None:
+        params = {'status': 3, 'limit': 1, 'fields': 'id'}
+        response = self.client.get(reverse('api_task_list'), params)
+        data = response.json()
+        self.assertEqual(data['results'], [{'id': 1}])
+
+        params['cursor'] = data['next']
+        data = self.client.get(reverse('api_task_list'), params).json()
+        self.assertEqual(data['results'], [{'id': 3}])
+        self.assertIsNone(data['next'])
+        self.assertIsNotNone(data['previous'])
+
+    def test_invalid_query(self) -> None:
+        for params in ({'status': 99}, {'cursor': 'bogus'}, {'limit': 0}):
+            response = self.client.get(reverse('api_task_list'), params)
+            self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+    def test_detail(self) -> None:
+        response = self.client.get(reverse('api_task_detail', args=[3]),
+                                   {'fields': 'name,labels'})
+        self.assertEqual(response.json(),
+                         {'name': 'task_3', 'labels': [2, 3]})
+        response = self.client.get(reverse('api_task_detail', args=[99]))
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+    def test_create(self) -> None:
+        response = self.send('post', reverse('api_task_list'), {
+            'name': 'api task',
+            'status': 1,
+            'labels': [1, 2],
+        })
+        self.assertEqual(response.status_code, HTTPStatus.CREATED)
+        data = response.json()
+        self.assertEqual(data['author'], 2)
+        self.assertEqual(data['labels'], [1, 2])
+
+        response = self.send('post', reverse('api_task_list'), {'name': ''})
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertIn('status', response.json()['errors'])
+
+    def test_form_data_rejected(self) -> None:
+        response = self.client.post(reverse('api_task_list'),
+                                    {'name': 'task', 'status': 1})
+        self.assertEqual(response.status_code,
+                         HTTPStatus.UNSUPPORTED_MEDIA_TYPE)
+
+    def test_update(self) -> None:
+        url = reverse('api_task_detail', args=[3])
+        response = self.send('patch', url, {'name': 'renamed'})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        task = Task.objects.get(pk=3)
+        self.assertEqual(task.name, 'renamed')
+        self.assertEqual(task.status_id, 3)
+        self.assertEqual(response.json()['labels'], [2, 3])
+
+    def test_delete(self) -> None:
+        response = self.client.delete(reverse('api_task_detail', args=[1]))
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+        response = self.client.delete(reverse('api_task_detail', args=[2]))
+        self.assertEqual(response.status_code, HTTPStatus.NO_CONTENT)
+        self.assertFalse(Task.objects.filter(pk=2).exists())
+
+
+class StatusAndLabelApiTest(ApiTestCase):
+    """Test case for the status and label API."""
+
+    def test_list(self) -> None:
+        for name in ('api_status_list', 'api_label_list'):
+            response = self.client.get(reverse(name), {'fields': 'name'})
+            self.assertEqual(len(response.json()['results']), 3)
+
+    def test_create_and_update(self) -> None:
+        response = self.send('post', reverse('api_status_list'),
+                             {'name': 'new'})
+        self.assertEqual(response.status_code, HTTPStatus.CREATED)
+        pk = response.json()['id']
+        self.send('patch', reverse('api_status_detail', args=[pk]),
+                  {'name': 'renamed'})
+        self.assertEqual(Status.objects.get(pk=pk).name, 'renamed')
+
+        response = self.send('post', reverse('api_label_list'),
+                             {'name': 'label_1'})
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+    def test_delete_in_use(self) -> None:
+        response = self.client.delete(reverse('api_label_detail', args=[2]))
+        self.assertEqual(response.status_code, HTTPStatus.CONFLICT)
+        response = self.client.delete(reverse('api_label_detail', args=[1]))
+        self.assertEqual(response.status_code, HTTPStatus.NO_CONTENT)
+        self.assertFalse(Label.objects.filter(pk=1).exists())
+
+
+class UserApiTest(ApiTestCase):
+    """Test case for the user API."""
+
+    def test_list_hides_passwords(self) -> None:
+        response = self.client.get(reverse('api_user_list'))
+        users = response.json()['results']
+        self.assertEqual(len(users), 3)
+        self.assertNotIn('password', users[0])
+
+    def test_update_only_self(self) -> None:
+        response = self.send('patch', reverse('api_user_detail', args=[1]),
+                             {'first_name': 'Other'})
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+        response = self.send('patch', reverse('api_user_detail', args=[2]),
+                             {'first_name': 'Renamed'})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json()['first_name'], 'Renamed')
@@ -0,0 +1,23 @@
+from django.urls import path
+
+from .views import (
+    LabelResourceView,
+    StatusResourceView,
+    TaskResourceView,
+    UserResourceView,
+)
+
+urlpatterns = [
+    path('tasks/', TaskResourceView.as_view(), name='api_task_list'),
+    path('tasks/<int:pk>/', TaskResourceView.as_view(),
+         name='api_task_detail'),
+    path('statuses/', StatusResourceView.as_view(), name='api_status_list'),
+    path('statuses/<int:pk>/', StatusResourceView.as_view(),
+         name='api_status_detail'),
+    path('labels/', LabelResourceView.as_view(), name='api_label_list'),
+    path('labels/<int:pk>/', LabelResourceView.as_view(),
+         name='api_label_detail'),
+    path('users/', UserResourceView.as_view(), name='api_user_list'),
+    path('users/<int:pk>/', UserResourceView.as_view(),
+         name='api_user_detail'),
+]
@@ -0,0 +1,322 @@
+"""
+JSON API for tasks, statuses, labels and users.
+
+List responses are built from `QuerySet.values()` with only the columns of
+the requested `fields`, no model instances are created. Pages are fetched
+with `KeysetPaginator`, the `next` and `previous` cursors of a response are
+passed back in the `cursor` query parameter.
+
+The API authenticates with the session cookie. Request bodies have to be
+sent as `application/json`, which a cross-site HTML form cannot do, so the
+CSRF token is not required.
+"""
+import json
+from http import HTTPStatus
+
+from django.contrib.auth import get_user_model
+from django.db.models import ProtectedError
+from django.forms import modelform_factory
+from django.forms.models import model_to_dict
+from django.http import HttpResponse, JsonResponse
+from django.utils.decorators import method_decorator
+from django.utils.translation import gettext as _
+from django.views import generic
+from django.views.decorators.csrf import csrf_exempt
+from task_manager.labels.models import Label
+from task_manager.pagination import InvalidCursor, KeysetPaginator
+from task_manager.statuses.models import Status
+from task_manager.tasks.filters import TaskFilter
+from task_manager.tasks.forms import TaskForm
+from task_manager.tasks.models import Task, TaskLabel
+from task_manager.users.forms import UserCreationAndChangeForm
+
+User = get_user_model()
+
+
+class ApiError(Exception):
+
+    def __init__(self, status, message, **extra):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.extra = extra
+
+    def response(self):
+        return JsonResponse(
+            {'error': self.message, **self.extra}, status=self.status,
+        )
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class ResourceView(generic.View):
+    """
+    Generic JSON view for a list of objects and a single object.
+
+    `fields` maps the public names of the fields to the lookups passed to
+    `values()`. A public name mapped to None is computed for a whole page
+    of rows by `add_computed_fields`.
+    """
+
+    model = None
+    form_class = None
+    update_form_class = None
+    fields = {}
+    ordering = ('id',)
+    paginate_by = 50
+    max_page_size = 200
+    http_method_names = ['get', 'post', 'patch', 'delete']
+
+    def dispatch(self, request, *args, **kwargs):
+        try:
+            if not request.user.is_authenticated:
+                raise ApiError(HTTPStatus.UNAUTHORIZED,
+                               _('Authentication required'))
+            return super().dispatch(request, *args, **kwargs)
+        except ApiError as error:
+            return error.response()
+
+    # Reading
+
+    def get_queryset(self):
+        return self.model._default_manager.all()
+
+    def filter_queryset(self, queryset):
+        return queryset
+
+    def get_ordering(self, queryset):
+        return self.ordering
+
+    def get_fields(self):
+        value = self.request.GET.get('fields')
+        if not value:
+            return list(self.fields)
+        names = list(dict.fromkeys(
+            name.strip() for name in value.split(',') if name.strip()
+        ))
+        unknown = [name for name in names if name not in self.fields]
+        if unknown:
+            raise ApiError(HTTPStatus.BAD_REQUEST, _('Unknown fields'),
+                           fields=unknown)
+        return names
+
+    def get_page_size(self):
+        value = self.request.GET.get('limit', self.paginate_by)
+        try:
+            size = int(value)
+        except (TypeError, ValueError):
+            size = 0
+        if not 0 < size <= self.max_page_size:
+            raise ApiError(HTTPStatus.BAD_REQUEST, _('Invalid limit'))
+        return size
+
+    def select(self, queryset, fields, ordering):
+        """Limit the queryset to the columns of the fields and ordering."""
+        lookups = [self.fields[name] for name in fields
+                   if self.fields[name] is not None]
+        lookups += [field.lstrip('-') for field in ordering]
+        return queryset.values(*dict.fromkeys(['id', *lookups]))
+
+    def serialize(self, rows, fields):
+        objects = [
+            {name: row[self.fields[name]] for name in fields
+             if self.fields[name] is not None}
+            for row in rows
+        ]
+        computed = [name for name in fields if self.fields[name] is None]
+        if computed and rows:
+            self.add_computed_fields(
+                [row['id'] for row in rows], objects, computed,
+            )
+        return objects
+
+    def add_computed_fields(self, ids, objects, names):
+        pass
+
+    def get(self, request, pk=None):
+        fields = self.get_fields()
+        if pk is not None:
+            return JsonResponse(self.get_object_data(pk, fields))
+
+        queryset = self.filter_queryset(self.get_queryset())
+        ordering = self.get_ordering(queryset)
+        paginator = KeysetPaginator(
+            self.select(queryset, fields, ordering),
+            self.get_page_size(),
+            ordering=ordering,
+        )
+        try:
+            page = paginator.page(request.GET.get('cursor'))
+        except InvalidCursor:
+            raise ApiError(HTTPStatus.BAD_REQUEST, _('Invalid cursor'))
+        return JsonResponse({
+            'results': self.serialize(page.object_list, fields),
+            'next': page.next_cursor,
+            'previous': page.previous_cursor,
+        })
+
+    def get_object_data(self, pk, fields):
+        rows = list(self.select(self.get_queryset().filter(pk=pk), fields, ()))
+        if not rows:
+            raise ApiError(HTTPStatus.NOT_FOUND, _('Not found'))
+        return self.serialize(rows, fields)[0]
+
+    # Writing
+
+    def get_object(self, pk):
+        try:
+            return self.get_queryset().get(pk=pk)
+        except self.model.DoesNotExist:
+            raise ApiError(HTTPStatus.NOT_FOUND, _('Not found'))
+
+    def check_permission(self, obj):
+        """Raise ApiError when the user may not change or delete the object."""
+
+    def get_payload(self):
+        if self.request.content_type != 'application/json':
+            raise ApiError(HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+                           _('Expected application/json'))
+        try:
+            payload = json.loads(self.request.body)
+        except ValueError:
+            raise ApiError(HTTPStatus.BAD_REQUEST, _('Invalid JSON'))
+        if not isinstance(payload, dict):
+            raise ApiError(HTTPStatus.BAD_REQUEST, _('Expected an object'))
+        return payload
+
+    def save(self, form):
+        return form.save()
+
+    def write(self, form, status):
+        if not form.is_valid():
+            raise ApiError(HTTPStatus.BAD_REQUEST, _('Invalid data'),
+                           errors=form.errors.get_json_data())
+        obj = self.save(form)
+        return JsonResponse(
+            self.get_object_data(obj.pk, list(self.fields)), status=status,
+        )
+
+    def post(self, request, pk=None):
+        if pk is not None:
+            return self.http_method_not_allowed(request)
+        form = self.form_class(data=self.get_payload())
+        return self.write(form, HTTPStatus.CREATED)
+
+    def patch(self, request, pk=None):
+        if pk is None:
+            return self.http_method_not_allowed(request)
+        obj = self.get_object(pk)
+        self.check_permission(obj)
+        form_class = self.update_form_class or self.form_class
+        # Fields missing from the payload keep their current values.
+        data = model_to_dict(obj, fields=form_class.base_fields)
+        data.update(self.get_payload())
+        return self.write(form_class(data=data, instance=obj), HTTPStatus.OK)
+
+    def delete(self, request, pk=None):
+        if pk is None:
+            return self.http_method_not_allowed(request)
+        obj = self.get_object(pk)
+        self.check_permission(obj)
+        try:
+            obj.delete()
+        except ProtectedError:
+            raise ApiError(HTTPStatus.CONFLICT, _('The object is in use'))
+        return HttpResponse(status=HTTPStatus.NO_CONTENT)
+
+
+class TaskResourceView(ResourceView):
+    """Tasks, filtered with the query parameters of the task list."""
+
+    model = Task
+    form_class = TaskForm
+    fields = {
+        'id': 'id',
+        'name': 'name',
+        'description': 'description',
+        'status': 'status_id',
+        'author': 'author_id',
+        'executor': 'executor_id',
+        'labels': None,
+        'created_at': 'created_at',
+        'updated_at': 'updated_at',
+    }
+    ordering = ('created_at', 'id')
+
+    def filter_queryset(self, queryset):
+        self.filterset = TaskFilter(
+            self.request.GET, queryset=queryset, request=self.request,
+        )
+        if not self.filterset.is_valid():
+            raise ApiError(HTTPStatus.BAD_REQUEST, _('Invalid filters'),
+                           errors=self.filterset.errors.get_json_data())
+        return self.filterset.qs
+
+    def get_ordering(self, queryset):
+        if self.filterset.is_ranked():
+            return ('-search_rank', 'id')
+        return self.ordering
+
+    def add_computed_fields(self, ids, objects, names):
+        labels = {pk: [] for pk in ids}
+        links = TaskLabel.objects.filter(task_id__in=ids).order_by('label_id')
+        for task_id, label_id in links.values_list('task_id', 'label_id'):
+            labels[task_id].append(label_id)
+        for pk, data in zip(ids, objects):
+            data['labels'] = labels[pk]
+
+    def check_permission(self, obj):
+        if self.request.method == 'DELETE' and \
+                obj.author_id != self.request.user.id:
+            raise ApiError(HTTPStatus.FORBIDDEN,
+                           _('The task can only be deleted by its author'))
+
+    def save(self, form):
+        if form.instance.pk is None:
+            form.instance.author = self.request.user
+        return form.save()
+
+
+class StatusResourceView(ResourceView):
+
+    model = Status
+    form_class = modelform_factory(Status, fields=('name',))
+    fields = {
+        'id': 'id',
+        'name': 'name',
+        'created_at': 'created_at',
+    }
+
+
+class LabelResourceView(ResourceView):
+
+    model = Label
+    form_class = modelform_factory(Label, fields=('name',))
+    fields = {
+        'id': 'id',
+        'name': 'name',
+        'created_at': 'created_at',
+    }
+
+
+class UserResourceView(ResourceView):
+    """Users, a user may change and delete only themselves."""
+
+    model = User
+    form_class = UserCreationAndChangeForm
+    update_form_class = modelform_factory(
+        User, fields=('first_name', 'last_name', 'username'),
+    )
+    fields = {
+        'id': 'id',
+        'username': 'username',
+        'first_name': 'first_name',
+        'last_name': 'last_name',
+        'date_joined': 'date_joined',
+    }
+
+    def check_permission(self, obj):
+        if obj.pk != self.request.user.pk:
+            raise ApiError(
+                HTTPStatus.FORBIDDEN,
+                _('You do not have permission to change another user'),
+            )
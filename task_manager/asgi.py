@@ -9,8 +9,23 @@ https://docs.djangoproject.com/en/4.1/howto/deployment/asgi/
 
 import os
 
+from django.conf import settings
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'task_manager.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+if settings.WARMUP_ON_START:
+    from task_manager.warmup import warm_up
+
+    warm_up()
+
+from task_manager.tasks.live import EVENTS_PATH, events_app  # noqa: E402
+
+
+async def application(scope, receive, send):
+    """Serve the live task events next to the Django application."""
+    if scope['type'] == 'http' and scope['path'] == EVENTS_PATH:
+        return await events_app(scope, receive, send)
+    return await django_application(scope, receive, send)
@@ -0,0 +1,258 @@
+"""
+Synthetic data of a production-like size.
+
+Users, statuses and labels are inserted with batched `bulk_create`, the
+tasks and the links between tasks and labels, which make up almost all of
+the rows, with batched `executemany` of plain rows. The authors,
+executors, statuses and labels of the tasks follow a Zipf distribution, so
+a few users and labels own most of the tasks as in real data. The same
+seed and end date always generate the same rows.
+
+Tasks are generated in chunks with precomputed ids, so the label links of
+a chunk are built without reading the tasks back. With several workers
+the chunks are inserted by forked processes, which pays off on databases
+accepting concurrent writes. SQLite allows a single writer, so the chunks
+are always inserted one after the other there.
+"""
+import multiprocessing
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from itertools import accumulate
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.color import no_style
+from django.db import connection, connections, transaction
+from django.db.models import Max
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks import read_model, search, versions
+from task_manager.tasks.models import Task, TaskLabel
+from task_manager.users.search import normalize
+
+User = get_user_model()
+
+PASSWORD = 'password'
+WORDS = (
+    'fix', 'add', 'update', 'remove', 'review', 'deploy', 'test', 'design',
+    'refactor', 'document', 'migrate', 'release', 'investigate', 'support',
+    'login', 'report', 'invoice', 'dashboard', 'export', 'search', 'api',
+    'page', 'email', 'payment', 'profile', 'settings', 'cache', 'database',
+    'server', 'client', 'mobile', 'layout', 'translation', 'backup',
+)
+FIRST_NAMES = (
+    'Anna', 'Boris', 'Chloe', 'Dmytro', 'Elena', 'Farid', 'Greta', 'Hugo',
+    'Iryna', 'Jonas', 'Kateryna', 'Luca', 'Maria', 'Nikolai', 'Olga',
+    'Pavel', 'Quinn', 'Renata', 'Sofia', 'Taras', 'Ursula', 'Viktor',
+)
+LAST_NAMES = (
+    'Adams', 'Bondarenko', 'Costa', 'Dubois', 'Evans', 'Fischer', 'Garcia',
+    'Horvat', 'Ivanenko', 'Jensen', 'Kowalski', 'Lopez', 'Melnyk', 'Novak',
+    'Olsen', 'Petrenko', 'Rossi', 'Schmidt', 'Tkachenko', 'Weber',
+)
+
+
+@dataclass
+class Sizes:
+    users: int = 100
+    statuses: int = 10
+    labels: int = 50
+    tasks: int = 10000
+    labels_per_task: float = 2.0
+
+
+@dataclass
+class Options:
+    seed: int = 0
+    # Exponent of the Zipf distribution, 0 picks uniformly.
+    skew: float = 1.0
+    batch_size: int = 5000
+    chunk_size: int = 50000
+    workers: int = 1
+    # Tasks are created over that many days up to `until`, a fixed date
+    # rather than the current time, so that the seed decides the data.
+    days: int = 365
+    until: datetime = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def zipf_weights(count, skew):
+    """Cumulative weights of `count` items, the first the most frequent."""
+    return list(accumulate(1 / (rank ** skew) for rank in range(1, count + 1)))
+
+
+def create_users(count, options):
+    password = make_password(PASSWORD)
+    rng = random.Random(f'{options.seed}:users')
+    start = (User.objects.aggregate(last=Max('pk'))['last'] or 0) + 1
+    users = []
+    for number in range(start, start + count):
+        first_name = rng.choice(FIRST_NAMES)
+        last_name = rng.choice(LAST_NAMES)
+        username = f'{first_name}.{last_name}.{number}'.lower()
+        users.append(User(
+            username=username, password=password,
+            first_name=first_name, last_name=last_name,
+            username_key=normalize(username),
+            first_name_key=normalize(first_name),
+            last_name_key=normalize(last_name),
+        ))
+    User.objects.bulk_create(users, batch_size=options.batch_size)
+
+
+def create_named(model, prefix, count, options):
+    start = (model.objects.aggregate(last=Max('pk'))['last'] or 0) + 1
+    model.objects.bulk_create(
+        [model(name=f'{prefix} {number}')
+         for number in range(start, start + count)],
+        batch_size=options.batch_size,
+    )
+
+
+TASK_COLUMNS = ('id', 'name', 'description', 'author_id', 'executor_id',
+                'status_id', 'created_at', 'updated_at')
+TASK_LABEL_COLUMNS = ('task_id', 'label_id')
+
+
+def build_tasks(chunk):
+    """Build the rows of the tasks and label links of one chunk."""
+    (index, start_id, count, user_ids, status_ids, label_ids,
+     sizes, options) = chunk
+    rng = random.Random(f'{options.seed}:tasks:{index}')
+    user_weights = zipf_weights(len(user_ids), options.skew)
+    status_weights = zipf_weights(len(status_ids), options.skew)
+    label_weights = zipf_weights(len(label_ids), options.skew)
+    period = options.days * 24 * 3600
+
+    authors = rng.choices(user_ids, cum_weights=user_weights, k=count)
+    executors = rng.choices(user_ids, cum_weights=user_weights, k=count)
+    statuses = rng.choices(status_ids, cum_weights=status_weights, k=count)
+    tasks = []
+    links = []
+    for offset in range(count):
+        pk = start_id + offset
+        created_at = options.until - timedelta(
+            seconds=rng.randrange(period or 1),
+        )
+        tasks.append((
+            pk,
+            ' '.join(rng.choices(WORDS, k=rng.randint(2, 5))),
+            ' '.join(rng.choices(WORDS, k=rng.randint(0, 30))),
+            authors[offset],
+            # About a fifth of the tasks has no executor.
+            executors[offset] if rng.random() < 0.8 else None,
+            statuses[offset],
+            created_at,
+            created_at,
+        ))
+        if label_ids:
+            wanted = rng.randint(0, round(2 * sizes.labels_per_task))
+            for label_id in sorted(set(rng.choices(
+                label_ids, cum_weights=label_weights, k=wanted,
+            ))):
+                links.append((pk, label_id))
+    return tasks, links
+
+
+def insert_rows(model, columns, rows, batch_size):
+    """
+    Insert rows of values with `executemany`.
+
+    Building a model instance per row and compiling it is what limits
+    `bulk_create` on millions of rows, the generated values need neither.
+    """
+    table = connection.ops.quote_name(model._meta.db_table)
+    names = ', '.join(connection.ops.quote_name(column) for column in columns)
+    placeholders = ', '.join(['%s'] * len(columns))
+    sql = f'INSERT INTO {table} ({names}) VALUES ({placeholders})'
+    with connection.cursor() as cursor:
+        for start in range(0, len(rows), batch_size):
+            cursor.executemany(sql, rows[start:start + batch_size])
+
+
+def adapt_timestamps(rows, positions):
+    adapt = connection.ops.adapt_datetimefield_value
+    return [
+        tuple(adapt(value) if position in positions else value
+              for position, value in enumerate(row))
+        for row in rows
+    ]
+
+
+def create_tasks(chunk):
+    """Insert one chunk of tasks and their label links, return the counts."""
+    tasks, links = build_tasks(chunk)
+    options = chunk[-1]
+    tasks = adapt_timestamps(tasks, {TASK_COLUMNS.index('created_at'),
+                                     TASK_COLUMNS.index('updated_at')})
+    with transaction.atomic():
+        insert_rows(Task, TASK_COLUMNS, tasks, options.batch_size)
+        insert_rows(TaskLabel, TASK_LABEL_COLUMNS, links, options.batch_size)
+    return len(tasks), len(links)
+
+
+def get_chunks(sizes, options, user_ids, status_ids, label_ids):
+    start_id = (Task.objects.aggregate(last=Max('pk'))['last'] or 0) + 1
+    for index, offset in enumerate(range(0, sizes.tasks, options.chunk_size)):
+        count = min(options.chunk_size, sizes.tasks - offset)
+        yield (index, start_id + offset, count, user_ids, status_ids,
+               label_ids, sizes, options)
+
+
+def insert_tasks(sizes, options):
+    user_ids = list(User.objects.order_by('pk').values_list('pk', flat=True))
+    status_ids = list(Status.objects.order_by('pk')
+                      .values_list('pk', flat=True))
+    label_ids = list(Label.objects.order_by('pk')
+                     .values_list('pk', flat=True))
+    if sizes.tasks and not (user_ids and status_ids):
+        raise ValueError('Tasks need at least one user and one status.')
+
+    chunks = get_chunks(sizes, options, user_ids, status_ids, label_ids)
+    if options.workers > 1 and connection.vendor != 'sqlite':
+        # Forked processes must not share the connection of the parent.
+        connections.close_all()
+        context = multiprocessing.get_context('fork')
+        with context.Pool(options.workers) as pool:
+            counts = pool.map(create_tasks, chunks)
+    else:
+        counts = [create_tasks(chunk) for chunk in chunks]
+
+    # Ids were set explicitly, the sequence has to continue after them.
+    with connection.cursor() as cursor:
+        for sql in connection.ops.sequence_reset_sql(no_style(), [Task]):
+            cursor.execute(sql)
+    return (sum(tasks for tasks, _links in counts),
+            sum(links for _tasks, links in counts))
+
+
+def generate(sizes, options, rebuild=True, log=None):
+    """Generate the data and return the number of created rows by table."""
+    log = log or (lambda message: None)
+    timings = {}
+
+    def step(name, function, *args):
+        start = time.perf_counter()
+        result = function(*args)
+        timings[name] = time.perf_counter() - start
+        log(f'{name}: {timings[name]:.1f} s')
+        return result
+
+    step('users', create_users, sizes.users, options)
+    step('statuses', create_named, Status, 'status', sizes.statuses, options)
+    step('labels', create_named, Label, 'label', sizes.labels, options)
+    tasks, links = step('tasks', insert_tasks, sizes, options)
+    if rebuild:
+        step('task list', read_model.rebuild, options.batch_size)
+        step('search index', lambda: search.get_backend().rebuild())
+    for name in (versions.TASKS, versions.STATUSES, versions.LABELS,
+                 versions.USERS):
+        versions.bump_version(name)
+    return {
+        'users': sizes.users,
+        'statuses': sizes.statuses,
+        'labels': sizes.labels,
+        'tasks': tasks,
+        'task labels': links,
+    }
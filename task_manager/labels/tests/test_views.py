@@ -1,10 +1,12 @@
 from http import HTTPStatus
+from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
 from django.test import Client, TestCase
 from django.urls import reverse
 from django.utils.translation import gettext as _
+from django.utils.translation import ngettext
 from task_manager.labels.models import Label
 
 User = get_user_model()
@@ -219,6 +221,27 @@ class LabelDeleteViewTest(TestCase):
         self.assertEqual(message.message, _('The label successfully deleted'))
         self.assertEqual(message.tags, 'success')
 
+    def test_view_shows_blocking_tasks(self) -> None:
+        with self.assertNumQueries(4):
+            response = self.client.get(reverse('label_delete', args=[2]))
+        self.assertEqual(response.context['blocking_count'], 1)
+        self.assertContains(response, ngettext(
+            'It is used by %(counter)s task and cannot be deleted.',
+            'It is used by %(counter)s tasks and cannot be deleted.', 1,
+        ) % {'counter': 1})
+
+        response = self.client.get(reverse('label_delete', args=[1]))
+        self.assertEqual(response.context['blocking_count'], 0)
+        self.assertNotContains(response, ngettext(
+            'It is used by %(counter)s task and cannot be deleted.',
+            'It is used by %(counter)s tasks and cannot be deleted.', 0,
+        ) % {'counter': 0})
+
+    def test_label_in_use_is_not_collected(self) -> None:
+        with patch.object(Label, 'delete') as delete:
+            self.client.post(reverse('label_delete', args=[3]))
+        delete.assert_not_called()
+
     def test_do_not_delete_label_linked_to_task(self) -> None:
         label_before = Label.objects.get(pk=3)
 
@@ -0,0 +1,221 @@
+"""
+Load test of every page of the project against a local server.
+
+The pages are served by a threaded WSGI server started in the same
+process, which counts the queries of every request. Simulated users,
+logged in and anonymous, request every named URL concurrently and the
+latency, throughput, queries and response size of each URL are reported
+as JSON, so that the reports of two releases can be diffed.
+"""
+import http.client
+import itertools
+import math
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from django.contrib.auth import get_user_model
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.servers.basehttp import ThreadedWSGIServer, WSGIRequestHandler
+from django.db import connection
+from django.test import Client
+from django.urls import get_resolver, reverse
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import Task
+
+User = get_user_model()
+
+QUERY_HEADER = 'X-Loadtest-Request'
+# Logging out would end the sessions of the simulated users, the events
+# stream does not end, bulk changes only accept POST and the metrics are
+# only shown to the scraper.
+EXCLUDED_URLS = {'logout', 'task_events', 'task_bulk', 'metrics'}
+PK_SOURCES = {
+    'task': Task,
+    'status': Status,
+    'label': Label,
+    'user': User,
+}
+
+
+@dataclass
+class Sample:
+    status: int
+    seconds: float
+    size: int
+    queries: int = 0
+
+
+def get_targets(user):
+    """Paths of every named URL, objects of `user` fill the `pk`."""
+    resolver = get_resolver()
+    targets = {}
+    for name in sorted(key for key in resolver.reverse_dict
+                       if isinstance(key, str)):
+        if name in EXCLUDED_URLS:
+            continue
+        kwargs = {}
+        for _bits, _pattern, _defaults, converters in \
+                resolver.reverse_dict.getlist(name):
+            if 'pk' in converters:
+                kwargs['pk'] = get_pk(name, user)
+        if kwargs.get('pk', 0) is not None:
+            targets[name] = reverse(name, kwargs=kwargs)
+    return targets
+
+
+def get_pk(name, user):
+    source = name.removeprefix('api_').split('_')[0]
+    if source == 'user':
+        return user.pk
+    if source == 'task':
+        return Task.objects.filter(author=user).values_list(
+            'pk', flat=True,
+        ).first()
+    model = PK_SOURCES.get(source)
+    if model is None:
+        return None
+    return model.objects.values_list('pk', flat=True).first()
+
+
+class QueryCountingHandler(WSGIHandler):
+    """WSGI handler recording the number of queries of every request."""
+
+    def __init__(self):
+        super().__init__()
+        self.counts = {}
+
+    def __call__(self, environ, start_response):
+        count = itertools.count()
+
+        def counter(execute, sql, params, many, context):
+            next(count)
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(counter):
+            # Streaming responses run their queries while being iterated.
+            body = b''.join(super().__call__(environ, start_response))
+        request_id = environ.get(f'HTTP_{QUERY_HEADER.upper()}'
+                                 .replace('-', '_'))
+        if request_id:
+            self.counts[request_id] = next(count)
+        return [body]
+
+
+class QuietRequestHandler(WSGIRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Server:
+    """Threaded WSGI server on a free local port."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.httpd = ThreadedWSGIServer(('127.0.0.1', 0), QuietRequestHandler)
+        self.httpd.set_app(handler)
+        self.host, self.port = self.httpd.server_address
+        self.thread = threading.Thread(target=self.httpd.serve_forever,
+                                       daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.thread.join()
+
+    def get(self, path, cookie=None):
+        request_id = uuid.uuid4().hex
+        headers = {QUERY_HEADER: request_id}
+        if cookie:
+            headers['Cookie'] = cookie
+        client = http.client.HTTPConnection(self.host, self.port, timeout=60)
+        start = time.perf_counter()
+        try:
+            client.request('GET', path, headers=headers)
+            response = client.getresponse()
+            body = response.read()
+        finally:
+            client.close()
+        seconds = time.perf_counter() - start
+        return Sample(response.status, seconds, len(body),
+                      self.handler.counts.pop(request_id, 0))
+
+
+def login_cookies(users):
+    """Session cookies of the users, created without a login request."""
+    cookies = []
+    for user in users:
+        client = Client()
+        client.force_login(user)
+        cookies.append('; '.join(
+            f'{morsel.key}={morsel.value}'
+            for morsel in client.cookies.values()
+        ))
+    return cookies
+
+
+def percentile(values, percent):
+    """Nearest-rank percentile of the values."""
+    ordered = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize(samples, seconds):
+    latencies = [sample.seconds * 1000 for sample in samples]
+    statuses = {}
+    for sample in samples:
+        statuses[str(sample.status)] = statuses.get(str(sample.status), 0) + 1
+    return {
+        'requests': len(samples),
+        'statuses': statuses,
+        'throughput': round(len(samples) / seconds, 2),
+        'p50_ms': round(percentile(latencies, 50), 2),
+        'p95_ms': round(percentile(latencies, 95), 2),
+        'p99_ms': round(percentile(latencies, 99), 2),
+        'queries_per_request': round(
+            sum(sample.queries for sample in samples) / len(samples), 2,
+        ),
+        'bytes_per_response': round(
+            sum(sample.size for sample in samples) / len(samples), 2,
+        ),
+    }
+
+
+def run(requests=100, concurrency=10, logged_in=5, anonymous=5,
+        urls=None):
+    """Request every target URL and return the report of each of them."""
+    users = list(User.objects.order_by('pk')[:logged_in])
+    if not users:
+        raise ValueError('There are no users to log in.')
+    cookies = login_cookies(users) + [None] * anonymous
+    targets = get_targets(users[0])
+    if urls:
+        targets = {name: path for name, path in targets.items()
+                   if name in urls}
+
+    report = {}
+    everything = []
+    with Server(QueryCountingHandler()) as server, \
+            ThreadPoolExecutor(concurrency) as executor:
+        for name, path in targets.items():
+            start = time.perf_counter()
+            samples = list(executor.map(
+                lambda index: server.get(path, cookies[index % len(cookies)]),
+                range(requests),
+            ))
+            report[name] = {'path': path,
+                            **summarize(samples, time.perf_counter() - start)}
+            everything.extend(samples)
+    total_seconds = sum(
+        requests / entry['throughput'] for entry in report.values()
+    )
+    return {'urls': report, 'total': summarize(everything, total_seconds)}
@@ -0,0 +1,117 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from task_manager import datagen
+
+
+class Command(BaseCommand):
+    help = (
+        'Generate users, statuses, labels, tasks and task labels with '
+        'skewed distributions, e.g. to reproduce a production-size '
+        'database. The same seed always generates the same data.'
+    )
+
+    def add_arguments(self, parser):
+        default_sizes = datagen.Sizes()
+        defaults = datagen.Options()
+        parser.add_argument('--users', type=int, default=default_sizes.users)
+        parser.add_argument('--statuses', type=int,
+                            default=default_sizes.statuses)
+        parser.add_argument('--labels', type=int,
+                            default=default_sizes.labels)
+        parser.add_argument('--tasks', type=int, default=default_sizes.tasks)
+        parser.add_argument(
+            '--labels-per-task',
+            type=float,
+            default=default_sizes.labels_per_task,
+            help='Average number of labels of a task.',
+        )
+        parser.add_argument('--seed', type=int, default=defaults.seed)
+        parser.add_argument(
+            '--skew',
+            type=float,
+            default=defaults.skew,
+            help='Exponent of the Zipf distribution of authors, executors, '
+                 'statuses and labels, 0 for a uniform distribution.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=defaults.batch_size,
+            help='Number of rows inserted by one query.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=defaults.chunk_size,
+            help='Number of tasks generated and inserted at once.',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=defaults.workers,
+            help='Number of processes inserting the tasks.',
+        )
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=defaults.days,
+            help='Tasks are created over that many days up to --until.',
+        )
+        parser.add_argument(
+            '--until',
+            default=defaults.until.isoformat(),
+            help='Date and time the tasks are created up to, in ISO 8601 '
+                 '(part of the seed, the current time is not used).',
+        )
+        parser.add_argument(
+            '--skip-rebuild',
+            action='store_true',
+            help='Do not rebuild the task list and the search index.',
+        )
+
+    def handle(self, *args, **options):
+        sizes = datagen.Sizes(
+            users=options['users'],
+            statuses=options['statuses'],
+            labels=options['labels'],
+            tasks=options['tasks'],
+            labels_per_task=options['labels_per_task'],
+        )
+        generator_options = datagen.Options(
+            seed=options['seed'],
+            skew=options['skew'],
+            batch_size=options['batch_size'],
+            chunk_size=options['chunk_size'],
+            workers=options['workers'],
+            days=options['days'],
+            until=self.parse_until(options['until']),
+        )
+        if min(options['batch_size'], options['chunk_size'],
+               options['workers']) < 1:
+            raise CommandError('Sizes of batches and chunks and the number '
+                               'of workers have to be positive.')
+        try:
+            counts = datagen.generate(
+                sizes, generator_options,
+                rebuild=not options['skip_rebuild'],
+                log=self.stdout.write if options['verbosity'] > 1 else None,
+            )
+        except ValueError as error:
+            raise CommandError(error)
+        self.stdout.write(self.style.SUCCESS(
+            'Generated ' + ', '.join(
+                f'{count} {name}' for name, count in counts.items()
+            ) + '.'
+        ))
+
+    def parse_until(self, value):
+        try:
+            until = parse_datetime(value)
+        except ValueError:
+            until = None
+        if until is None:
+            raise CommandError(f'Invalid --until date and time: {value}')
+        if timezone.is_naive(until):
+            until = timezone.make_aware(until)
+        return until
@@ -0,0 +1,107 @@
+import json
+import os
+import tempfile
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from task_manager import datagen, loadtest
+from task_manager.test_runner import local_memory_caches
+
+DATASET_OPTIONS = ('users', 'statuses', 'labels', 'tasks', 'labels_per_task')
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed a throwaway database, start a local server and request every '
+        'named URL with concurrent logged-in and anonymous users. Reports '
+        'latency percentiles, throughput, queries per request and bytes '
+        'per response of every URL as JSON.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=100,
+                            help='Number of requests sent to every URL.')
+        parser.add_argument('--concurrency', type=int, default=10,
+                            help='Number of requests in flight at once.')
+        parser.add_argument('--logged-in', type=int, default=5,
+                            help='Number of simulated logged-in users.')
+        parser.add_argument('--anonymous', type=int, default=5,
+                            help='Number of simulated anonymous users.')
+        parser.add_argument('--url', action='append', dest='urls',
+                            help='Name of a URL to request, all by default.')
+        parser.add_argument('--output',
+                            help='File the JSON report is written to.')
+        parser.add_argument(
+            '--existing',
+            action='store_true',
+            help='Use the configured database as it is instead of seeding '
+                 'a test database.',
+        )
+        parser.add_argument('--users', type=int, default=20)
+        parser.add_argument('--statuses', type=int, default=5)
+        parser.add_argument('--labels', type=int, default=20)
+        parser.add_argument('--tasks', type=int, default=1000)
+        parser.add_argument('--labels-per-task', type=float, default=2)
+        parser.add_argument('--seed', type=int, default=0,
+                            help='Seed of the random dataset.')
+
+    def handle(self, *args, **options):
+        if options['requests'] < 1 or options['concurrency'] < 1:
+            raise CommandError('Send at least 1 request, 1 at a time.')
+        if options['existing']:
+            report = self.run(options)
+        else:
+            report = self.run_on_test_database(options)
+
+        output = json.dumps(report, indent=2, sort_keys=True)
+        if options['output']:
+            with open(options['output'], 'w') as file:
+                file.write(output + '\n')
+        else:
+            self.stdout.write(output)
+
+    def run_on_test_database(self, options):
+        creation = connection.creation
+        # The caches of the throwaway database must not leak to or from a
+        # server running on the same host.
+        with tempfile.TemporaryDirectory() as directory, \
+                local_memory_caches('loadtest'):
+            if connection.vendor == 'sqlite':
+                # The server threads need a database file, not a memory one.
+                connection.settings_dict['TEST']['NAME'] = os.path.join(
+                    directory, 'loadtest.sqlite3',
+                )
+            old_name = creation.create_test_db(
+                verbosity=0, autoclobber=True, serialize=False,
+            )
+            try:
+                datagen.generate(
+                    datagen.Sizes(**{name: options[name]
+                                     for name in DATASET_OPTIONS}),
+                    datagen.Options(seed=options['seed']),
+                )
+                return self.run(options)
+            finally:
+                creation.destroy_test_db(old_name, verbosity=0)
+
+    def run(self, options):
+        try:
+            report = loadtest.run(
+                requests=options['requests'],
+                concurrency=options['concurrency'],
+                logged_in=options['logged_in'],
+                anonymous=options['anonymous'],
+                urls=options['urls'],
+            )
+        except ValueError as error:
+            raise CommandError(error)
+        report['config'] = {
+            'django': django.get_version(),
+            'database': connection.vendor,
+            **{name: options[name] for name in (
+                'requests', 'concurrency', 'logged_in', 'anonymous',
+                'existing', 'seed', *DATASET_OPTIONS,
+            )},
+        }
+        return report
@@ -0,0 +1,64 @@
+import time
+from importlib import import_module
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = (
+        'Delete the expired sessions from the database in small batches, '
+        'so the table is never locked for long. Stops after --max-batches '
+        'to spread a large purge over several runs.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of sessions deleted by one query.',
+        )
+        parser.add_argument(
+            '--max-batches',
+            type=int,
+            default=0,
+            help='Stop after that many batches, 0 deletes all of them.',
+        )
+        parser.add_argument(
+            '--pause',
+            type=float,
+            default=0,
+            help='Seconds to wait between two batches.',
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('Delete at least 1 session per batch.')
+        store = import_module(settings.SESSION_ENGINE).SessionStore
+        if not hasattr(store, 'get_model_class'):
+            self.stdout.write(
+                f'{settings.SESSION_ENGINE} does not store the sessions in '
+                f'the database, there is nothing to purge.'
+            )
+            return
+
+        model = store.get_model_class()
+        # Sessions expiring during the purge are left for the next run.
+        now = timezone.now()
+        deleted = batches = 0
+        while not options['max_batches'] or batches < options['max_batches']:
+            keys = list(
+                model.objects.filter(expire_date__lt=now)
+                .values_list('pk', flat=True)[:options['batch_size']]
+            )
+            if not keys:
+                break
+            deleted += model.objects.filter(pk__in=keys).delete()[0]
+            batches += 1
+            if options['pause']:
+                time.sleep(options['pause'])
+        self.stdout.write(
+            f'Deleted {deleted} expired sessions in {batches} batches.'
+        )
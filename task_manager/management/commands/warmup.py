@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand, CommandError
+from task_manager import warmup
+
+
+class Command(BaseCommand):
+    help = (
+        'Compile all templates of the project and reverse all URL names, '
+        'reporting the compile time of every template.'
+    )
+
+    def handle(self, *args, **options):
+        timings = warmup.warm_templates()
+        for timing in sorted(timings, key=lambda item: -item.seconds):
+            line = f'{timing.seconds * 1000:8.2f} ms  {timing.name}'
+            if timing.error is None:
+                self.stdout.write(line)
+            else:
+                self.stdout.write(self.style.ERROR(f'{line}  {timing.error}'))
+
+        urls = warmup.warm_urls()
+        total = sum(timing.seconds for timing in timings) * 1000
+        self.stdout.write(self.style.SUCCESS(
+            f'Compiled {len(timings)} templates in {total:.2f} ms, '
+            f'reversed {urls} URL names.'
+        ))
+
+        failed = [timing.name for timing in timings if timing.error]
+        if failed:
+            raise CommandError(f'Broken templates: {", ".join(failed)}')
@@ -0,0 +1,219 @@
+"""
+Request, database, session and cache metrics in the Prometheus format.
+
+Every process keeps its samples in memory. With `METRICS_DIRECTORY` set,
+a process also writes them to its own file in that directory at most every
+`FLUSH_INTERVAL` seconds, and a scrape sums the files of all processes, so
+any gunicorn worker answers for the whole server. The files of stopped
+workers are kept, counters never go back, so the directory has to be
+emptied when the server starts (see `config/gunicorn.conf.py`).
+"""
+import atexit
+import glob
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+FLUSH_INTERVAL = 1.0
+FILE_PATTERN = 'metrics-*.json'
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class Registry:
+    """Samples of the metrics of this process."""
+
+    def __init__(self, directory=None):
+        self._directory = directory
+        self.metrics = {}
+        self.lock = threading.Lock()
+        self.pid = os.getpid()
+        self.samples = defaultdict(float)
+        self.flushed_at = 0.0
+
+    @property
+    def directory(self):
+        if self._directory is not None:
+            return self._directory
+        return getattr(settings, 'METRICS_DIRECTORY', '')
+
+    @property
+    def path(self):
+        return os.path.join(self.directory, f'metrics-{self.pid}.json')
+
+    def register(self, metric):
+        self.metrics[metric.name] = metric
+        return metric
+
+    def add(self, increments):
+        """Add `(sample name, labels, amount)` increments."""
+        with self.lock:
+            if os.getpid() != self.pid:
+                # Forked, the samples of the parent are in its own file.
+                self.pid = os.getpid()
+                self.samples.clear()
+            for name, labels, amount in increments:
+                self.samples[name, labels] += amount
+        if self.directory and \
+                time.monotonic() - self.flushed_at >= FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self):
+        if not self.directory:
+            return
+        with self.lock:
+            self.flushed_at = time.monotonic()
+            data = [[name, labels, value]
+                    for (name, labels), value in self.samples.items()]
+        temporary = f'{self.path}.tmp'
+        try:
+            with open(temporary, 'w') as file:
+                json.dump(data, file)
+            os.replace(temporary, self.path)
+        except OSError as error:
+            logger.warning('Cannot write the metrics: %s', error)
+
+    def collect(self):
+        """Return the samples of all processes summed up."""
+        if not self.directory:
+            with self.lock:
+                return dict(self.samples)
+        self.flush()
+        samples = defaultdict(float)
+        for path in glob.glob(os.path.join(self.directory, FILE_PATTERN)):
+            try:
+                with open(path) as file:
+                    data = json.load(file)
+            except (OSError, ValueError):
+                # Removed or being replaced, the next scrape reads it.
+                continue
+            for name, labels, value in data:
+                samples[name, tuple(map(tuple, labels))] += value
+        return samples
+
+    def expose(self):
+        """Render the samples in the Prometheus text format."""
+        samples = self.collect()
+        by_name = defaultdict(list)
+        for (name, labels), value in samples.items():
+            by_name[name].append((labels, value))
+        lines = []
+        for metric in self.metrics.values():
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            for name in metric.sample_names:
+                for labels, value in by_name[name]:
+                    lines.append(
+                        f'{name}{format_labels(labels)} {format_value(value)}'
+                    )
+        return '\n'.join(lines) + '\n'
+
+
+def format_labels(labels):
+    if not labels:
+        return ''
+    pairs = ','.join(
+        '{}="{}"'.format(name, str(value).replace('\\', r'\\')
+                         .replace('"', r'\"').replace('\n', r'\n'))
+        for name, value in labels
+    )
+    return f'{{{pairs}}}'
+
+
+def format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+class Counter:
+    kind = 'counter'
+
+    def __init__(self, registry, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.sample_names = (name,)
+        registry.register(self)
+        self.registry = registry
+
+    def get_labels(self, labels):
+        return tuple((name, str(labels[name])) for name in self.labelnames)
+
+    def inc(self, amount=1, **labels):
+        self.registry.add([(self.name, self.get_labels(labels), amount)])
+
+
+class Histogram(Counter):
+    kind = 'histogram'
+
+    def __init__(self, registry, name, documentation, labelnames=(),
+                 buckets=()):
+        super().__init__(registry, name, documentation, labelnames)
+        self.buckets = (*buckets, float('inf'))
+        self.sample_names = (f'{name}_bucket', f'{name}_sum', f'{name}_count')
+
+    def increments(self, value, labels):
+        labels = self.get_labels(labels)
+        for bound in self.buckets:
+            # Every bucket is added to, so that all of them are exposed.
+            yield (f'{self.name}_bucket',
+                   (*labels, ('le', format_value(float(bound)))),
+                   int(value <= bound))
+        yield f'{self.name}_sum', labels, value
+        yield f'{self.name}_count', labels, 1
+
+    def observe(self, value, **labels):
+        self.registry.add(self.increments(value, labels))
+
+    def observe_many(self, values, **labels):
+        self.registry.add([increment for value in values
+                           for increment in self.increments(value, labels)])
+
+
+registry = Registry()
+atexit.register(registry.flush)
+
+REQUESTS = Counter(
+    registry, 'django_http_requests_total',
+    'Requests by view, method and status code.',
+    ('view', 'method', 'status'),
+)
+REQUEST_DURATION = Histogram(
+    registry, 'django_http_request_duration_seconds',
+    'Duration of the requests by view.', ('view',),
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+REQUEST_QUERIES = Histogram(
+    registry, 'django_db_queries_per_request',
+    'Number of database queries of the requests by view.', ('view',),
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100),
+)
+QUERY_DURATION = Histogram(
+    registry, 'django_db_query_duration_seconds',
+    'Duration of the database queries by view.', ('view',),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1),
+)
+SESSIONS = Counter(
+    registry, 'django_session_loads_total',
+    'Sessions requested with a cookie, found (hit) or not (miss).',
+    ('result',),
+)
+CACHE_LOOKUPS = Counter(
+    registry, 'django_cache_lookups_total',
+    'Cache lookups by use and result.', ('cache', 'result'),
+)
+
+
+def count_cache(cache, hits, misses=0):
+    """Count `hits` and `misses` of the lookups of a use of the cache."""
+    if hits:
+        CACHE_LOOKUPS.inc(hits, cache=cache, result='hit')
+    if misses:
+        CACHE_LOOKUPS.inc(misses, cache=cache, result='miss')
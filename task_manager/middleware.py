@@ -0,0 +1,337 @@
+import logging
+import random
+import time
+
+from asgiref.sync import (
+    iscoroutinefunction,
+    markcoroutinefunction,
+    sync_to_async,
+)
+from django.conf import settings
+from django.db import connection
+from task_manager import metrics
+from task_manager.slow_queries import recorder
+
+logger = logging.getLogger(__name__)
+timing_logger = logging.getLogger('task_manager.timing')
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+class AsyncCapableMiddleware:
+    """
+    Base of the middleware running in the mode of the handler.
+
+    Under ASGI the middleware is a coroutine awaiting the next one, instead
+    of moving the rest of the request into a thread. The execute wrappers
+    set up in the event loop also see the queries run by `sync_to_async`
+    for the request, the database connection is shared with the task that
+    launched the thread.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.handle(request)
+
+    def handle(self, request):
+        raise NotImplementedError
+
+    async def __acall__(self, request):
+        raise NotImplementedError
+
+
+class QueryCounter:
+    """Database execute wrapper counting the executed queries."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class QueryBudgetMiddleware(AsyncCapableMiddleware):
+    """
+    Check the number of queries of a request against the view's budget.
+
+    A class-based view declares its budget with the `query_budget`
+    attribute. The budget covers the whole request, including session and
+    user lookups. When `QUERY_BUDGET_STRICT` is enabled an exceeded budget
+    raises `QueryBudgetExceeded`, otherwise it is logged as a warning.
+    """
+
+    def handle(self, request):
+        counter = QueryCounter()
+        with connection.execute_wrapper(counter):
+            response = self.get_response(request)
+        self.check(request, counter.count)
+        return response
+
+    async def __acall__(self, request):
+        counter = QueryCounter()
+        with connection.execute_wrapper(counter):
+            response = await self.get_response(request)
+        self.check(request, counter.count)
+        return response
+
+    def check(self, request, count):
+        match = request.resolver_match
+        view_class = getattr(match.func, 'view_class', None) if match \
+            else None
+        budget = getattr(view_class, 'query_budget', None)
+        if budget is not None and count > budget:
+            message = (
+                f'{request.method} {request.path} executed {count} '
+                f'queries, the budget is {budget}'
+            )
+            if getattr(settings, 'QUERY_BUDGET_STRICT', False):
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+
+
+class RequestTiming:
+    """
+    Durations of the parts of one request, in seconds.
+
+    Also the database execute wrapper timing the queries of the request.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.db = 0.0
+        self.view = 0.0
+        self.render = 0.0
+        self.total = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db += time.perf_counter() - start
+
+    @property
+    def middleware(self):
+        return max(self.total - self.view - self.render, 0.0)
+
+    def as_header(self):
+        return ', '.join([
+            f'db;dur={self.db * 1000:.1f};desc="{self.queries} queries"',
+            f'view;dur={self.view * 1000:.1f}',
+            f'render;dur={self.render * 1000:.1f}',
+            f'middleware;dur={self.middleware * 1000:.1f}',
+            f'total;dur={self.total * 1000:.1f}',
+        ])
+
+    def as_dict(self):
+        return {
+            'queries': self.queries,
+            **{f'{name}_ms': round(getattr(self, name) * 1000, 1)
+               for name in ('db', 'view', 'render', 'middleware', 'total')},
+        }
+
+
+class ServerTimingMiddleware(AsyncCapableMiddleware):
+    """
+    Time a sample of the requests and report it in `Server-Timing`.
+
+    `SERVER_TIMING_SAMPLE_RATE` is the share of the timed requests, the
+    other requests go through untouched. A timed request gets the number
+    and duration of its queries, the view, template render and middleware
+    times and the total in the `Server-Timing` header, and the same values
+    are logged by the `task_manager.timing` logger with the URL name.
+
+    The middleware has to come first after `SlowQueryMiddleware`,
+    `ViewTimingMiddleware` the last one. The queries run while rendering
+    are counted in both `db` and `render`.
+    """
+
+    def handle(self, request):
+        if not self.sampled():
+            return self.get_response(request)
+
+        timing = request.server_timing = RequestTiming()
+        start = time.perf_counter()
+        with connection.execute_wrapper(timing):
+            response = self.get_response(request)
+        timing.total = time.perf_counter() - start
+        return self.report(request, response, timing)
+
+    async def __acall__(self, request):
+        if not self.sampled():
+            return await self.get_response(request)
+
+        timing = request.server_timing = RequestTiming()
+        start = time.perf_counter()
+        with connection.execute_wrapper(timing):
+            response = await self.get_response(request)
+        timing.total = time.perf_counter() - start
+        return self.report(request, response, timing)
+
+    def sampled(self):
+        rate = getattr(settings, 'SERVER_TIMING_SAMPLE_RATE', 0)
+        return rate > 0 and random.random() < rate
+
+    def report(self, request, response, timing):
+        response['Server-Timing'] = timing.as_header()
+        match = request.resolver_match
+        url_name = match.view_name if match else None
+        values = {'url_name': url_name, 'method': request.method,
+                  'status': response.status_code, **timing.as_dict()}
+        timing_logger.info(
+            ' '.join(f'{key}={value}' for key, value in values.items()),
+            extra={'timing': values},
+        )
+        return response
+
+
+class ViewTimingMiddleware(AsyncCapableMiddleware):
+    """Time the view and the template render of a timed request."""
+
+    def handle(self, request):
+        timing = getattr(request, 'server_timing', None)
+        if timing is None:
+            return self.get_response(request)
+        start = time.perf_counter()
+        response = self.get_response(request)
+        timing.view = time.perf_counter() - start - timing.render
+        return response
+
+    async def __acall__(self, request):
+        timing = getattr(request, 'server_timing', None)
+        if timing is None:
+            return await self.get_response(request)
+        start = time.perf_counter()
+        response = await self.get_response(request)
+        timing.view = time.perf_counter() - start - timing.render
+        return response
+
+    def process_template_response(self, request, response):
+        timing = getattr(request, 'server_timing', None)
+        if timing is not None:
+            render = response.render
+
+            def timed_render():
+                start = time.perf_counter()
+                try:
+                    return render()
+                finally:
+                    timing.render += time.perf_counter() - start
+
+            response.render = timed_render
+        return response
+
+
+# Other methods are counted together, the method is set by the client.
+METRICS_METHODS = {'GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE',
+                   'OPTIONS'}
+
+
+def count_session(request):
+    """Count whether the session cookie of a request found a session."""
+    session = getattr(request, 'session', None)
+    if session is None or not session.accessed or \
+            settings.SESSION_COOKIE_NAME not in request.COOKIES:
+        return
+    result = 'hit' if session.session_key else 'miss'
+    metrics.SESSIONS.inc(result=result)
+
+
+class QueryDurations(list):
+    """Database execute wrapper keeping the duration of every query."""
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.append(time.perf_counter() - start)
+
+
+class MetricsMiddleware(AsyncCapableMiddleware):
+    """
+    Count the requests by view and status code with their duration and
+    queries, and the session loads, see `task_manager.metrics`.
+    """
+
+    def handle(self, request):
+        durations = QueryDurations()
+        start = time.perf_counter()
+        with connection.execute_wrapper(durations):
+            response = self.get_response(request)
+        self.count(request, response, time.perf_counter() - start,
+                   durations)
+        return response
+
+    async def __acall__(self, request):
+        durations = QueryDurations()
+        start = time.perf_counter()
+        with connection.execute_wrapper(durations):
+            response = await self.get_response(request)
+        self.count(request, response, time.perf_counter() - start,
+                   durations)
+        return response
+
+    def count(self, request, response, duration, durations):
+        match = request.resolver_match
+        view = match.view_name if match else 'unresolved'
+        method = request.method if request.method in METRICS_METHODS \
+            else 'other'
+        metrics.REQUESTS.inc(view=view, method=method,
+                             status=response.status_code)
+        metrics.REQUEST_DURATION.observe(duration, view=view)
+        metrics.REQUEST_QUERIES.observe(len(durations), view=view)
+        metrics.QUERY_DURATION.observe_many(durations, view=view)
+        count_session(request)
+
+
+class SlowQueryMiddleware(AsyncCapableMiddleware):
+    """
+    Record the queries slower than `SLOW_QUERY_THRESHOLD_MS` with their
+    plans while `SLOW_QUERY_LOG` is on, see `slow_queries.recorder`.
+
+    The middleware has to be the first one, so that the EXPLAIN and
+    bookkeeping queries of the recorder run after the execute wrappers of
+    the timing and metrics middleware are removed.
+    """
+
+    def handle(self, request):
+        if not getattr(settings, 'SLOW_QUERY_LOG', False):
+            return self.get_response(request)
+
+        timer = recorder.QueryTimer(settings.SLOW_QUERY_THRESHOLD_MS)
+        with connection.execute_wrapper(timer):
+            response = self.get_response(request)
+        if timer.samples:
+            recorder.save(timer.samples, self.get_url_name(request))
+        return response
+
+    async def __acall__(self, request):
+        if not getattr(settings, 'SLOW_QUERY_LOG', False):
+            return await self.get_response(request)
+
+        timer = recorder.QueryTimer(settings.SLOW_QUERY_THRESHOLD_MS)
+        with connection.execute_wrapper(timer):
+            response = await self.get_response(request)
+        if timer.samples:
+            await sync_to_async(recorder.save)(
+                timer.samples, self.get_url_name(request),
+            )
+        return response
+
+    def get_url_name(self, request):
+        match = request.resolver_match
+        return match.view_name if match else ''
@@ -0,0 +1,205 @@
+import base64
+import binascii
+import datetime
+import json
+from functools import reduce
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from django.http import Http404
+from django.utils.translation import gettext as _
+
+NEXT = 'next'
+PREVIOUS = 'prev'
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+def _serialize(value):
+    # Keep full precision: truncated timestamps would repeat rows.
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    raise TypeError(f'{type(value).__name__} is not a cursor value')
+
+
+def encode_cursor(values, direction):
+    """Pack ordering values and a direction into an opaque URL-safe token."""
+    payload = json.dumps([direction, values], default=_serialize)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token):
+    """Unpack a token produced by `encode_cursor`."""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        direction, values = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError, binascii.Error):
+        raise InvalidCursor(token)
+    if direction not in (NEXT, PREVIOUS) or not isinstance(values, list):
+        raise InvalidCursor(token)
+    return direction, values
+
+
+class KeysetPage:
+    """A page of objects together with the cursors of its neighbours."""
+
+    def __init__(self, object_list, paginator, has_next, has_previous):
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self._has_next or self._has_previous
+
+    @property
+    def next_cursor(self):
+        if not self._has_next:
+            return None
+        return self.paginator.cursor_for(self.object_list[-1], NEXT)
+
+    @property
+    def previous_cursor(self):
+        if not self._has_previous:
+            return None
+        return self.paginator.cursor_for(self.object_list[0], PREVIOUS)
+
+
+def bounded_count(queryset, limit):
+    """
+    Count the rows of the queryset, stopping after `limit + 1` of them.
+
+    A result greater than `limit` means "more than `limit`", the database
+    does not have to count all rows of a large table.
+    """
+    return queryset.order_by()[:limit + 1].count()
+
+
+class KeysetPaginator:
+    """
+    Cursor paginator seeking on a unique ordering instead of OFFSET.
+
+    Every page is fetched with a `WHERE (ordering) > (last seen values)`
+    condition, so the cost of a page does not depend on how deep it is.
+    The last field of `ordering` has to be unique (usually `pk`).
+    """
+
+    def __init__(self, queryset, per_page, ordering=('created_at', 'pk')):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = tuple(ordering)
+
+    def _fields(self):
+        return [(field.lstrip('-'), field.startswith('-'))
+                for field in self.ordering]
+
+    def _value(self, obj, field):
+        if isinstance(obj, dict):
+            return obj[field]
+        return getattr(obj, field)
+
+    def cursor_for(self, obj, direction):
+        values = [self._value(obj, field) for field, _desc in self._fields()]
+        return encode_cursor(values, direction)
+
+    def _seek(self, values, direction):
+        """Build the lexicographic `(f1, f2, ...) > (v1, v2, ...)` filter."""
+        fields = self._fields()
+        if len(values) != len(fields):
+            raise InvalidCursor(values)
+        conditions = []
+        for index, (field, descending) in enumerate(fields):
+            greater = descending == (direction == PREVIOUS)
+            lookup = f'{field}__gt' if greater else f'{field}__lt'
+            equal = {name: value for (name, _desc), value
+                     in zip(fields[:index], values[:index])}
+            conditions.append(Q(**equal, **{lookup: values[index]}))
+        return reduce(lambda left, right: left | right, conditions)
+
+    def _order_by(self, direction):
+        if direction == NEXT:
+            return self.ordering
+        return tuple(field[1:] if field.startswith('-') else f'-{field}'
+                     for field in self.ordering)
+
+    def _page_queryset(self, cursor):
+        """Return the direction, the seek values and the rows to fetch."""
+        direction, values = NEXT, None
+        if cursor:
+            direction, values = decode_cursor(cursor)
+
+        queryset = self.queryset.order_by(*self._order_by(direction))
+        if values is not None:
+            try:
+                queryset = queryset.filter(self._seek(values, direction))
+            except (ValidationError, ValueError, TypeError):
+                raise InvalidCursor(cursor)
+        return direction, values, queryset[:self.per_page + 1]
+
+    def page(self, cursor=None):
+        direction, values, queryset = self._page_queryset(cursor)
+        return self._make_page(list(queryset), direction, values)
+
+    async def apage(self, cursor=None):
+        """Same as `page`, fetching the rows with the async ORM interface."""
+        direction, values, queryset = self._page_queryset(cursor)
+        rows = [row async for row in queryset]
+        return self._make_page(rows, direction, values)
+
+    def _make_page(self, rows, direction, values):
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+
+        if direction == NEXT:
+            return KeysetPage(rows, self, has_more, values is not None)
+        rows.reverse()
+        return KeysetPage(rows, self, True, has_more)
+
+
+class KeysetPaginationMixin:
+    """
+    Replace offset pagination of a list view with `KeysetPaginator`.
+
+    The cursor travels in the `cursor_kwarg` query parameter, all other
+    query parameters (e.g. filters) are kept in `querystring` so that
+    templates can build links to the neighbouring pages.
+    """
+
+    paginate_by = 50
+    cursor_kwarg = 'cursor'
+    keyset_ordering = ('created_at', 'pk')
+
+    def get_keyset_ordering(self):
+        return self.keyset_ordering
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = KeysetPaginator(
+            queryset,
+            page_size,
+            ordering=self.get_keyset_ordering(),
+        )
+        try:
+            page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        except InvalidCursor:
+            raise Http404(_('Invalid cursor'))
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def get_context_data(self, **kwargs):
+        querystring = self.request.GET.copy()
+        querystring.pop(self.cursor_kwarg, None)
+        kwargs.setdefault('querystring', querystring.urlencode())
+        return super().get_context_data(**kwargs)
@@ -10,7 +10,9 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.1/ref/settings/
 """
 
+import hashlib
 import os
+import tempfile
 from pathlib import Path
 
 import dj_database_url
@@ -18,6 +20,26 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+
+def get_flag(name, default=False):
+    """Read a boolean from the environment, any other value is false."""
+    value = os.getenv(name)
+    if value is None:
+        return bool(default)
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def get_build_id(*directories):
+    """Digest of the code, templates and translations in the directories."""
+    digest = hashlib.md5()
+    for directory in directories:
+        for path in sorted(Path(directory).rglob('*')):
+            if path.suffix in ('.py', '.html', '.mo'):
+                digest.update(str(path.relative_to(directory)).encode())
+                digest.update(path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -61,11 +83,17 @@ INSTALLED_APPS = [
     'task_manager.statuses',
     'task_manager.tasks',
     'task_manager.labels',
+    'task_manager.api',
+    'task_manager.slow_queries',
 ]
 
 MIDDLEWARE = [
+    'task_manager.middleware.SlowQueryMiddleware',
+    'task_manager.middleware.ServerTimingMiddleware',
+    'task_manager.middleware.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    'task_manager.middleware.QueryBudgetMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     # 'django.middleware.locale.LocaleMiddleware',  # Enable for automatic language translation
     'django.middleware.common.CommonMiddleware',
@@ -73,18 +101,54 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'task_manager.middleware.ViewTimingMiddleware',
 ]
 
 if not DEBUG:
-    MIDDLEWARE.append('rollbar.contrib.django.middleware.RollbarNotifierMiddleware')
+    # Before `ViewTimingMiddleware`, which has to stay the last one.
+    MIDDLEWARE.insert(-1, 'rollbar.contrib.django.middleware.RollbarNotifierMiddleware')
+
+# Raise instead of logging when a view exceeds its `query_budget`
+QUERY_BUDGET_STRICT = get_flag('QUERY_BUDGET_STRICT', DEBUG)
+
+# Share of the requests timed in the `Server-Timing` header and the logs
+SERVER_TIMING_SAMPLE_RATE = float(
+    os.getenv('SERVER_TIMING_SAMPLE_RATE', 1 if DEBUG else 0.01)
+)
+
+# Directory the workers share their metrics through, empty for per-worker
+METRICS_DIRECTORY = os.getenv('METRICS_DIRECTORY', '')
+
+# Bearer token of the metrics scraper, superusers can always see `/metrics/`
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')
+
+# Record the queries above the threshold with their plans (see the admin)
+SLOW_QUERY_LOG = get_flag('SLOW_QUERY_LOG')
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv('SLOW_QUERY_THRESHOLD_MS', 100))
+# Number of query fingerprints kept, the oldest ones are dropped
+SLOW_QUERY_LOG_SIZE = int(os.getenv('SLOW_QUERY_LOG_SIZE', 200))
 
 ROOT_URLCONF = 'task_manager.urls'
 
+# Serve the task list from the denormalized `TaskListEntry` table
+TASK_LIST_READ_MODEL = get_flag('TASK_LIST_READ_MODEL')
+
+# Serve the task list and detail pages with the async views (for ASGI)
+TASK_ASYNC_VIEWS = get_flag('TASK_ASYNC_VIEWS')
+
+# Subscribe the task list to the live events, served only under ASGI
+TASK_LIVE_UPDATES = get_flag('TASK_LIVE_UPDATES')
+
+# Identifier of the deployed code, part of the ETags so that a deploy does
+# not answer 304 for the old pages. A digest of the sources by default.
+BUILD_ID = os.getenv('BUILD_ID') or get_build_id(
+    BASE_DIR / 'task_manager', BASE_DIR / 'locale',
+)
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.debug',
@@ -92,12 +156,24 @@ TEMPLATES = [
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            # Compiled templates are kept for the lifetime of the worker,
+            # the warm-up (see task_manager/warmup.py) fills this cache.
+            # In development the cache is reset when a template changes.
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
         },
     },
 ]
 
 WSGI_APPLICATION = 'task_manager.wsgi.application'
 
+# Compile the templates and URLs when a worker loads the application.
+WARMUP_ON_START = get_flag('WARMUP_ON_START', not DEBUG)
+
 
 # Database
 # https://docs.djangoproject.com/en/4.1/ref/settings/#databases
@@ -113,6 +189,73 @@ db_from_env = dj_database_url.config(conn_max_age=500)
 DATABASES['default'].update(db_from_env)
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.1/topics/cache/
+# The versions of the tables and the choice lists are kept in the default
+# cache, so it has to be shared by all workers. The default file-based cache
+# is shared by the workers of one host and kept small, as every write lists
+# its directory; memcached or redis also serve several hosts. The rendered
+# rows and facet counts are stored under digests and versions, so they are
+# safe in the `local` cache of every process.
+
+FILE_CACHE = 'django.core.cache.backends.filebased.FileBasedCache'
+LOCAL_MEMORY_CACHE = 'django.core.cache.backends.locmem.LocMemCache'
+
+
+def get_cache(prefix, name, max_entries, backend=FILE_CACHE):
+    """
+    Settings of a cache read from the `<prefix>_BACKEND`, `<prefix>_LOCATION`
+    and `<prefix>_MAX_ENTRIES` variables, a file-based cache by default.
+    """
+    backend = os.getenv(f'{prefix}_BACKEND', backend)
+    cache = {
+        'BACKEND': backend,
+        'LOCATION': os.getenv(
+            f'{prefix}_LOCATION',
+            str(Path(tempfile.gettempdir()) / 'task_manager' / name)
+            if backend == FILE_CACHE else name,
+        ),
+    }
+    # Only these backends cull, the others pass OPTIONS to their client.
+    if backend.endswith(('.FileBasedCache', '.LocMemCache')):
+        cache['OPTIONS'] = {
+            'MAX_ENTRIES': int(os.getenv(f'{prefix}_MAX_ENTRIES',
+                                         max_entries)),
+        }
+    return cache
+
+
+CACHES = {
+    'default': get_cache('CACHE', 'cache', 1000),
+    'local': get_cache('LOCAL_CACHE', 'local', 10000, LOCAL_MEMORY_CACHE),
+    # The database stays authoritative for `cached_db`, but a session
+    # changed by one process is only dropped from its own local cache: use
+    # memcached or redis with several processes.
+    'sessions': get_cache('SESSION_CACHE', 'sessions', 10000,
+                          LOCAL_MEMORY_CACHE),
+}
+
+# The tests get local-memory caches, see `task_manager.test_runner`
+TEST_RUNNER = 'task_manager.test_runner.TestRunner'
+
+
+# Sessions
+# https://docs.djangoproject.com/en/4.1/topics/http/sessions/
+# `cached_db` reads the sessions from the `sessions` cache and writes them
+# through to the database, `signed_cookies` keeps them in the browser.
+# Run `purge_sessions` regularly with the database-backed engines.
+
+SESSION_ENGINE = os.getenv(
+    'SESSION_ENGINE',
+    'django.contrib.sessions.backends.db',
+)
+SESSION_CACHE_ALIAS = 'sessions'
+
+# Messages are kept in a cookie, so they never change the session. The
+# cookie holds about 2 KB, older messages beyond that are dropped silently.
+MESSAGE_STORAGE = 'django.contrib.messages.storage.cookie.CookieStorage'
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
 
@@ -0,0 +1,19 @@
+from django.contrib import admin
+
+from .models import SlowQuery
+
+
+@admin.register(SlowQuery)
+class SlowQueryAdmin(admin.ModelAdmin):
+    list_display = ('fingerprint', 'url_name', 'count', 'max_duration',
+                    'last_seen')
+    list_filter = ('url_name',)
+    ordering = ('-max_duration',)
+    readonly_fields = ('fingerprint', 'sql', 'params', 'url_name', 'plan',
+                       'count', 'max_duration', 'first_seen', 'last_seen')
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,6 @@
+from django.apps import AppConfig
+
+
+class SlowQueriesConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'task_manager.slow_queries'
@@ -0,0 +1,58 @@
+from django.core.management.base import BaseCommand
+from task_manager.slow_queries.models import SlowQuery
+
+ORDERINGS = {
+    'duration': ('-max_duration', '-pk'),
+    'count': ('-count', '-pk'),
+    'recent': ('-last_seen', '-pk'),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Show the recorded slow queries with their URL names, counts and '
+        'durations, and their SQL, parameters and plans with --details.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--order',
+            choices=ORDERINGS,
+            default='duration',
+            help='Order of the queries, the slowest first by default.',
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=20,
+            help='Number of queries shown.',
+        )
+        parser.add_argument(
+            '--details',
+            action='store_true',
+            help='Show the whole SQL, the parameters and the plan.',
+        )
+        parser.add_argument(
+            '--clear',
+            action='store_true',
+            help='Delete all recorded queries.',
+        )
+
+    def handle(self, *args, **options):
+        if options['clear']:
+            count, _deleted = SlowQuery.objects.all().delete()
+            self.stdout.write(f'Deleted {count} slow queries.')
+            return
+
+        queries = SlowQuery.objects.order_by(*ORDERINGS[options['order']])
+        for query in queries[:options['limit']]:
+            self.stdout.write(
+                f'{query.max_duration:9.1f} ms {query.count:7}x  '
+                f'{query.url_name or "-"}  {query.fingerprint}'
+            )
+            if options['details']:
+                self.stdout.write(f'{query.sql}\n'
+                                  f'Parameters: {query.params}\n'
+                                  f'{query.plan or "No plan."}\n')
+            else:
+                self.stdout.write(f'    {query.sql[:120]}')
@@ -0,0 +1,33 @@
+# Generated by Django 4.1.7 on 2026-10-18 02:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SlowQuery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fingerprint', models.CharField(max_length=32, unique=True, verbose_name='fingerprint')),
+                ('sql', models.TextField(verbose_name='SQL')),
+                ('params', models.TextField(blank=True, verbose_name='parameters')),
+                ('url_name', models.CharField(blank=True, max_length=200, verbose_name='URL name')),
+                ('plan', models.TextField(blank=True, verbose_name='plan')),
+                ('count', models.PositiveIntegerField(default=0, verbose_name='count')),
+                ('max_duration', models.FloatField(default=0, verbose_name='max duration, ms')),
+                ('first_seen', models.DateTimeField(auto_now_add=True, verbose_name='first seen')),
+                ('last_seen', models.DateTimeField(db_index=True, verbose_name='last seen')),
+            ],
+            options={
+                'verbose_name': 'slow query',
+                'verbose_name_plural': 'slow queries',
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+from django.db import models
+from django.utils.translation import gettext as _
+
+
+class SlowQuery(models.Model):
+    """Model representing the slow queries of one fingerprint."""
+
+    fingerprint = models.CharField(
+        verbose_name=_('fingerprint'),
+        max_length=32,
+        unique=True,
+    )
+    sql = models.TextField(verbose_name=_('SQL'))
+    params = models.TextField(verbose_name=_('parameters'), blank=True)
+    url_name = models.CharField(
+        verbose_name=_('URL name'),
+        max_length=200,
+        blank=True,
+    )
+    plan = models.TextField(verbose_name=_('plan'), blank=True)
+    count = models.PositiveIntegerField(verbose_name=_('count'), default=0)
+    max_duration = models.FloatField(
+        verbose_name=_('max duration, ms'),
+        default=0,
+    )
+    first_seen = models.DateTimeField(
+        verbose_name=_('first seen'),
+        auto_now_add=True,
+    )
+    last_seen = models.DateTimeField(
+        verbose_name=_('last seen'),
+        db_index=True,
+    )
+
+    class Meta:
+        verbose_name = _('slow query')
+        verbose_name_plural = _('slow queries')
+
+    def __str__(self):
+        return self.sql[:100]
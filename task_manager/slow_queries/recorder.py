@@ -0,0 +1,140 @@
+"""
+Recorder of the queries slower than `SLOW_QUERY_THRESHOLD_MS`.
+
+`SlowQueryMiddleware` times the queries of a request with a connection
+execute wrapper. Once the response is ready, the slow ones are grouped by
+the fingerprint of their SQL, in which literals, parameters and `IN` lists
+are replaced, so the same query with other values is stored once. A new
+fingerprint is stored with its SQL, parameters, URL name and EXPLAIN
+output, a known one, or one stored by another process meanwhile, only
+updates its count, maximum duration and last occurrence. Only the
+`SLOW_QUERY_LOG_SIZE` most recent fingerprints are kept.
+"""
+import hashlib
+import json
+import re
+import time
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import (
+    DatabaseError,
+    IntegrityError,
+    connection,
+    transaction,
+)
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from .models import SlowQuery
+
+LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b|%s|\?")
+IN_LISTS = re.compile(r'\(\?(?:\s*,\s*\?)+\)')
+EXPLAINED = re.compile(r'^\s*(?:SELECT|WITH)\b', re.IGNORECASE)
+
+
+def fingerprint(sql):
+    """Hash of the SQL without literals, parameters and `IN` lists."""
+    normalized = IN_LISTS.sub('(?)', LITERALS.sub('?', sql))
+    normalized = ' '.join(normalized.split()).lower()
+    return hashlib.md5(normalized.encode()).hexdigest()
+
+
+@dataclass
+class Sample:
+    sql: str
+    params: object
+    duration: float
+    count: int = 1
+
+
+class QueryTimer:
+    """Database execute wrapper keeping the queries above the threshold."""
+
+    def __init__(self, threshold):
+        self.threshold = threshold
+        self.samples = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = (time.perf_counter() - start) * 1000
+            if duration >= self.threshold and not many:
+                self.add(sql, params, duration)
+
+    def add(self, sql, params, duration):
+        key = fingerprint(sql)
+        sample = self.samples.get(key)
+        if sample is None:
+            self.samples[key] = Sample(sql, params, duration)
+            return
+        sample.count += 1
+        if duration > sample.duration:
+            sample.sql, sample.params, sample.duration = sql, params, duration
+
+
+def explain(sql, params):
+    """Return the plan of a query, only reading queries are explained."""
+    if not EXPLAINED.match(sql):
+        return ''
+    prefix = connection.ops.explain_query_prefix()
+    try:
+        # A failed query must not break the transaction of the request.
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f'{prefix} {sql}', params)
+            rows = cursor.fetchall()
+    except DatabaseError as error:
+        return f'EXPLAIN failed: {error}'
+    return '\n'.join(str(row[-1]) for row in rows)
+
+
+def get_known(keys):
+    return set(SlowQuery.objects.filter(fingerprint__in=keys)
+               .values_list('fingerprint', flat=True))
+
+
+def insert(key, sample, url_name, now):
+    """Store a new fingerprint, return False if another process did."""
+    try:
+        with transaction.atomic():
+            SlowQuery.objects.create(
+                fingerprint=key,
+                sql=sample.sql,
+                params=json.dumps(sample.params, default=str),
+                url_name=url_name,
+                plan=explain(sample.sql, sample.params),
+                count=sample.count,
+                max_duration=sample.duration,
+                last_seen=now,
+            )
+    except IntegrityError:
+        return False
+    return True
+
+
+def save(samples, url_name):
+    """Store the slow queries of a request and drop the oldest ones."""
+    now = timezone.now()
+    known = get_known(samples)
+    added = {key for key, sample in samples.items()
+             if key not in known and insert(key, sample, url_name, now)}
+    # Known ones and the ones stored meanwhile by another process.
+    for key in samples.keys() - added:
+        SlowQuery.objects.filter(fingerprint=key).update(
+            count=F('count') + samples[key].count,
+            max_duration=Greatest('max_duration', samples[key].duration),
+            url_name=url_name,
+            last_seen=now,
+        )
+    if added:
+        trim(settings.SLOW_QUERY_LOG_SIZE)
+
+
+def trim(size):
+    """Keep the `size` fingerprints seen last."""
+    outdated = SlowQuery.objects.order_by('-last_seen', '-pk') \
+        .values_list('pk', flat=True)[size:]
+    SlowQuery.objects.filter(pk__in=list(outdated)).delete()
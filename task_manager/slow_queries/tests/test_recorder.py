@@ -0,0 +1,110 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from task_manager.slow_queries import recorder
+from task_manager.slow_queries.models import SlowQuery
+from task_manager.slow_queries.recorder import fingerprint
+
+User = get_user_model()
+
+
+class FingerprintTest(TestCase):
+    """Test case for the normalized SQL fingerprints."""
+
+    def test_values_ignored(self) -> None:
+        self.assertEqual(
+            fingerprint('SELECT * FROM "t" WHERE "a" = 1 AND "b" = \'x\''),
+            fingerprint('select *  from "t" where "a" = 25 '
+                        'and "b" = \'it\'\'s\''),
+        )
+        self.assertEqual(
+            fingerprint('SELECT * FROM "t" WHERE "id" IN (%s, %s, %s)'),
+            fingerprint('SELECT * FROM "t" WHERE "id" IN (%s)'),
+        )
+
+    def test_queries_distinguished(self) -> None:
+        self.assertNotEqual(
+            fingerprint('SELECT * FROM "t1" WHERE "a" = %s'),
+            fingerprint('SELECT * FROM "t2" WHERE "a" = %s'),
+        )
+
+
+@override_settings(SLOW_QUERY_LOG=True, SLOW_QUERY_THRESHOLD_MS=0)
+class SlowQueryMiddlewareTest(TestCase):
+    """Test case for the recording of the slow queries of the requests."""
+
+    fixtures = ['labels.json', 'statuses.json', 'tasks.json', 'users.json']
+
+    def setUp(self) -> None:
+        self.client = Client()
+        self.client.force_login(User.objects.get(pk=1))
+        self.async_client.force_login(User.objects.get(pk=1))
+
+    def test_recorded_with_plan(self) -> None:
+        self.client.get(reverse('task_list'))
+        queries = SlowQuery.objects.filter(url_name='task_list')
+        self.assertTrue(queries.exists())
+        query = queries.filter(sql__contains='tasks_task').first()
+        self.assertTrue(query.plan)
+        self.assertEqual(query.count, 1)
+        self.assertGreater(query.max_duration, 0)
+
+    async def test_recorded_under_asgi(self) -> None:
+        await self.async_client.get(reverse('status_list'))
+        self.assertTrue(
+            await SlowQuery.objects.filter(url_name='status_list').aexists()
+        )
+
+    def test_deduplicated(self) -> None:
+        self.client.get(reverse('task_detail', args=[1]))
+        count = SlowQuery.objects.count()
+        self.client.get(reverse('task_detail', args=[2]))
+        self.assertEqual(SlowQuery.objects.count(), count)
+        self.assertFalse(SlowQuery.objects.filter(count=1).exists())
+
+    def test_stored_meanwhile_counted(self) -> None:
+        key = fingerprint('SELECT 1')
+        # Another process stores the fingerprint after the lookup.
+        SlowQuery.objects.create(fingerprint=key, sql='SELECT 1', count=2,
+                                 max_duration=1, last_seen=timezone.now())
+        with patch.object(recorder, 'get_known', return_value=set()):
+            recorder.save({key: recorder.Sample('SELECT 1', [], 5)}, 'home')
+        query = SlowQuery.objects.get()
+        self.assertEqual((query.count, query.max_duration), (3, 5))
+
+    @override_settings(SERVER_TIMING_SAMPLE_RATE=1)
+    def test_not_timed(self) -> None:
+        response = self.client.get(reverse('status_list'))
+        with self.settings(SLOW_QUERY_LOG=False):
+            expected = self.client.get(reverse('status_list'))
+        self.assertTrue(SlowQuery.objects.exists())
+        self.assertEqual(
+            response['Server-Timing'].split(',')[0].split(';')[-1],
+            expected['Server-Timing'].split(',')[0].split(';')[-1],
+        )
+
+    @override_settings(SLOW_QUERY_LOG_SIZE=2)
+    def test_bounded(self) -> None:
+        self.client.get(reverse('task_list'))
+        self.client.get(reverse('user_list'))
+        self.assertEqual(SlowQuery.objects.count(), 2)
+
+    @override_settings(SLOW_QUERY_LOG=False)
+    def test_off(self) -> None:
+        self.client.get(reverse('task_list'))
+        self.assertFalse(SlowQuery.objects.exists())
+
+    def test_command(self) -> None:
+        self.client.get(reverse('status_list'))
+        out = StringIO()
+        call_command('slow_queries', '--details', stdout=out)
+        self.assertIn('status_list', out.getvalue())
+        self.assertIn('statuses_status', out.getvalue())
+
+        call_command('slow_queries', '--clear', stdout=StringIO())
+        self.assertFalse(SlowQuery.objects.exists())
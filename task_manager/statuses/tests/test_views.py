@@ -5,6 +5,7 @@ from django.core.exceptions import ObjectDoesNotExist
 from django.test import Client, TestCase
 from django.urls import reverse
 from django.utils.translation import gettext as _
+from django.utils.translation import ngettext
 from task_manager.statuses.models import Status
 
 User = get_user_model()
@@ -219,6 +220,14 @@ class StatusDeleteViewTest(TestCase):
         self.assertEqual(message.message, _('The status successfully deleted'))
         self.assertEqual(message.tags, 'success')
 
+    def test_view_shows_blocking_tasks(self) -> None:
+        response = self.client.get(reverse('status_delete', args=[3]))
+        self.assertEqual(response.context['blocking_count'], 2)
+        self.assertContains(response, ngettext(
+            'It is used by %(counter)s task and cannot be deleted.',
+            'It is used by %(counter)s tasks and cannot be deleted.', 2,
+        ) % {'counter': 2})
+
     def test_do_not_delete_status_linked_to_task(self) -> None:
         status_before = Status.objects.get(pk=3)
 
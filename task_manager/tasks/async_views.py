@@ -0,0 +1,65 @@
+"""
+Async variants of the task list and detail views for ASGI deployments.
+
+The queries run through the async ORM interface, so a worker waiting for
+the database or a slow client keeps serving other requests. Work that has
+no async interface in Django 4.1 (the session, cached choices, the facet
+counts and the row cache) runs with `sync_to_async`, the templates are
+rendered by the ASGI handler in a thread as for sync views.
+"""
+from asgiref.sync import sync_to_async
+from django.http import Http404
+from django.utils.translation import gettext as _
+from task_manager.mixins import AsyncDispatchMixin
+from task_manager.pagination import InvalidCursor, KeysetPaginator
+
+from .models import Task
+from .views import TaskDetailView, TaskListView
+
+
+class AsyncTaskListView(AsyncDispatchMixin, TaskListView):
+    """Generic class-based view for a list of tasks with an async handler."""
+
+    async def get(self, request, *args, **kwargs):
+        self.filterset = self.get_filterset(self.get_filterset_class())
+        valid = True
+        if self.filterset.is_bound:
+            valid = await sync_to_async(self.filterset.is_valid)()
+        if valid or not self.get_strict():
+            self.object_list = self.filterset.qs
+        else:
+            self.object_list = self.filterset.queryset.none()
+
+        paginator = KeysetPaginator(
+            self.object_list,
+            self.get_paginate_by(self.object_list),
+            ordering=self.get_keyset_ordering(),
+        )
+        try:
+            page = await paginator.apage(request.GET.get(self.cursor_kwarg))
+        except InvalidCursor:
+            raise Http404(_('Invalid cursor'))
+        self.keyset_page = paginator, page
+
+        context = await sync_to_async(self.get_context_data)(
+            filter=self.filterset,
+            object_list=self.object_list,
+        )
+        return self.render_to_response(context)
+
+    def paginate_queryset(self, queryset, page_size):
+        # The page is fetched asynchronously by `get`.
+        paginator, page = self.keyset_page
+        return paginator, page, page.object_list, page.has_other_pages()
+
+
+class AsyncTaskDetailView(AsyncDispatchMixin, TaskDetailView):
+    """Generic class-based view for displaying a task with an async handler."""
+
+    async def get(self, request, *args, **kwargs):
+        try:
+            self.object = await self.get_queryset().aget(pk=kwargs['pk'])
+        except Task.DoesNotExist:
+            raise Http404(_('No task found matching the query'))
+        context = self.get_context_data(object=self.object)
+        return self.render_to_response(context)
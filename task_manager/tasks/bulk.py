@@ -0,0 +1,81 @@
+"""
+Changes applied to many tasks at once.
+
+Every operation runs a fixed number of queries no matter how many tasks
+are selected, so the per-instance signals are not sent. Receivers of
+`tasks_bulk_updated` get the ids of the changed tasks instead.
+"""
+from django.core.exceptions import PermissionDenied
+from django.db import transaction
+from django.db.models.functions import Now
+from django.dispatch import Signal
+
+from .models import Task, TaskLabel
+
+SET_STATUS = 'set_status'
+SET_EXECUTOR = 'set_executor'
+ADD_LABEL = 'add_label'
+REMOVE_LABEL = 'remove_label'
+
+BATCH_SIZE = 500
+
+tasks_bulk_updated = Signal()
+
+
+def _set_status(tasks, task_ids, status):
+    return tasks.update(status=status, updated_at=Now())
+
+
+def _set_executor(tasks, task_ids, executor):
+    return tasks.update(executor=executor, updated_at=Now())
+
+
+def _add_label(tasks, task_ids, label):
+    # Concurrent adds to the same tasks wait here, so each of them reads
+    # the links written by the previous one and inserts only the missing.
+    list(tasks.select_for_update().order_by('pk').values_list('pk'))
+    labelled = set(TaskLabel.objects.filter(
+        label=label, task__in=tasks,
+    ).values_list('task_id', flat=True))
+    links = [TaskLabel(task_id=task_id, label=label)
+             for task_id in task_ids if task_id not in labelled]
+    # A label added to a task by its form is not serialized by the lock.
+    TaskLabel.objects.bulk_create(links, batch_size=BATCH_SIZE,
+                                  ignore_conflicts=True)
+    return len(links)
+
+
+def _remove_label(tasks, task_ids, label):
+    deleted, _rows = TaskLabel.objects.filter(
+        label=label, task__in=tasks,
+    ).delete()
+    return deleted
+
+
+OPERATIONS = {
+    SET_STATUS: _set_status,
+    SET_EXECUTOR: _set_executor,
+    ADD_LABEL: _add_label,
+    REMOVE_LABEL: _remove_label,
+}
+
+
+def apply(queryset, user, action, value):
+    """
+    Apply an action to the tasks of the queryset authored by the user.
+
+    Raise `PermissionDenied` without changing anything when some of the
+    tasks belong to other authors. Return the number of changed rows.
+    """
+    tasks = Task.objects.filter(pk__in=queryset.values('pk'))
+    with transaction.atomic():
+        if tasks.exclude(author=user).exists():
+            raise PermissionDenied
+        tasks = tasks.filter(author=user)
+        task_ids = list(tasks.values_list('pk', flat=True))
+        changed = OPERATIONS[action](tasks, task_ids, value)
+        if changed:
+            if action in (ADD_LABEL, REMOVE_LABEL):
+                tasks.update(updated_at=Now())
+            tasks_bulk_updated.send(sender=Task, task_ids=task_ids)
+    return changed
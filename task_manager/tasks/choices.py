@@ -0,0 +1,121 @@
+"""Cached choice lists of the task form and filter dropdowns."""
+from django import forms
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.forms.fields import CallableChoiceIterator
+from task_manager import metrics
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+
+from . import versions
+
+User = get_user_model()
+
+CHOICES_TIMEOUT = 60 * 60 * 24
+
+
+def _statuses():
+    return list(Status.objects.order_by('pk').values_list('pk', 'name'))
+
+
+def _labels():
+    return list(Label.objects.order_by('pk').values_list('pk', 'name'))
+
+
+def _users():
+    # Same as CustomUser.__str__, without creating the instances.
+    users = User.objects.order_by('pk').values_list(
+        'pk', 'first_name', 'last_name',
+    )
+    return [(pk, f'{first_name} {last_name}'.strip())
+            for pk, first_name, last_name in users]
+
+
+BUILDERS = {
+    versions.STATUSES: _statuses,
+    versions.LABELS: _labels,
+    versions.USERS: _users,
+}
+
+MODEL_CHOICES = {
+    Status: versions.STATUSES,
+    Label: versions.LABELS,
+    User: versions.USERS,
+}
+
+
+def get_choices(name):
+    """Return `(pk, label)` tuples of a table from the cache."""
+    key = f'choices:{name}:{versions.get_version(name)}'
+    choices = cache.get(key)
+    metrics.count_cache('choices', choices is not None, choices is None)
+    if choices is None:
+        choices = BUILDERS[name]()
+        cache.set(key, choices, CHOICES_TIMEOUT)
+    return choices
+
+
+class CachedChoicesMixin:
+    """
+    Render and validate a model choice field against the cached choices.
+
+    Cleaned values are unsaved instances holding only the primary key, no
+    query is made to fetch the chosen objects. When `counts` is set to a
+    mapping of primary keys to numbers, they are shown after the labels.
+    """
+
+    counts = None
+
+    def _get_cached_choices(self):
+        choices = get_choices(MODEL_CHOICES[self.queryset.model])
+        if self.counts is not None:
+            choices = [(pk, f'{label} ({self.counts.get(pk, 0)})')
+                       for pk, label in choices]
+        if self.empty_label is None:
+            return choices
+        return [('', self.empty_label), *choices]
+
+    @property
+    def choices(self):
+        return CallableChoiceIterator(self._get_cached_choices)
+
+    def to_instance(self, value):
+        valid = {str(pk) for pk, _label in
+                 get_choices(MODEL_CHOICES[self.queryset.model])}
+        if str(value) not in valid:
+            raise ValidationError(
+                self.error_messages['invalid_choice'],
+                code='invalid_choice',
+                params={'value': value},
+            )
+        instance = self.queryset.model(pk=int(value))
+        instance._state.adding = False
+        instance._state.db = self.queryset.db
+        return instance
+
+
+class CachedModelChoiceField(CachedChoicesMixin, forms.ModelChoiceField):
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        return self.to_instance(value)
+
+
+class CachedModelMultipleChoiceField(CachedChoicesMixin,
+                                     forms.ModelMultipleChoiceField):
+
+    def clean(self, value):
+        value = self.prepare_value(value)
+        if self.required and not value:
+            raise ValidationError(
+                self.error_messages['required'], code='required',
+            )
+        if not value:
+            return []
+        if not isinstance(value, (list, tuple)):
+            raise ValidationError(
+                self.error_messages['invalid_list'], code='invalid_list',
+            )
+        return [self.to_instance(pk) for pk in dict.fromkeys(value)]
@@ -0,0 +1,84 @@
+"""
+Streaming export of tasks as CSV or newline-delimited JSON.
+
+Tasks are read with `QuerySet.iterator()`, so only one chunk of rows is held
+in memory at a time. The labels of every chunk are prefetched with a single
+query.
+"""
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+CSV = 'csv'
+NDJSON = 'ndjson'
+
+CONTENT_TYPES = {
+    CSV: 'text/csv',
+    NDJSON: 'application/x-ndjson',
+}
+
+COLUMNS = (
+    'id',
+    'name',
+    'description',
+    'status',
+    'author',
+    'executor',
+    'labels',
+    'created_at',
+)
+
+CHUNK_SIZE = 2000
+
+
+class Echo:
+    """File-like object returning what is written instead of storing it."""
+
+    def write(self, value):
+        return value
+
+
+def serialize_task(task):
+    return {
+        'id': task.pk,
+        'name': task.name,
+        'description': task.description,
+        'status': task.status.name if task.status else None,
+        'author': str(task.author),
+        'executor': str(task.executor) if task.executor else None,
+        'labels': [label.name for label in task.labels.all()],
+        'created_at': task.created_at,
+    }
+
+
+def iter_tasks(queryset, chunk_size=CHUNK_SIZE):
+    queryset = queryset.with_related().with_labels()
+    queryset = queryset.order_by('created_at', 'pk')
+    for task in queryset.iterator(chunk_size=chunk_size):
+        yield serialize_task(task)
+
+
+def iter_csv(rows):
+    writer = csv.writer(Echo())
+    yield writer.writerow(COLUMNS)
+    for row in rows:
+        row['labels'] = ', '.join(row['labels'])
+        row['created_at'] = row['created_at'].isoformat()
+        yield writer.writerow(row[column] for column in COLUMNS)
+
+
+def iter_ndjson(rows):
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False) + '\n'
+
+
+WRITERS = {
+    CSV: iter_csv,
+    NDJSON: iter_ndjson,
+}
+
+
+def export_tasks(queryset, export_format, chunk_size=CHUNK_SIZE):
+    """Yield the lines of the tasks in the queryset in the given format."""
+    return WRITERS[export_format](iter_tasks(queryset, chunk_size))
@@ -0,0 +1,91 @@
+"""Per-option task counts shown in the dropdowns of the task filter."""
+import hashlib
+import json
+
+from django.core.cache import caches
+from django.db.models import Count
+from django.utils.connection import ConnectionProxy
+from task_manager import metrics
+
+from . import versions
+from .models import TaskLabel
+
+# The keys carry the version of the tasks, every process can keep its own.
+cache = ConnectionProxy(caches, 'local')
+
+FACETS_TIMEOUT = 60 * 10
+FACETS = ('status', 'executor', 'label')
+
+
+def get_active_filters(filterset):
+    """Return the cleaned non-empty filter values or None when invalid."""
+    if not filterset.is_bound:
+        return {}
+    if not filterset.is_valid():
+        return None
+    return {
+        name: value
+        for name, value in filterset.form.cleaned_data.items()
+        if value not in (None, '', False)
+    }
+
+
+def _filter_without(filterset, active, excluded):
+    queryset = filterset.queryset.order_by()
+    for name, value in active.items():
+        if name != excluded:
+            queryset = filterset.filters[name].filter(queryset, value)
+    return queryset
+
+
+def _count(filterset, active, facet):
+    """Count the tasks per option of one facet with a grouped query."""
+    queryset = _filter_without(filterset, active, facet)
+    if facet == 'label':
+        rows = TaskLabel.objects.filter(
+            task_id__in=queryset.values('pk'),
+        ).values_list('label_id').annotate(count=Count('task_id'))
+    else:
+        field_name = filterset.filters[facet].field_name
+        rows = queryset.values_list(field_name).annotate(count=Count('pk'))
+    return {pk: count for pk, count in rows.order_by() if pk is not None}
+
+
+def _cache_key(filterset, active):
+    state = {name: getattr(value, 'pk', value)
+             for name, value in active.items()}
+    if state.get('self_tasks'):
+        state['self_tasks'] = filterset.request.user.id
+    digest = hashlib.md5(
+        json.dumps(state, sort_keys=True).encode(),
+    ).hexdigest()
+    return f'facets:{versions.get_version(versions.TASKS)}:{digest}'
+
+
+def get_facet_counts(filterset):
+    """
+    Count the matching tasks for every option of the status, executor and
+    label filters, applying all other active filters.
+
+    Counts are cached per normalized filter state until a task changes.
+    """
+    active = get_active_filters(filterset)
+    if active is None:
+        return None
+    key = _cache_key(filterset, active)
+    counts = cache.get(key)
+    metrics.count_cache('facets', counts is not None, counts is None)
+    if counts is None:
+        counts = {facet: _count(filterset, active, facet)
+                  for facet in FACETS}
+        cache.set(key, counts, FACETS_TIMEOUT)
+    return counts
+
+
+def add_facet_counts(filterset):
+    """Show the counts next to the options of the filter form."""
+    counts = get_facet_counts(filterset)
+    if counts is None:
+        return
+    for facet in FACETS:
+        filterset.form.fields[facet].counts = counts[facet]
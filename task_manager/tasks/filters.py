@@ -1,13 +1,32 @@
 import django_filters
+from django.contrib.auth import get_user_model
 from django.forms import CheckboxInput
 from django.utils.translation import gettext as _
 from task_manager.labels.models import Label
-from task_manager.tasks.models import Task
+from task_manager.statuses.models import Status
+from task_manager.tasks.choices import CachedModelChoiceField
+from task_manager.tasks.models import Task, TaskListEntry
+from task_manager.tasks.read_model import label_ids_token
+from task_manager.tasks.search import get_words, search_tasks
+
+User = get_user_model()
+
+
+class CachedModelChoiceFilter(django_filters.ModelChoiceFilter):
+    field_class = CachedModelChoiceField
 
 
 class TaskFilter(django_filters.FilterSet):
 
-    label = django_filters.ModelChoiceFilter(
+    status = CachedModelChoiceFilter(
+        label=_("Status"),
+        queryset=Status.objects.all(),
+    )
+    executor = CachedModelChoiceFilter(
+        label=_("Executor"),
+        queryset=User.objects.all(),
+    )
+    label = CachedModelChoiceFilter(
         field_name="labels",
         label=_("Label"),
         queryset=Label.objects.all(),
@@ -17,12 +36,62 @@ class TaskFilter(django_filters.FilterSet):
         label=_("My tasks only"),
         widget=CheckboxInput,
     )
+    q = django_filters.CharFilter(
+        method="search",
+        label=_("Search"),
+    )
 
     def get_self_tasks(self, queryset, field_name, value):
         if value:
             return queryset.filter(author=self.request.user)
         return queryset
 
+    def search(self, queryset, field_name, value):
+        return search_tasks(queryset, value)
+
+    def is_ranked(self):
+        """Whether the result is annotated with `search_rank`."""
+        if not self.is_valid():
+            return False
+        return bool(get_words(self.form.cleaned_data.get('q')))
+
     class Meta:
         model = Task
         fields = ['status', 'executor']
+
+
+class TaskListEntryFilter(TaskFilter):
+    """Same filters as TaskFilter, applied to the flat task list rows."""
+
+    status = CachedModelChoiceFilter(
+        method="filter_by_pk",
+        field_name="status_id",
+        label=_("Status"),
+        queryset=Status.objects.all(),
+    )
+    executor = CachedModelChoiceFilter(
+        method="filter_by_pk",
+        field_name="executor_id",
+        label=_("Executor"),
+        queryset=User.objects.all(),
+    )
+    label = CachedModelChoiceFilter(
+        method="get_label",
+        label=_("Label"),
+        queryset=Label.objects.all(),
+    )
+
+    def filter_by_pk(self, queryset, field_name, value):
+        return queryset.filter(**{field_name: value.pk})
+
+    def get_label(self, queryset, field_name, value):
+        return queryset.filter(label_ids__contains=label_ids_token(value.pk))
+
+    def get_self_tasks(self, queryset, field_name, value):
+        if value:
+            return queryset.filter(author_id=self.request.user.id)
+        return queryset
+
+    class Meta:
+        model = TaskListEntry
+        fields = ['status', 'executor', 'label', 'self_tasks', 'q']
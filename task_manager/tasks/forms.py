@@ -0,0 +1,119 @@
+from django import forms
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.utils.translation import gettext as _
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+
+from . import bulk
+from .choices import CachedModelChoiceField, CachedModelMultipleChoiceField
+from .models import Task
+
+User = get_user_model()
+
+
+class TaskForm(forms.ModelForm):
+    """Task form with dropdowns built from the cached choice lists."""
+
+    labels = CachedModelMultipleChoiceField(
+        label=_('Labels'),
+        queryset=Label.objects.all(),
+        required=False,
+    )
+
+    class Meta:
+        model = Task
+        fields = ('name', 'description', 'status', 'executor')
+        field_classes = {
+            'status': CachedModelChoiceField,
+            'executor': CachedModelChoiceField,
+        }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.instance.pk and not self.is_bound:
+            self.initial.setdefault('labels', list(
+                self.instance.labels.values_list('pk', flat=True)
+            ))
+
+    def _save_m2m(self):
+        super()._save_m2m()
+        # The links are read again while saving, the ones shown in the
+        # form may have been changed since.
+        self.instance.set_labels(self.cleaned_data['labels'])
+
+
+class TaskIdsField(forms.Field):
+    """List of task ids submitted by the checkboxes of the task list."""
+
+    widget = forms.MultipleHiddenInput
+    default_error_messages = {
+        'invalid': _('Invalid task selection'),
+    }
+
+    def to_python(self, value):
+        if not value:
+            return []
+        try:
+            return sorted({int(pk) for pk in value})
+        except (TypeError, ValueError):
+            raise ValidationError(self.error_messages['invalid'],
+                                  code='invalid')
+
+
+class TaskBulkForm(forms.Form):
+    """Action applied to the selected tasks or to all filtered tasks."""
+
+    ACTIONS = (
+        (bulk.SET_STATUS, _('Set status')),
+        (bulk.SET_EXECUTOR, _('Set executor')),
+        (bulk.ADD_LABEL, _('Add label')),
+        (bulk.REMOVE_LABEL, _('Remove label')),
+    )
+    VALUE_FIELDS = {
+        bulk.SET_STATUS: 'status',
+        bulk.SET_EXECUTOR: 'executor',
+        bulk.ADD_LABEL: 'label',
+        bulk.REMOVE_LABEL: 'label',
+    }
+    # An empty executor unassigns the tasks, other values are required.
+    OPTIONAL_VALUES = {bulk.SET_EXECUTOR}
+
+    action = forms.ChoiceField(label=_('Action'), choices=ACTIONS)
+    status = CachedModelChoiceField(
+        label=_('Status'),
+        queryset=Status.objects.all(),
+        required=False,
+    )
+    executor = CachedModelChoiceField(
+        label=_('Executor'),
+        queryset=User.objects.all(),
+        required=False,
+    )
+    label = CachedModelChoiceField(
+        label=_('Label'),
+        queryset=Label.objects.all(),
+        required=False,
+    )
+    ids = TaskIdsField(required=False)
+    select_all = forms.BooleanField(
+        label=_('All filtered tasks'),
+        required=False,
+    )
+
+    def clean(self):
+        cleaned_data = super().clean()
+        action = cleaned_data.get('action')
+        if action is None:
+            return cleaned_data
+
+        field = self.VALUE_FIELDS[action]
+        cleaned_data['value'] = cleaned_data.get(field)
+        if cleaned_data['value'] is None and \
+                action not in self.OPTIONAL_VALUES:
+            self.add_error(field, _('This field is required.'))
+
+        if not cleaned_data.get('ids') and \
+                not cleaned_data.get('select_all'):
+            raise ValidationError(_('Select at least one task'))
+        return cleaned_data
@@ -0,0 +1,270 @@
+"""
+Live updates of the task list as server-sent events.
+
+Committed task changes are published to an in-process `Hub`. Every open
+`/tasks/events/` connection subscribes to it with the filters of its task
+list and receives the changes matching them:
+
+- `created` and `updated` carry the row of a task matching the filters,
+- `removed` carries the id of a task deleted or no longer matching them,
+- `reload` asks to reload the page when a change was too large to send.
+
+Only changes made in the same process are published, so the events have to
+be served by the process handling the writes (a single ASGI worker).
+Django 4.1 cannot stream a response asynchronously, so the connections are
+handled by the plain ASGI application `events_app`, which `asgi.py` routes
+`EVENTS_PATH` to.
+"""
+import asyncio
+import json
+import threading
+from importlib import import_module
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib import auth
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+from .filters import TaskFilter
+from .models import Task
+from .search import get_words
+
+EVENTS_PATH = '/tasks/events/'
+HEARTBEAT_INTERVAL = 15
+QUEUE_SIZE = 100
+# Larger changes are announced with a single `reload` event.
+MAX_DELTAS = 500
+
+CREATED = 'created'
+UPDATED = 'updated'
+REMOVED = 'removed'
+RELOAD = 'reload'
+
+
+class Subscription:
+    """Queue of events matching the task list filters of one connection."""
+
+    def __init__(self, loop, filters, user_id):
+        self.loop = loop
+        self.filters = filters
+        self.user_id = user_id
+        self.queue = asyncio.Queue(QUEUE_SIZE)
+
+    def matches(self, task):
+        filters = self.filters
+        if filters.get('status') and task['status_id'] != filters['status']:
+            return False
+        if filters.get('executor') and \
+                task['executor_id'] != filters['executor']:
+            return False
+        if filters.get('label') and filters['label'] not in task['label_ids']:
+            return False
+        if filters.get('self_tasks') and task['author_id'] != self.user_id:
+            return False
+        words = [word.lower() for word in get_words(filters.get('q'))]
+        if words:
+            text = {word.lower() for word in get_words(
+                f'{task["name"]} {task["description"]}'
+            )}
+            return all(any(candidate.startswith(word) for candidate in text)
+                       for word in words)
+        return True
+
+    def to_message(self, event):
+        kind, task_id, task = event
+        if kind in (CREATED, UPDATED) and not self.matches(task):
+            if kind == CREATED:
+                return None
+            kind = REMOVED
+        if kind == RELOAD:
+            return kind, {}
+        if kind == REMOVED:
+            return kind, {'id': task_id}
+        return kind, {key: task[key] for key in PUBLIC_FIELDS}
+
+    def deliver(self, event):
+        """Queue an event, runs in the event loop of the connection."""
+        message = self.to_message(event)
+        if message is None:
+            return
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # A slow client misses events, it has to reload the page.
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait((RELOAD, {}))
+
+
+class Hub:
+    """Thread-safe fan-out of task events to the open subscriptions."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions = set()
+
+    def __bool__(self):
+        return bool(self._subscriptions)
+
+    def subscribe(self, subscription):
+        with self._lock:
+            self._subscriptions.add(subscription)
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def publish(self, events):
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            for event in events:
+                try:
+                    subscription.loop.call_soon_threadsafe(
+                        subscription.deliver, event,
+                    )
+                except RuntimeError:
+                    # The event loop of the connection is closed.
+                    self.unsubscribe(subscription)
+                    break
+
+
+hub = Hub()
+
+PUBLIC_FIELDS = ('id', 'name', 'status', 'author', 'executor', 'created_at')
+
+
+def serialize_task(task):
+    return {
+        'id': task.pk,
+        'name': task.name,
+        'description': task.description,
+        'status': str(task.status or ''),
+        'status_id': task.status_id,
+        'author': str(task.author),
+        'author_id': task.author_id,
+        'executor': str(task.executor or ''),
+        'executor_id': task.executor_id,
+        'label_ids': [label.pk for label in task.labels.all()],
+        'created_at': task.created_at,
+    }
+
+
+def _publish_changed(task_ids, kind):
+    if len(task_ids) > MAX_DELTAS:
+        hub.publish([(RELOAD, None, None)])
+        return
+    tasks = Task.objects.filter(pk__in=task_ids).with_related().with_labels()
+    hub.publish([(kind, task.pk, serialize_task(task)) for task in tasks])
+
+
+def publish_changed(task_ids, created=False):
+    """Publish created or updated tasks once the transaction commits."""
+    if hub:
+        kind = CREATED if created else UPDATED
+        task_ids = list(task_ids)
+        transaction.on_commit(lambda: _publish_changed(task_ids, kind))
+
+
+def publish_deleted(task_id):
+    if hub:
+        transaction.on_commit(
+            lambda: hub.publish([(REMOVED, task_id, None)])
+        )
+
+
+def encode(kind, data):
+    payload = json.dumps(data, cls=DjangoJSONEncoder)
+    return f'event: {kind}\ndata: {payload}\n\n'.encode()
+
+
+def authenticate(request):
+    """Load the session, the user and the filters of a request."""
+    engine = import_module(settings.SESSION_ENGINE)
+    request.session = engine.SessionStore(
+        request.COOKIES.get(settings.SESSION_COOKIE_NAME),
+    )
+    request.user = auth.get_user(request)
+    if not request.user.is_authenticated:
+        return None, None
+    filterset = TaskFilter(request.GET, request=request)
+    if not filterset.is_valid():
+        return request.user, None
+    filters = {
+        name: getattr(value, 'pk', value)
+        for name, value in filterset.form.cleaned_data.items()
+        if value not in (None, '', False)
+    }
+    return request.user, filters
+
+
+async def _disconnected(receive):
+    while (await receive())['type'] != 'http.disconnect':
+        pass
+
+
+async def _respond(send, status, body=b''):
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [(b'content-type', b'text/plain; charset=utf-8')],
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def _stream(subscription, send, disconnected):
+    """Send queued events and heartbeats until the client disconnects."""
+    message = None
+    try:
+        while True:
+            if message is None:
+                message = asyncio.ensure_future(subscription.queue.get())
+            done, _pending = await asyncio.wait(
+                {message, disconnected},
+                timeout=HEARTBEAT_INTERVAL,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if disconnected in done:
+                return
+            if message in done:
+                body = encode(*message.result())
+                message = None
+            else:
+                body = b': heartbeat\n\n'
+            await send({'type': 'http.response.body', 'body': body,
+                        'more_body': True})
+    finally:
+        if message is not None:
+            message.cancel()
+
+
+async def events_app(scope, receive, send):
+    """ASGI application streaming the events of one task list."""
+    request = ASGIRequest(scope, None)
+    user, filters = await sync_to_async(authenticate)(request)
+    if user is None:
+        return await _respond(send, 401, b'Authentication required')
+    if filters is None:
+        return await _respond(send, 400, b'Invalid filters')
+
+    subscription = Subscription(asyncio.get_running_loop(), filters, user.pk)
+    hub.subscribe(subscription)
+    disconnected = asyncio.ensure_future(_disconnected(receive))
+    try:
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [
+                (b'content-type', b'text/event-stream'),
+                (b'cache-control', b'no-cache'),
+                (b'x-accel-buffering', b'no'),
+            ],
+        })
+        await send({'type': 'http.response.body', 'body': b'retry: 5000\n\n',
+                    'more_body': True})
+        await _stream(subscription, send, disconnected)
+    finally:
+        hub.unsubscribe(subscription)
+        disconnected.cancel()
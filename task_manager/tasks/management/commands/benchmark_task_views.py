@@ -0,0 +1,166 @@
+import asyncio
+import statistics
+import time
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.handlers.asgi import ASGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client, override_settings
+from django.urls import path, reverse
+from task_manager import urls
+from task_manager.tasks.async_views import (
+    AsyncTaskDetailView,
+    AsyncTaskListView,
+)
+from task_manager.tasks.models import Task
+from task_manager.tasks.views import TaskDetailView, TaskListView
+
+VIEWS = {
+    'list': (TaskListView, AsyncTaskListView),
+    'detail': (TaskDetailView, AsyncTaskDetailView),
+}
+
+
+class URLConf:
+    """URLs of the project with the task list and detail served by views."""
+
+    def __init__(self, list_view, detail_view):
+        self.urlpatterns = [
+            path('tasks/', list_view.as_view(), name='task_list'),
+            path('tasks/<int:pk>/', detail_view.as_view(),
+                 name='task_detail'),
+            *urls.urlpatterns,
+        ]
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare the sync and async task list and detail views by serving '
+        'concurrent requests through the ASGI handler and all middleware.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=200,
+            help='Number of requests sent to every view.',
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=10,
+            help='Number of requests in flight at the same time.',
+        )
+        parser.add_argument(
+            '--username',
+            help='User the requests are made by, the first user by default.',
+        )
+        parser.add_argument(
+            '--query',
+            default='',
+            help='Query string of the task list requests.',
+        )
+
+    def handle(self, *args, **options):
+        if options['requests'] < 2 or options['concurrency'] < 1:
+            raise CommandError('Send at least 2 requests, 1 at a time.')
+        user = self.get_user(options['username'])
+        task = Task.objects.order_by('pk').first()
+        if task is None:
+            raise CommandError('There are no tasks to request.')
+
+        client = Client()
+        client.force_login(user)
+        cookie = client.cookies[settings.SESSION_COOKIE_NAME].value
+        targets = {
+            'list': (reverse('task_list'), options['query']),
+            'detail': (reverse('task_detail', args=[task.pk]), ''),
+        }
+        try:
+            for page, (sync_view, async_view) in VIEWS.items():
+                for view in (sync_view, async_view):
+                    urlconf = URLConf(*(
+                        view if name == page else VIEWS[name][0]
+                        for name in VIEWS
+                    ))
+                    with override_settings(ROOT_URLCONF=urlconf):
+                        latencies, elapsed = async_to_sync(self.run)(
+                            targets[page], cookie, options,
+                        )
+                    self.report(view.__name__, latencies, elapsed)
+        finally:
+            client.logout()
+
+    def get_user(self, username):
+        users = get_user_model().objects.order_by('pk')
+        user = users.filter(username=username).first() if username \
+            else users.first()
+        if user is None:
+            raise CommandError('There is no user to make the requests.')
+        return user
+
+    def build_scope(self, target, cookie):
+        path, query = target
+        return {
+            'type': 'http',
+            'asgi': {'version': '3.0'},
+            'http_version': '1.1',
+            'method': 'GET',
+            'scheme': 'http',
+            'path': path,
+            'query_string': query.encode(),
+            'headers': [
+                (b'host', b'localhost'),
+                (b'cookie',
+                 f'{settings.SESSION_COOKIE_NAME}={cookie}'.encode()),
+            ],
+            'client': ('127.0.0.1', 0),
+            'server': ('localhost', 80),
+        }
+
+    async def fetch(self, handler, scope):
+        messages = [{'type': 'http.request', 'body': b''}]
+        status = None
+
+        async def receive():
+            if messages:
+                return messages.pop()
+            # The client stays connected until the response is sent.
+            await asyncio.Event().wait()
+
+        async def send(message):
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+
+        start = time.perf_counter()
+        await handler(scope, receive, send)
+        if status != 200:
+            raise CommandError(f'{scope["path"]} answered {status}.')
+        return time.perf_counter() - start
+
+    async def run(self, target, cookie, options):
+        handler = ASGIHandler()
+        scope = self.build_scope(target, cookie)
+        semaphore = asyncio.Semaphore(options['concurrency'])
+
+        async def limited():
+            async with semaphore:
+                return await self.fetch(handler, scope)
+
+        start = time.perf_counter()
+        latencies = await asyncio.gather(
+            *(limited() for _ in range(options['requests']))
+        )
+        return latencies, time.perf_counter() - start
+
+    def report(self, name, latencies, elapsed):
+        percentiles = statistics.quantiles(latencies, n=100)
+        self.stdout.write(
+            f'{name:22} {len(latencies) / elapsed:8.1f} req/s  '
+            f'p50 {percentiles[49] * 1000:7.2f} ms  '
+            f'p95 {percentiles[94] * 1000:7.2f} ms'
+        )
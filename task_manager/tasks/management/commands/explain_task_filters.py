@@ -0,0 +1,123 @@
+import re
+from itertools import combinations
+from types import SimpleNamespace
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from task_manager.tasks.filters import TaskFilter, TaskListEntryFilter
+from task_manager.tasks.models import Task, TaskLabel, TaskListEntry
+from task_manager.tasks.search import get_words
+
+FILTERS = ('status', 'executor', 'label', 'self_tasks', 'q')
+
+FULL_SCAN_PATTERNS = {
+    # `SCAN table` without an index; `SCAN table USING INDEX` walks an
+    # index in order and stops at the page limit.
+    'sqlite': re.compile(r'\bSCAN (\w+)\b(?! USING| VIRTUAL TABLE)'),
+    'postgresql': re.compile(r'\bSeq Scan on (\w+)'),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Run EXPLAIN for every combination of the task list filters and '
+        'report the queries reading a whole table.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--read-model',
+            action='store_true',
+            help='Check the denormalized task list instead of the tasks.',
+        )
+        parser.add_argument(
+            '--page-size',
+            type=int,
+            default=50,
+            help='Number of rows fetched per page of the task list.',
+        )
+        parser.add_argument(
+            '--fail-on-scan',
+            action='store_true',
+            help='Exit with an error when a full scan is found.',
+        )
+
+    def handle(self, *args, **options):
+        pattern = FULL_SCAN_PATTERNS.get(connection.vendor)
+        if pattern is None:
+            raise CommandError(f'{connection.vendor} is not supported.')
+
+        samples = self.get_samples()
+        if samples is None:
+            raise CommandError('There are no tasks to replay the filters.')
+
+        scans = 0
+        for data in self.get_combinations(samples):
+            plan = self.explain(data, options)
+            scans += self.report(data, plan, pattern)
+            if options['verbosity'] > 1:
+                self.stdout.write(plan)
+
+        if scans and options['fail_on_scan']:
+            raise CommandError(f'{scans} filter combinations scan a table.')
+
+    def report(self, data, plan, pattern):
+        """Write one line about a plan and return whether it scans a table."""
+        tables = sorted(set(pattern.findall(plan)))
+        name = ', '.join(data) or 'no filters'
+        if not tables:
+            self.stdout.write(f'{name}: ok')
+            return False
+        self.stdout.write(self.style.WARNING(
+            f'{name}: full scan of {", ".join(tables)}'
+        ))
+        return True
+
+    def get_samples(self):
+        """Pick existing values for every filter from the first task."""
+        task = Task.objects.exclude(executor=None).exclude(status=None) \
+            .order_by('pk').first()
+        if task is None:
+            return None
+        link = TaskLabel.objects.order_by('pk').first()
+        words = get_words(task.name)
+        return {
+            'status': task.status_id,
+            'executor': task.executor_id,
+            'label': link.label_id if link else None,
+            'self_tasks': 'on',
+            'q': words[0] if words else None,
+            'user': get_user_model().objects.get(pk=task.author_id),
+        }
+
+    def get_combinations(self, samples):
+        names = [name for name in FILTERS if samples[name] is not None]
+        for size in range(len(names) + 1):
+            for combination in combinations(names, size):
+                yield {name: samples[name] for name in combination} | {
+                    '_user': samples['user'],
+                }
+
+    def explain(self, data, options):
+        user = data.pop('_user')
+        if options['read_model']:
+            filterset_class = TaskListEntryFilter
+            queryset = TaskListEntry.objects.all()
+        else:
+            filterset_class = TaskFilter
+            queryset = Task.objects.with_related()
+
+        filterset = filterset_class(
+            data or None,
+            queryset=queryset,
+            request=SimpleNamespace(user=user),
+        )
+        if filterset.is_bound and not filterset.is_valid():
+            raise CommandError(f'Invalid filters {data}: {filterset.errors}')
+
+        ordering = ('created_at', 'pk')
+        if filterset.is_ranked():
+            ordering = ('-search_rank', 'pk')
+        page = filterset.qs.order_by(*ordering)[:options['page_size'] + 1]
+        return page.explain()
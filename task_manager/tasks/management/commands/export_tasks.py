@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand, CommandError
+from task_manager.tasks import export
+from task_manager.tasks.filters import TaskFilter
+from task_manager.tasks.models import Task
+
+
+class Command(BaseCommand):
+    help = 'Stream the tasks matching the task list filters as CSV or NDJSON.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--format',
+            choices=sorted(export.WRITERS),
+            default=export.CSV,
+            help='Output format.',
+        )
+        parser.add_argument(
+            '--output',
+            help='Write to this file instead of the standard output.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=export.CHUNK_SIZE,
+            help='Number of tasks fetched from the database at once.',
+        )
+        parser.add_argument('--status', help='Status id.')
+        parser.add_argument('--executor', help='Executor id.')
+        parser.add_argument('--label', help='Label id.')
+        parser.add_argument('--q', help='Words to search for.')
+
+    def handle(self, *args, **options):
+        data = {
+            name: options[name]
+            for name in ('status', 'executor', 'label', 'q')
+            if options[name]
+        }
+        filterset = TaskFilter(data or None, queryset=Task.objects.all())
+        if filterset.is_bound and not filterset.is_valid():
+            raise CommandError(filterset.errors.as_text())
+
+        lines = export.export_tasks(
+            filterset.qs, options['format'], options['chunk_size'],
+        )
+        if options['output'] is None:
+            for line in lines:
+                self.stdout.write(line, ending='')
+            return
+
+        with open(options['output'], 'w', encoding='utf-8',
+                  newline='') as output:
+            output.writelines(lines)
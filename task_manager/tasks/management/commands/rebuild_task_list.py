@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from task_manager.tasks import read_model
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the denormalized task list from scratch.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of tasks loaded and inserted at once.',
+        )
+
+    def handle(self, *args, **options):
+        count = read_model.rebuild(batch_size=options['batch_size'])
+        self.stdout.write(
+            self.style.SUCCESS(f'Rebuilt {count} task list entries.')
+        )
@@ -0,0 +1,30 @@
+# Generated by Django 4.1.7 on 2026-10-18 01:37
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0002_tasklabel_task_labels'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskListEntry',
+            fields=[
+                ('task', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='list_entry', serialize=False, to='tasks.task')),
+                ('name', models.CharField(max_length=100)),
+                ('status_id', models.BigIntegerField(db_index=True, null=True)),
+                ('status_name', models.CharField(blank=True, max_length=100)),
+                ('author_id', models.BigIntegerField(db_index=True)),
+                ('author_name', models.CharField(max_length=301)),
+                ('executor_id', models.BigIntegerField(db_index=True, null=True)),
+                ('executor_name', models.CharField(blank=True, max_length=301)),
+                ('label_ids', models.TextField(blank=True)),
+                ('label_names', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField()),
+            ],
+        ),
+    ]
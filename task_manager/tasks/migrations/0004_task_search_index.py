@@ -0,0 +1,51 @@
+from django.db import migrations
+
+SQLITE_FORWARD = (
+    "CREATE VIRTUAL TABLE tasks_task_fts USING fts5("
+    "name, description, tokenize='unicode61 remove_diacritics 2')",
+    "INSERT INTO tasks_task_fts(rowid, name, description) "
+    "SELECT id, name, description FROM tasks_task",
+)
+SQLITE_BACKWARD = (
+    "DROP TABLE IF EXISTS tasks_task_fts",
+)
+POSTGRESQL_FORWARD = (
+    "ALTER TABLE tasks_task ADD COLUMN search_vector tsvector "
+    "GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+    ") STORED",
+    "CREATE INDEX tasks_task_search_vector_idx "
+    "ON tasks_task USING gin (search_vector)",
+)
+POSTGRESQL_BACKWARD = (
+    "DROP INDEX IF EXISTS tasks_task_search_vector_idx",
+    "ALTER TABLE tasks_task DROP COLUMN IF EXISTS search_vector",
+)
+
+
+def run(statements):
+    def operation(apps, schema_editor):
+        for statement in statements.get(schema_editor.connection.vendor, ()):
+            schema_editor.execute(statement)
+    return operation
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0003_tasklistentry'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run({
+                'sqlite': SQLITE_FORWARD,
+                'postgresql': POSTGRESQL_FORWARD,
+            }),
+            run({
+                'sqlite': SQLITE_BACKWARD,
+                'postgresql': POSTGRESQL_BACKWARD,
+            }),
+        ),
+    ]
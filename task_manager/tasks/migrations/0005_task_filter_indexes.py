@@ -0,0 +1,41 @@
+# Generated by Django 4.1.7 on 2026-10-18 01:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0004_task_search_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['created_at', 'id'], name='task_created_at_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['status', 'executor'], name='task_status_executor_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['author', 'created_at', 'id'], name='task_author_created_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tasklabel',
+            index=models.Index(fields=['label', 'task'], name='tasklabel_label_task_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tasklistentry',
+            index=models.Index(fields=['created_at', 'task'], name='entry_created_at_task_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tasklistentry',
+            index=models.Index(fields=['status_id', 'executor_id'], name='entry_status_executor_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tasklistentry',
+            index=models.Index(fields=['author_id', 'created_at', 'task'], name='entry_author_created_at_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.1.7 on 2026-10-18 01:49
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def set_updated_at(apps, schema_editor):
+    Task = apps.get_model('tasks', 'Task')
+    Task.objects.update(updated_at=F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0005_task_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='updated at'),
+        ),
+        migrations.RunPython(set_updated_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.1.7 on 2026-10-18 01:59
+
+from django.db import migrations, models
+from django.db.models import Min
+
+
+def remove_duplicate_links(apps, schema_editor):
+    TaskLabel = apps.get_model('tasks', 'TaskLabel')
+    first_ids = TaskLabel.objects.values('task', 'label') \
+        .annotate(first_id=Min('id')).values('first_id')
+    TaskLabel.objects.exclude(id__in=first_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0006_task_updated_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_links, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='tasklabel',
+            constraint=models.UniqueConstraint(fields=('task', 'label'), name='tasklabel_task_label_unique'),
+        ),
+    ]
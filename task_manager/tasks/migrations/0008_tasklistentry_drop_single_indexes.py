@@ -0,0 +1,23 @@
+# Generated by Django 4.1.7 on 2026-10-18 02:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0007_tasklabel_unique'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='tasklistentry',
+            name='author_id',
+            field=models.BigIntegerField(),
+        ),
+        migrations.AlterField(
+            model_name='tasklistentry',
+            name='status_id',
+            field=models.BigIntegerField(null=True),
+        ),
+    ]
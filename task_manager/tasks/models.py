@@ -1,5 +1,6 @@
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.db import models, transaction
+from django.db.models.signals import m2m_changed
 from django.utils.translation import gettext as _
 from task_manager.labels.models import Label
 from task_manager.statuses.models import Status
@@ -7,6 +8,19 @@ from task_manager.statuses.models import Status
 User = get_user_model()
 
 MAX_LENGTH = 100
+NAME_LENGTH = 301
+
+
+class TaskQuerySet(models.QuerySet):
+    """Query plans shared by the views rendering tasks."""
+
+    def with_related(self):
+        """Join the status, author and executor in the same query."""
+        return self.select_related('status', 'author', 'executor')
+
+    def with_labels(self):
+        """Load the labels of all fetched tasks in one extra query."""
+        return self.prefetch_related('labels')
 
 
 class Task(models.Model):
@@ -45,6 +59,10 @@ class Task(models.Model):
         verbose_name=_('created at'),
         auto_now_add=True,
     )
+    updated_at = models.DateTimeField(
+        verbose_name=_('updated at'),
+        auto_now=True,
+    )
     labels = models.ManyToManyField(
         Label,
         verbose_name=_('labels'),
@@ -53,13 +71,69 @@ class Task(models.Model):
         through_fields=('task', 'label'),
     )
 
+    objects = TaskQuerySet.as_manager()
+
     class Meta:
         verbose_name = _('task')
         verbose_name_plural = _('tasks')
+        indexes = [
+            models.Index(
+                fields=['created_at', 'id'],
+                name='task_created_at_id_idx',
+            ),
+            models.Index(
+                fields=['status', 'executor'],
+                name='task_status_executor_idx',
+            ),
+            models.Index(
+                fields=['author', 'created_at', 'id'],
+                name='task_author_created_at_idx',
+            ),
+        ]
 
     def __str__(self):
         return self.name
 
+    def set_labels(self, labels, current_ids=None):
+        """
+        Link the task to the labels, writing only the links that changed.
+
+        `current_ids` are the ids of the labels linked now, when the caller
+        has already loaded them in its transaction. Otherwise they are read
+        here, locking the links until the changes are written, so that two
+        concurrent edits are not diffed against the same stale links.
+        Unlike `labels.set()`, the removed and the added links are written
+        with one query each, the existing links are not read again before
+        the insert.
+        """
+        with transaction.atomic(savepoint=False):
+            if current_ids is None:
+                current_ids = TaskLabel.objects.select_for_update() \
+                    .filter(task=self).values_list('label_id', flat=True)
+            current_ids = set(current_ids)
+            label_ids = {getattr(label, 'pk', label) for label in labels}
+            removed = current_ids - label_ids
+            added = label_ids - current_ids
+            if removed:
+                self._send_labels_changed('pre_remove', removed)
+                TaskLabel.objects.filter(task=self, label_id__in=removed) \
+                    .delete()
+                self._send_labels_changed('post_remove', removed)
+            if added:
+                self._send_labels_changed('pre_add', added)
+                TaskLabel.objects.bulk_create(
+                    [TaskLabel(task=self, label_id=pk)
+                     for pk in sorted(added)],
+                    ignore_conflicts=True,
+                )
+                self._send_labels_changed('post_add', added)
+
+    def _send_labels_changed(self, action, pk_set):
+        m2m_changed.send(
+            sender=TaskLabel, instance=self, action=action, reverse=False,
+            model=Label, pk_set=pk_set, using=self._state.db,
+        )
+
 
 class TaskLabel(models.Model):
     """Model representing intermediary table linking tasks to labels."""
@@ -72,3 +146,81 @@ class TaskLabel(models.Model):
         Label,
         on_delete=models.PROTECT,
     )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['task', 'label'],
+                name='tasklabel_task_label_unique',
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['label', 'task'],
+                name='tasklabel_label_task_idx',
+            ),
+        ]
+
+
+class TaskListEntry(models.Model):
+    """
+    Model representing a flat, denormalized row of the task list.
+
+    The row is kept up to date by the signal handlers of the tasks app, so
+    the task list can be rendered and filtered without any joins.
+    Label ids are stored as `,1,2,` to be matched with a substring lookup.
+    """
+
+    task = models.OneToOneField(
+        Task,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='list_entry',
+    )
+    name = models.CharField(max_length=MAX_LENGTH)
+    # Looked up through the composite indexes they lead.
+    status_id = models.BigIntegerField(null=True)
+    status_name = models.CharField(max_length=MAX_LENGTH, blank=True)
+    author_id = models.BigIntegerField()
+    author_name = models.CharField(max_length=NAME_LENGTH)
+    executor_id = models.BigIntegerField(null=True, db_index=True)
+    executor_name = models.CharField(max_length=NAME_LENGTH, blank=True)
+    label_ids = models.TextField(blank=True)
+    label_names = models.TextField(blank=True)
+    created_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['created_at', 'task'],
+                name='entry_created_at_task_idx',
+            ),
+            models.Index(
+                fields=['status_id', 'executor_id'],
+                name='entry_status_executor_idx',
+            ),
+            models.Index(
+                fields=['author_id', 'created_at', 'task'],
+                name='entry_author_created_at_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return self.name
+
+    # Same attributes as Task, so templates can render either of them.
+    @property
+    def id(self):
+        return self.task_id
+
+    @property
+    def status(self):
+        return self.status_name
+
+    @property
+    def author(self):
+        return self.author_name
+
+    @property
+    def executor(self):
+        return self.executor_name if self.executor_id else None
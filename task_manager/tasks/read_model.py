@@ -0,0 +1,90 @@
+from django.db import transaction
+
+from .models import Task, TaskListEntry
+
+ENTRY_FIELDS = (
+    'name',
+    'status_id',
+    'status_name',
+    'author_id',
+    'author_name',
+    'executor_id',
+    'executor_name',
+    'label_ids',
+    'label_names',
+    'created_at',
+)
+
+
+def label_ids_token(value):
+    """Wrap label ids in commas the way they are stored in `label_ids`."""
+    return f',{value},'
+
+
+def build_entry(task):
+    """Build an unsaved entry from a task with loaded relations."""
+    labels = sorted(task.labels.all(), key=lambda label: label.pk)
+    return TaskListEntry(
+        task_id=task.pk,
+        name=task.name,
+        status_id=task.status_id,
+        status_name=task.status.name if task.status else '',
+        author_id=task.author_id,
+        author_name=str(task.author),
+        executor_id=task.executor_id,
+        executor_name=str(task.executor) if task.executor else '',
+        label_ids=label_ids_token(
+            ','.join(str(label.pk) for label in labels)
+        ) if labels else '',
+        label_names=', '.join(label.name for label in labels),
+        created_at=task.created_at,
+    )
+
+
+def refresh_entries(task_ids):
+    """Insert or update the entries of the given tasks."""
+    tasks = Task.objects.filter(pk__in=task_ids).with_related().with_labels()
+    TaskListEntry.objects.bulk_create(
+        [build_entry(task) for task in tasks],
+        update_conflicts=True,
+        unique_fields=['task'],
+        update_fields=ENTRY_FIELDS,
+    )
+
+
+def refresh_label(label):
+    """Refresh the entries of all tasks marked with the label."""
+    entries = TaskListEntry.objects.filter(
+        label_ids__contains=label_ids_token(label.pk),
+    )
+    refresh_entries(list(entries.values_list('task_id', flat=True)))
+
+
+def rename_status(status):
+    TaskListEntry.objects.filter(status_id=status.pk).update(
+        status_name=status.name,
+    )
+
+
+def rename_user(user):
+    name = str(user)
+    TaskListEntry.objects.filter(author_id=user.pk).update(author_name=name)
+    TaskListEntry.objects.filter(executor_id=user.pk).update(
+        executor_name=name,
+    )
+
+
+def rebuild(batch_size=1000):
+    """Recreate all entries from scratch and return their number."""
+    tasks = Task.objects.order_by('pk').with_related().with_labels()
+    count = 0
+    batch = []
+    with transaction.atomic():
+        TaskListEntry.objects.all().delete()
+        for task in tasks.iterator(chunk_size=batch_size):
+            batch.append(build_entry(task))
+            if len(batch) == batch_size:
+                count += len(TaskListEntry.objects.bulk_create(batch))
+                batch = []
+        count += len(TaskListEntry.objects.bulk_create(batch))
+    return count
@@ -0,0 +1,63 @@
+"""
+Cached rows of the task table.
+
+A row is cached under a digest of everything it displays, so any change of
+the task or a rename of its status, author or executor produces a new key
+and stale rows are never served. The key also carries a digest of the row
+template, so a deploy changing the markup does not serve the old rows. They
+expire after `ROWS_TIMEOUT`.
+"""
+import functools
+import hashlib
+
+from django.core.cache import caches
+from django.template.loader import get_template
+from django.utils import timezone, translation
+from django.utils.connection import ConnectionProxy
+from django.utils.safestring import mark_safe
+from task_manager import metrics
+
+# The keys are digests of the rows, every process can keep its own.
+cache = ConnectionProxy(caches, 'local')
+
+ROWS_TIMEOUT = 60 * 60 * 24
+ROW_TEMPLATE = 'tasks/task_row.html'
+
+
+@functools.lru_cache(maxsize=None)
+def get_template_version():
+    """Return a digest of the source of the row template."""
+    source = get_template(ROW_TEMPLATE).template.source
+    return hashlib.md5(source.encode()).hexdigest()[:8]
+
+
+def _row_key(task):
+    parts = (
+        task.name,
+        str(task.status or ''),
+        str(task.author),
+        str(task.executor or ''),
+        task.created_at.isoformat(),
+    )
+    digest = hashlib.md5(repr(parts).encode()).hexdigest()
+    language = translation.get_language()
+    zone = timezone.get_current_timezone_name()
+    return (f'task_row:{get_template_version()}:{task.id}:{language}:{zone}:'
+            f'{digest}')
+
+
+def render_rows(tasks):
+    """Return the rendered `<tr>` of every task, missing ones are cached."""
+    keys = [_row_key(task) for task in tasks]
+    rows = cache.get_many(keys)
+    missing = {}
+    template = None
+    for key, task in zip(keys, tasks):
+        if key not in rows:
+            template = template or get_template(ROW_TEMPLATE)
+            missing[key] = template.render({'task': task})
+    metrics.count_cache('rows', len(keys) - len(missing), len(missing))
+    if missing:
+        cache.set_many(missing, ROWS_TIMEOUT)
+        rows.update(missing)
+    return [mark_safe(rows[key]) for key in keys]
@@ -0,0 +1,190 @@
+"""
+Full-text search over the name and description of tasks.
+
+SQLite keeps an FTS5 table `tasks_task_fts` in sync from signal handlers,
+PostgreSQL uses the generated `tasks_task.search_vector` column with a GIN
+index. Both are created by the `0004_task_search_index` migration.
+"""
+import re
+
+from django.db import connection
+from django.db.models import Expression, FloatField, Q, Value
+from django.db.models.sql.constants import INNER
+from django.db.models.sql.datastructures import Join
+
+from .models import Task
+
+WORD_RE = re.compile(r'[^\W_]+')
+
+
+def get_words(text):
+    return WORD_RE.findall(text or '')
+
+
+class SearchIndexRelation:
+    """
+    Join condition of a search index on the task id, restricted to the
+    rows matching a query, used as the `join_field` of a `Join`.
+    """
+
+    # The query inspects the columns of joined models, the index holds tasks.
+    related_model = Task
+
+    def __init__(self, pk_column, index_column, match_sql, query):
+        self.pk_column = pk_column
+        self.index_column = index_column
+        self.match_sql = match_sql
+        self.query = query
+
+    def get_joining_columns(self):
+        return ((self.pk_column, self.index_column),)
+
+    def get_extra_restriction(self, alias, related_alias):
+        return SearchIndexSQL(alias, self.match_sql, [self.query])
+
+
+class SearchIndexSQL(Expression):
+    """SQL of the joined search index, `%(index)s` is its alias."""
+
+    def __init__(self, alias, sql, params=(), output_field=None):
+        super().__init__(output_field=output_field)
+        self.alias = alias
+        self.sql = sql
+        self.params = list(params)
+
+    def as_sql(self, compiler, connection):
+        index = compiler.quote_name_unless_alias(self.alias)
+        return self.sql % {'index': index}, self.params
+
+    def relabeled_clone(self, change_map):
+        clone = self.copy()
+        clone.alias = change_map.get(self.alias, self.alias)
+        return clone
+
+    def get_group_by_cols(self, alias=None):
+        return [self]
+
+
+class BaseSearchBackend:
+    """Unindexed fallback for database vendors without a search index."""
+
+    index_table = None
+    index_column = None
+    match_sql = None
+    rank_sql = None
+
+    def join_index(self, queryset, query):
+        """
+        Join the search index once, restricted to the rows matching the
+        query, and annotate the rows with its `search_rank`.
+        """
+        queryset = queryset.all()
+        sql_query = queryset.query
+        relation = SearchIndexRelation(
+            queryset.model._meta.pk.column, self.index_column,
+            self.match_sql, query,
+        )
+        alias = sql_query.join(Join(
+            self.index_table, sql_query.get_initial_alias(), None, INNER,
+            relation, False,
+        ))
+        # bm25() needs no query, ts_rank() takes it again.
+        rank_params = [query] * self.rank_sql.count('%%s')
+        return queryset.annotate(search_rank=SearchIndexSQL(
+            alias, self.rank_sql, rank_params, output_field=FloatField(),
+        ))
+
+    def index(self, task):
+        pass
+
+    def remove(self, task_id):
+        pass
+
+    def rebuild(self):
+        """Index all tasks, e.g. after they were bulk-created."""
+
+    def search(self, queryset, words):
+        condition = Q()
+        for word in words:
+            condition &= Q(name__icontains=word) | \
+                Q(description__icontains=word)
+        return queryset.filter(
+            pk__in=Task.objects.filter(condition).values('pk'),
+        ).annotate(search_rank=Value(0.0))
+
+
+class SQLiteSearchBackend(BaseSearchBackend):
+
+    index_table = 'tasks_task_fts'
+    index_column = 'rowid'
+    # The hidden column named after the table, as an alias cannot be used.
+    match_sql = '%(index)s.tasks_task_fts MATCH %%s'
+    # bm25() reads the statistics of the row matched by the join.
+    rank_sql = '-bm25(%(index)s.tasks_task_fts, 10.0, 1.0)'
+
+    def index(self, task):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'DELETE FROM tasks_task_fts WHERE rowid = %s', [task.pk],
+            )
+            cursor.execute(
+                'INSERT INTO tasks_task_fts(rowid, name, description) '
+                'VALUES (%s, %s, %s)',
+                [task.pk, task.name, task.description],
+            )
+
+    def remove(self, task_id):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'DELETE FROM tasks_task_fts WHERE rowid = %s', [task_id],
+            )
+
+    def rebuild(self):
+        with connection.cursor() as cursor:
+            cursor.execute('DELETE FROM tasks_task_fts')
+            cursor.execute(
+                'INSERT INTO tasks_task_fts(rowid, name, description) '
+                'SELECT id, name, description FROM tasks_task'
+            )
+
+    def search(self, queryset, words):
+        query = ' '.join(f'"{word}"*' for word in words)
+        return self.join_index(queryset, query)
+
+
+class PostgreSQLSearchBackend(BaseSearchBackend):
+    """The generated `search_vector` column needs no maintenance."""
+
+    index_table = 'tasks_task'
+    index_column = 'id'
+    match_sql = "%(index)s.search_vector @@ to_tsquery('simple', %%s)"
+    rank_sql = (
+        "ts_rank(%(index)s.search_vector, to_tsquery('simple', %%s))"
+    )
+
+    def search(self, queryset, words):
+        query = ' & '.join(f'{word}:*' for word in words)
+        return self.join_index(queryset, query)
+
+
+BACKENDS = {
+    'sqlite': SQLiteSearchBackend,
+    'postgresql': PostgreSQLSearchBackend,
+}
+
+
+def get_backend():
+    return BACKENDS.get(connection.vendor, BaseSearchBackend)()
+
+
+def search_tasks(queryset, text):
+    """
+    Filter tasks or task list entries by words of their name or description.
+
+    Every word has to match as a prefix. The matching rows get annotated
+    with `search_rank`, the higher the more relevant.
+    """
+    words = get_words(text)
+    if not words:
+        return queryset
+    return get_backend().search(queryset, words)
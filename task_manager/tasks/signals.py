@@ -0,0 +1,101 @@
+from django.contrib.auth import get_user_model
+from django.db.models.functions import Now
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from django.utils.autoreload import file_changed
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+
+from . import live, read_model, rows, search, versions
+from .bulk import BATCH_SIZE, tasks_bulk_updated
+from .models import Task, TaskLabel
+
+User = get_user_model()
+
+USER_NAME_FIELDS = {'first_name', 'last_name'}
+
+
+@receiver(post_save, sender=Task)
+def task_saved(sender, instance, created, raw, **kwargs):
+    versions.bump_version(versions.TASKS)
+    search.get_backend().index(instance)
+    if not raw:
+        read_model.refresh_entries([instance.pk])
+        live.publish_changed([instance.pk], created=created)
+
+
+@receiver(post_delete, sender=Task)
+def task_deleted(sender, instance, **kwargs):
+    versions.bump_version(versions.TASKS)
+    search.get_backend().remove(instance.pk)
+    live.publish_deleted(instance.pk)
+
+
+@receiver(m2m_changed, sender=TaskLabel)
+def task_labels_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    versions.bump_version(versions.TASKS)
+    if not reverse:
+        task_ids = [instance.pk]
+    elif pk_set:
+        task_ids = list(pk_set)
+    else:
+        read_model.refresh_label(instance)
+        return
+    Task.objects.filter(pk__in=task_ids).update(updated_at=Now())
+    read_model.refresh_entries(task_ids)
+    live.publish_changed(task_ids)
+
+
+@receiver(tasks_bulk_updated, sender=Task)
+def tasks_bulk_updated_handler(sender, task_ids, **kwargs):
+    versions.bump_version(versions.TASKS)
+    for start in range(0, len(task_ids), BATCH_SIZE):
+        read_model.refresh_entries(task_ids[start:start + BATCH_SIZE])
+    live.publish_changed(task_ids)
+
+
+@receiver(post_save, sender=Status)
+def status_saved(sender, instance, created, raw, **kwargs):
+    versions.bump_version(versions.STATUSES)
+    if not (created or raw):
+        read_model.rename_status(instance)
+
+
+@receiver(post_save, sender=Label)
+def label_saved(sender, instance, created, raw, **kwargs):
+    versions.bump_version(versions.LABELS)
+    if not (created or raw):
+        read_model.refresh_label(instance)
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, created, raw, update_fields, **kwargs):
+    if update_fields is not None and not USER_NAME_FIELDS & update_fields:
+        return
+    versions.bump_version(versions.USERS)
+    if not (created or raw):
+        read_model.rename_user(instance)
+
+
+@receiver(post_delete, sender=Status)
+def status_deleted(sender, **kwargs):
+    versions.bump_version(versions.STATUSES)
+
+
+@receiver(post_delete, sender=Label)
+def label_deleted(sender, **kwargs):
+    versions.bump_version(versions.LABELS)
+
+
+@receiver(post_delete, sender=User)
+def user_deleted(sender, **kwargs):
+    versions.bump_version(versions.USERS)
+
+
+@receiver(file_changed)
+def template_changed(sender, file_path, **kwargs):
+    # The development server reloads the templates without a restart.
+    if file_path.suffix == '.html':
+        rows.get_template_version.cache_clear()
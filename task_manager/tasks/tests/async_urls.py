@@ -0,0 +1,13 @@
+from django.urls import path
+from task_manager.tasks.async_views import (
+    AsyncTaskDetailView,
+    AsyncTaskListView,
+)
+from task_manager.urls import urlpatterns as base_urlpatterns
+
+urlpatterns = [
+    path('tasks/', AsyncTaskListView.as_view(), name='task_list'),
+    path('tasks/<int:pk>/', AsyncTaskDetailView.as_view(),
+         name='task_detail'),
+    *base_urlpatterns,
+]
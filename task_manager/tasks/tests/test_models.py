@@ -1,8 +1,15 @@
+from io import StringIO
+
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import IntegrityError, connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils.translation import gettext as _
+from task_manager.labels.models import Label
 from task_manager.statuses.models import Status
-from task_manager.tasks.models import Task
+from task_manager.tasks.forms import TaskForm
+from task_manager.tasks.models import Task, TaskLabel, TaskListEntry
 
 User = get_user_model()
 
@@ -110,3 +117,121 @@ class TaskModelTest(TestCase):
 
     def test_representation(self) -> None:
         self.assertEqual(self.task.__str__(), 'task_10')
+
+
+class TaskListEntryTest(TestCase):
+    """Test case for the TaskListEntry read model."""
+
+    fixtures = ['labels.json', 'statuses.json', 'tasks.json', 'users.json']
+
+    def setUp(self) -> None:
+        call_command('rebuild_task_list', stdout=StringIO())
+
+    def get_entry(self, pk) -> TaskListEntry:
+        return TaskListEntry.objects.get(pk=pk)
+
+    def test_rebuild(self) -> None:
+        self.assertEqual(TaskListEntry.objects.count(), 3)
+        entry = self.get_entry(3)
+        self.assertEqual(entry.name, 'task_3')
+        self.assertEqual(entry.status_name, 'status_3')
+        self.assertEqual(entry.author_name, str(User.objects.get(pk=2)))
+        self.assertEqual(entry.executor_name, str(User.objects.get(pk=1)))
+        self.assertEqual(entry.label_ids, ',2,3,')
+        self.assertEqual(entry.label_names, 'label_2, label_3')
+
+    def test_task_created_and_deleted(self) -> None:
+        task = Task.objects.create(
+            name='task_4',
+            author=User.objects.get(pk=1),
+            status=Status.objects.get(pk=1),
+        )
+        entry = self.get_entry(task.pk)
+        self.assertEqual(entry.name, 'task_4')
+        self.assertIsNone(entry.executor)
+
+        task.delete()
+        self.assertFalse(TaskListEntry.objects.filter(pk=task.pk).exists())
+
+    def test_labels_changed(self) -> None:
+        task = Task.objects.get(pk=1)
+        task.labels.set([1, 3])
+        self.assertEqual(self.get_entry(1).label_ids, ',1,3,')
+
+        Label.objects.get(pk=2).task_set.add(task)
+        self.assertEqual(self.get_entry(1).label_ids, ',1,2,3,')
+
+        task.labels.clear()
+        self.assertEqual(self.get_entry(1).label_names, '')
+
+    def test_related_objects_renamed(self) -> None:
+        status = Status.objects.get(pk=3)
+        status.name = 'renamed status'
+        status.save()
+        self.assertEqual(self.get_entry(1).status_name, 'renamed status')
+
+        label = Label.objects.get(pk=2)
+        label.name = 'renamed label'
+        label.save()
+        self.assertEqual(self.get_entry(3).label_names,
+                         'renamed label, label_3')
+
+        user = User.objects.get(pk=1)
+        user.first_name = 'Renamed'
+        user.save()
+        self.assertEqual(self.get_entry(2).executor_name, str(user))
+
+
+class TaskLabelTest(TestCase):
+    """Test case for the links between tasks and labels."""
+
+    fixtures = ['labels.json', 'statuses.json', 'tasks.json', 'users.json']
+
+    def get_writes(self, queries) -> list:
+        return [query['sql'].split()[0] for query in queries
+                if 'tasks_tasklabel' in query['sql']
+                and not query['sql'].startswith('SELECT')]
+
+    def test_set_labels_writes_only_changes(self) -> None:
+        task = Task.objects.get(pk=3)
+        with CaptureQueriesContext(connection) as queries:
+            task.set_labels([2, 3], current_ids=[2, 3])
+        self.assertEqual(len(queries), 0)
+
+        with CaptureQueriesContext(connection) as queries:
+            task.set_labels(Label.objects.filter(pk__in=[1, 3]))
+        self.assertEqual(self.get_writes(queries), ['DELETE', 'INSERT'])
+        self.assertEqual(
+            sorted(task.labels.values_list('pk', flat=True)), [1, 3],
+        )
+        self.assertEqual(TaskListEntry.objects.get(pk=3).label_ids, ',1,3,')
+
+    def test_form_diffs_current_links(self) -> None:
+        task = Task.objects.get(pk=3)
+        form = TaskForm(
+            {'name': task.name, 'status': task.status_id, 'labels': [2]},
+            instance=task,
+        )
+        # Changed by another request after the form was built.
+        Task.objects.get(pk=3).set_labels([1, 2, 3])
+        self.assertTrue(form.is_valid(), form.errors)
+        form.save()
+        self.assertEqual(list(task.labels.values_list('pk', flat=True)), [2])
+
+    def test_unique_link(self) -> None:
+        with self.assertRaises(IntegrityError):
+            TaskLabel.objects.create(task_id=3, label_id=2)
+
+
+class TaskIndexTest(TestCase):
+    """Test case for the indexes serving the task filters."""
+
+    fixtures = ['labels.json', 'statuses.json', 'tasks.json', 'users.json']
+
+    def test_filters_use_indexes(self) -> None:
+        for options in ({}, {'read_model': True}):
+            out = StringIO()
+            call_command('explain_task_filters', fail_on_scan=True,
+                         stdout=out, **options)
+            self.assertIn('status, executor, label: ok', out.getvalue())
+            self.assertNotIn('full scan', out.getvalue())
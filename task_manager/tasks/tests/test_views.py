@@ -1,18 +1,45 @@
+import json
 from http import HTTPStatus
+from io import StringIO
+from unittest.mock import patch
 
+from asgiref.sync import sync_to_async
+from asgiref.testing import ApplicationCommunicator
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.core.management import call_command
 from django.core.exceptions import ObjectDoesNotExist
-from django.test import Client, TestCase
+from django.db import connection
+from django.template.loader import get_template
+from django.test import (
+    Client,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.translation import gettext as _
+from task_manager.labels.models import Label
+from task_manager.middleware import QueryBudgetExceeded
 from task_manager.statuses.models import Status
-from task_manager.tasks.models import Task
+from task_manager.asgi import application
+from task_manager.tasks import live, rows
+from task_manager.tasks.async_views import AsyncTaskListView
+from task_manager.tasks.models import Task, TaskLabel, TaskListEntry
+from task_manager.tasks.views import TaskDetailView, TaskListView
 
 User = get_user_model()
 
 MSG_NO_PERMISSION = _('You are not authorized! Please sign in.')
 
 
+def clear_caches():
+    for backend in caches.all():
+        backend.clear()
+
+
 class TaskListViewTest(TestCase):
     """Test case for the TaskListView."""
 
@@ -86,6 +113,746 @@ class TaskListViewTest(TestCase):
         self.assertNotIn(Task.objects.get(pk=3), task_list)
 
 
+class TaskFacetsTest(TestCase):
+    """Test case for the faceted counts of the task filter."""
+
+    fixtures = ['labels.json', 'statuses.json', 'tasks.json', 'users.json']
+
+    def setUp(self) -> None:
+        clear_caches()
+        self.client = Client()
+        self.client.force_login(User.objects.get(pk=1))
+
+    def test_counts_without_filters(self) -> None:
+        response = self.client.get(reverse('task_list'))
+        self.assertContains(response, 'status_1 (0)')
+        self.assertContains(response, 'status_3 (2)')
+        self.assertContains(response, 'Last_name_user_1 (2)')
+        self.assertContains(response, 'label_2 (1)')
+
+    def test_counts_ignore_own_filter(self) -> None:
+        response = self.client.get(reverse('task_list'), {'status': 3})
+        self.assertContains(response, 'status_2 (1)')
+        self.assertContains(response, 'Last_name_user_1 (1)')
+        self.assertContains(response, 'Last_name_user_2 (1)')
+        self.assertContains(response, 'label_3 (1)')
+
+    def test_counts_cached_until_tasks_change(self) -> None:
+        params = {'executor': 1, 'self_tasks': 'on'}
+        self.client.get(reverse('task_list'), params)
+        # Session, user and the page of tasks.
+        with self.assertNumQueries(3):
+            self.client.get(reverse('task_list'), params)
+
+        Task.objects.create(
+            name='task_4',
+            author=User.objects.get(pk=1),
+            executor=User.objects.get(pk=1),
+            status=Status.objects.get(pk=1),
+        )
+        response = self.client.get(reverse('task_list'), params)
+        self.assertContains(response, 'status_1 (1)')
+
+
+class TaskSearchTest(TestCase):
+    """Test case for the full-text search of TaskListView."""
+
+    fixtures = ['labels.json', 'statuses.json', 'tasks.json', 'users.json']
+
+    def setUp(self) -> None:
+        self.client = Client()
+        self.client.force_login(User.objects.get(pk=1))
+        task = Task.objects.get(pk=1)
+        task.name = 'Deploy release'
+        task.description = 'Prepare the release notes'
+        task.save()
+        task = Task.objects.get(pk=2)
+        task.description = 'Notes about the next release'
+        task.save()
+
+    def get_ids(self, params) -> list:
+        response = self.client.get(reverse('task_list'), params)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        return [task.id for task in response.context['tasks']]
+
+    def test_search_ranks_name_matches_first(self) -> None:
+        self.assertEqual(self.get_ids({'q': 'release'}), [1, 2])
+
+    def test_search_matches_all_words_by_prefix(self) -> None:
+        self.assertEqual(self.get_ids({'q': 'rel NEXT'}), [2])
+        self.assertEqual(self.get_ids({'q': 'release missing'}), [])
+
+    def test_search_combined_with_filter(self) -> None:
+        self.assertEqual(self.get_ids({'q': 'release', 'status': 2}), [2])
+
+    def test_search_ignores_syntax(self) -> None:
+        self.assertEqual(self.get_ids({'q': '"deploy* -(:'}), [1])
+        self.assertEqual(len(self.get_ids({'q': '" *'})), 3)
+
+    def test_index_follows_changes(self) -> None:
+        Task.objects.get(pk=1).delete()
+        task = Task.objects.get(pk=3)
+        task.name = 'Release party'
+        task.save()
+        self.assertEqual(self.get_ids({'q': 'release'}), [3, 2])
+
+    @patch.object(TaskListView, 'paginate_by', 1)
+    def test_search_pagination(self) -> None:
+        response = self.client.get(reverse('task_list'), {'q': 'release'})
+        cursor = response.context['page_obj'].next_cursor
+        params = {'q': 'release', 'cursor': cursor}
+        self.assertEqual(self.get_ids(params), [2])
+
+    @patch.object(TaskListView, 'paginate_by', 1)
+    def test_search_index_queried_once(self) -> None:
+        response = self.client.get(reverse('task_list'), {'q': 'release'})
+        cursor = response.context['page_obj'].next_cursor
+        with CaptureQueriesContext(connection) as context:
+            self.get_ids({'q': 'release', 'cursor': cursor})
+        page_sql = next(query['sql'] for query in context.captured_queries
+                        if 'ORDER BY "search_rank"' in query['sql'])
+        self.assertEqual(page_sql.count('MATCH'), 1)
+        self.assertNotIn('(SELECT', page_sql)
+
+
+@override_settings(TASK_LIST_READ_MODEL=True)
+class TaskListReadModelTest(TestCase):
+    """Test case for TaskListView served from the TaskListEntry table."""
+
+    fixtures = ['labels.json', 'statuses.json', 'tasks.json', 'users.json']
+
+    def setUp(self) -> None:
+        call_command('rebuild_task_list', stdout=StringIO())
+        self.client = Client()
+        self.client.force_login(User.objects.get(pk=1))
+
+    def get_ids(self, params=None) -> list:
+        response = self.client.get(reverse('task_list'), params)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        return [task.id for task in response.context['tasks']]
+
+    def test_list_all_tasks(self) -> None:
+        response = self.client.get(reverse('task_list'))
+        self.assertIsInstance(response.context['tasks'][0], TaskListEntry)
+        self.assertContains(response, 'status_3')
+        self.assertContains(response, '/tasks/3/update/')
+
+    def test_filters(self) -> None:
+        self.assertEqual(self.get_ids({'status': 3}), [1, 3])
+        self.assertEqual(self.get_ids({'executor': 1}), [2, 3])
+        self.assertEqual(self.get_ids({'label': 2}), [3])
+        self.assertEqual(self.get_ids({'self_tasks': 'on'}), [1])
+        self.assertEqual(self.get_ids({'q': 'task_2'}), [2])
+
+
+@override_settings(QUERY_BUDGET_STRICT=True)
+class TaskQueryBudgetTest(TestCase):
+    """Test case for the query budgets of the task views."""
+
+    fixtures = ['labels.json', 'statuses.json', 'tasks.json', 'users.json']
+
+    def setUp(self) -> None:
+        self.client = Client()
+        self.client.force_login(User.objects.get(pk=1))
+        users = list(User.objects.all())
+        labels = list(Label.objects.all())
+        for number in range(20):
+            task = Task.objects.create(
+                name=f'task_{number}',
+                author=users[number % 3],
+                executor=users[(number + 1) % 3],
+                status=Status.objects.get(pk=number % 3 + 1),
+            )
+            task.labels.set(labels[:number % 4])
+
+    def test_list_within_budget(self) -> None:
+        params = {'status': 1, 'executor': 2, 'label': 1, 'self_tasks': 'on'}
+        response = self.client.get(reverse('task_list'), params)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+
+        response = self.client.get(reverse('task_list'))
+        self.assertEqual(len(response.context['tasks']), 23)
+
+    def test_detail_within_budget(self) -> None:
+        task = Task.objects.filter(labels__isnull=False).first()
+        response = self.client.get(reverse('task_detail', args=[task.pk]))
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        for label in task.labels.all():
+            self.assertContains(response, label.name)
+
+    def test_exceeded_budget_raises(self) -> None:
+        with patch.object(TaskDetailView, 'query_budget', 1):
+            with self.assertRaises(QueryBudgetExceeded):
+                self.client.get(reverse('task_detail', args=[1]))
+
+
+@patch.object(TaskListView, 'paginate_by', 2)
+class TaskListPaginationTest(TestCase):
+    """Test case for the keyset pagination of TaskListView."""
+
+    fixtures = ['labels.json', 'statuses.json', 'tasks.json', 'users.json']
+
+    def setUp(self) -> None:
+        self.client = Client()
+        self.client.force_login(User.objects.get(pk=1))
+        task = Task.objects.get(pk=1)
+        for number in range(4, 8):
+            Task.objects.create(
+                name=f'task_{number}',
+                author=task.author,
+                status=task.status,
+            )
+
+    def get_ids(self, response) -> list:
+        return [task.id for task in response.context['tasks']]
+
+    def test_first_page(self) -> None:
+        response = self.client.get(reverse('task_list'))
+        self.assertEqual(self.get_ids(response), [1, 2])
+        self.assertTrue(response.context['is_paginated'])
+        self.assertFalse(response.context['page_obj'].has_previous())
+        self.assertTrue(response.context['page_obj'].has_next())
+
+    def test_walk_forward_and_back(self) -> None:
+        seen = []
+        cursor = None
+        while True:
+            params = {'cursor': cursor} if cursor else {}
+            response = self.client.get(reverse('task_list'), params)
+            seen.extend(self.get_ids(response))
+            cursor = response.context['page_obj'].next_cursor
+            if cursor is None:
+                break
+        self.assertEqual(seen, list(range(1, 8)))
+
+        previous = response.context['page_obj'].previous_cursor
+        response = self.client.get(reverse('task_list'), {'cursor': previous})
+        self.assertEqual(self.get_ids(response), [5, 6])
+        self.assertTrue(response.context['page_obj'].has_next())
+
+    def test_cursor_keeps_filter(self) -> None:
+        params = {'status': 3}
+        response = self.client.get(reverse('task_list'), params)
+        self.assertEqual(self.get_ids(response), [1, 3])
+        self.assertEqual(response.context['querystring'], 'status=3')
+
+        params['cursor'] = response.context['page_obj'].next_cursor
+        response = self.client.get(reverse('task_list'), params)
+        self.assertEqual(self.get_ids(response), [4, 5])
+
+    def test_invalid_cursor(self) -> None:
+        response = self.client.get(reverse('task_list'), {'cursor': 'bogus'})
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+
+class TaskExportViewTest(TestCase):
+    """Test case for the TaskExportView."""
+
+    fixtures = ['labels.json', 'statuses.json', 'tasks.json', 'users.json']
+
+    def setUp(self) -> None:
+        self.client = Client()
+        self.client.force_login(User.objects.get(pk=1))
+
+    def get_content(self, response) -> str:
+        return b''.join(response.streaming_content).decode()
+
+    def test_redirect_if_not_logged_in(self) -> None:
+        self.client.logout()
+        response = self.client.get(reverse('task_export'))
+        self.assertRedirects(response, reverse('login'))
+
+    def test_csv(self) -> None:
+        response = self.client.get(reverse('task_export'), {'status': 3})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertIn('attachment', response['Content-Disposition'])
+
+        lines = self.get_content(response).splitlines()
+        self.assertEqual(lines[0], 'id,name,description,status,author,'
+                                   'executor,labels,created_at')
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[1].startswith('1,task_1,'))
+        self.assertIn('"label_2, label_3"', lines[2])
+
+    def test_ndjson(self) -> None:
+        with self.assertNumQueries(4):
+            response = self.client.get(
+                reverse('task_export'), {'format': 'ndjson'},
+            )
+            rows = [json.loads(line) for line
+                    in self.get_content(response).splitlines()]
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        self.assertEqual([row['id'] for row in rows], [1, 2, 3])
+        self.assertEqual(rows[2]['labels'], ['label_2', 'label_3'])
+        self.assertEqual(rows[0]['status'], 'status_3')
+
+    def test_invalid_request(self) -> None:
+        response = self.client.get(reverse('task_export'), {'format': 'xml'})
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        response = self.client.get(reverse('task_export'), {'status': 99})
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+    def test_invalid_request_not_html(self) -> None:
+        payload = '<script>alert(1)</script>'
+        for params in ({'format': payload}, {'status': payload}):
+            response = self.client.get(reverse('task_export'), params)
+            self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+            self.assertEqual(response['Content-Type'],
+                             'text/plain; charset=utf-8')
+            self.assertNotIn(payload, response.content.decode())
+
+    def test_command(self) -> None:
+        out = StringIO()
+        call_command('export_tasks', format='ndjson', label=2, stdout=out)
+        rows = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([row['id'] for row in rows], [3])
+
+
+class TaskBulkViewTest(TestCase):
+    """Test case for the TaskBulkView."""
+
+    fixtures = ['labels.json', 'statuses.json', 'tasks.json', 'users.json']
+
+    def setUp(self) -> None:
+        clear_caches()
+        self.client = Client()
+        self.client.force_login(User.objects.get(pk=2))
+
+    def post(self, data, query=''):
+        url = reverse('task_bulk') + (f'?{query}' if query else '')
+        return self.client.post(url, data, follow=True)
+
+    def get_labels(self, pk) -> list:
+        return list(Task.objects.get(pk=pk).labels.values_list('pk',
+                                                               flat=True))
+
+    def test_redirect_if_not_logged_in(self) -> None:
+        self.client.logout()
+        response = self.client.post(reverse('task_bulk'))
+        self.assertRedirects(response, reverse('login'))
+
+    def test_get_not_allowed(self) -> None:
+        response = self.client.get(reverse('task_bulk'))
+        self.assertEqual(response.status_code,
+                         HTTPStatus.METHOD_NOT_ALLOWED)
+
+    def test_set_status_of_selected_tasks(self) -> None:
+        response = self.post({'action': 'set_status', 'status': 1,
+                              'ids': [2, 3]})
+        self.assertRedirects(response, reverse('task_list'))
+        self.assertContains(response, _('Tasks changed: %(count)d')
+                            % {'count': 2})
+        self.assertEqual(
+            list(Task.objects.filter(status=1).values_list('pk', flat=True)),
+            [2, 3],
+        )
+
+    def test_unassign_executor(self) -> None:
+        self.post({'action': 'set_executor', 'executor': '', 'ids': [3]})
+        self.assertIsNone(Task.objects.get(pk=3).executor)
+
+    def test_labels(self) -> None:
+        self.post({'action': 'add_label', 'label': 2, 'ids': [2, 3]})
+        self.assertEqual(self.get_labels(2), [2])
+        self.assertEqual(self.get_labels(3), [2, 3])
+
+        self.post({'action': 'remove_label', 'label': 3, 'ids': [2, 3]})
+        self.assertEqual(self.get_labels(3), [2])
+
+    def test_add_label_linked_by_form_meanwhile(self) -> None:
+        bulk_create = TaskLabel.objects.bulk_create
+
+        def add_concurrently(links, **kwargs):
+            TaskLabel.objects.create(task_id=3, label_id=1)
+            return bulk_create(links, **kwargs)
+
+        with patch.object(TaskLabel.objects, 'bulk_create',
+                          side_effect=add_concurrently):
+            response = self.post({'action': 'add_label', 'label': 1,
+                                  'ids': [2, 3]})
+        self.assertRedirects(response, reverse('task_list'))
+        self.assertEqual(self.get_labels(2), [1])
+        self.assertEqual(self.get_labels(3), [1, 2, 3])
+
+    def test_other_authors_tasks(self) -> None:
+        response = self.post({'action': 'set_status', 'status': 1,
+                              'ids': [1, 2]})
+        self.assertContains(
+            response, _('Only your own tasks can be changed in bulk'),
+        )
+        self.assertFalse(Task.objects.filter(status=1).exists())
+
+    def test_filtered_tasks(self) -> None:
+        data = {'action': 'set_status', 'status': 1, 'select_all': 'on'}
+        response = self.post(data, query='status=3')
+        self.assertRedirects(response, reverse('task_list') + '?status=3')
+        self.assertFalse(Task.objects.filter(status=1).exists())
+
+        self.post(data, query='status=3&self_tasks=on')
+        self.assertEqual(
+            list(Task.objects.filter(status=1).values_list('pk', flat=True)),
+            [3],
+        )
+
+    def test_invalid_form(self) -> None:
+        response = self.post({'action': 'set_status', 'ids': [2]})
+        self.assertContains(response, _('This field is required.'))
+        response = self.post({'action': 'set_status', 'status': 1})
+        self.assertContains(response, _('Select at least one task'))
+
+    @override_settings(TASK_LIST_READ_MODEL=True)
+    def test_read_model_refreshed(self) -> None:
+        call_command('rebuild_task_list', stdout=StringIO())
+        self.post({'action': 'add_label', 'label': 1, 'ids': [2, 3]})
+        entry = TaskListEntry.objects.get(pk=3)
+        self.assertEqual(entry.label_ids, ',1,2,3,')
+
+        response = self.client.get(reverse('task_list'), {'label': 1})
+        self.assertEqual([task.id for task in response.context['tasks']],
+                         [2, 3])
+
+    def test_query_count_does_not_grow(self) -> None:
+        for pk in range(4, 104):
+            Task.objects.create(name=f'task_{pk}', author_id=2, status_id=1)
+        ids = list(Task.objects.filter(author=2).values_list('pk', flat=True))
+        data = {'action': 'set_status', 'status': 2, 'ids': ids}
+        url = reverse('task_bulk')
+        with self.assertNumQueries(12):
+            self.client.post(url, data)
+        self.assertEqual(Task.objects.filter(status=2).count(), len(ids))
+
+
+# The local-memory cache of the tests stands for a cache of all workers.
+@patch('task_manager.tasks.versions.is_shared', lambda: True)
+class TaskConditionalGetTest(TestCase):
+    """Test case for the ETags of the task list and detail pages."""
+
+    fixtures = ['labels.json', 'statuses.json', 'tasks.json', 'users.json']
+
+    def setUp(self) -> None:
+        clear_caches()
+        self.client = Client()
+        self.client.force_login(User.objects.get(pk=1))
+
+    def assertNotModified(self, url, etag, modified=False) -> None:
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        expected = HTTPStatus.OK if modified else HTTPStatus.NOT_MODIFIED
+        self.assertEqual(response.status_code, expected)
+
+    def test_list(self) -> None:
+        url = reverse('task_list')
+        etag = self.client.get(url)['ETag']
+        with self.assertNumQueries(2):
+            self.assertNotModified(url, etag)
+        self.assertNotModified(url + '?status=3', etag, modified=True)
+
+        Status.objects.filter(pk=3).get().save()
+        self.assertNotModified(url, etag, modified=True)
+
+    def test_list_changed_task(self) -> None:
+        url = reverse('task_list')
+        etag = self.client.get(url)['ETag']
+        Task.objects.get(pk=2).labels.add(1)
+        self.assertNotModified(url, etag, modified=True)
+
+    def test_list_after_deploy(self) -> None:
+        url = reverse('task_list')
+        etag = self.client.get(url)['ETag']
+        with override_settings(BUILD_ID='deployed'):
+            self.assertNotModified(url, etag, modified=True)
+
+    def test_detail(self) -> None:
+        url = reverse('task_detail', args=[3])
+        response = self.client.get(url)
+        self.assertIn('private', response['Cache-Control'])
+        etag = response['ETag']
+        with self.assertNumQueries(3):
+            self.assertNotModified(url, etag)
+
+        Task.objects.get(pk=1).save()
+        self.assertNotModified(url, etag)
+
+        Task.objects.get(pk=3).labels.remove(2)
+        self.assertNotModified(url, etag, modified=True)
+
+    def test_detail_renamed_label(self) -> None:
+        url = reverse('task_detail', args=[3])
+        etag = self.client.get(url)['ETag']
+        label = Label.objects.get(pk=2)
+        label.name = 'renamed'
+        label.save()
+        self.assertNotModified(url, etag, modified=True)
+
+    def test_other_user(self) -> None:
+        url = reverse('task_detail', args=[3])
+        etag = self.client.get(url)['ETag']
+        self.client.force_login(User.objects.get(pk=2))
+        self.assertNotModified(url, etag, modified=True)
+
+    def test_pending_messages(self) -> None:
+        url = reverse('task_list')
+        etag = self.client.get(url)['ETag']
+        response = self.client.post(
+            reverse('task_update', args=[1]),
+            {'name': 'task_1', 'status': 3},
+        )
+        self.assertEqual(response.status_code, HTTPStatus.FOUND)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertContains(response, _('The task successfully updated'))
+
+    def test_process_local_cache(self) -> None:
+        urls = (reverse('task_list'), reverse('task_detail', args=[3]))
+        with patch('task_manager.tasks.versions.is_shared', lambda: False):
+            for url in urls:
+                self.assertNotIn('ETag', self.client.get(url))
+
+
+class TaskRowCacheTest(TestCase):
+    """Test case for the cached rows of the task table."""
+
+    fixtures = ['labels.json', 'statuses.json', 'tasks.json', 'users.json']
+
+    def setUp(self) -> None:
+        clear_caches()
+        self.client = Client()
+        self.client.force_login(User.objects.get(pk=1))
+
+    def test_rows_are_cached(self) -> None:
+        self.client.get(reverse('task_list'))
+        with patch('task_manager.tasks.rows.get_template') as get_template:
+            response = self.client.get(reverse('task_list'))
+        get_template.assert_not_called()
+        self.assertContains(response, reverse('task_update', args=[3]))
+        self.assertContains(response, 'task_3')
+
+    def test_changed_rows_are_rendered(self) -> None:
+        self.client.get(reverse('task_list'))
+        status = Status.objects.get(pk=2)
+        status.name = 'renamed status'
+        status.save()
+        task = Task.objects.get(pk=1)
+        task.name = 'renamed task'
+        task.save()
+
+        response = self.client.get(reverse('task_list'))
+        self.assertContains(response, 'renamed status')
+        self.assertContains(response, 'renamed task')
+        self.assertNotContains(response, 'task_1<')
+
+    def test_rows_of_changed_template_are_rendered(self) -> None:
+        self.client.get(reverse('task_list'))
+        with patch('task_manager.tasks.rows.get_template_version',
+                   return_value='changed'):
+            with patch('task_manager.tasks.rows.get_template',
+                       wraps=get_template) as spy:
+                response = self.client.get(reverse('task_list'))
+        spy.assert_called_once_with(rows.ROW_TEMPLATE)
+        self.assertContains(response, 'task_3')
+
+    @override_settings(TASK_LIST_READ_MODEL=True)
+    def test_read_model_rows(self) -> None:
+        call_command('rebuild_task_list', stdout=StringIO())
+        self.client.get(reverse('task_list'))
+        user = User.objects.get(pk=2)
+        user.first_name = 'Renamed'
+        user.save()
+        response = self.client.get(reverse('task_list'))
+        self.assertContains(response, str(user))
+
+
+class TaskLiveUpdatesTest(TestCase):
+    """Test case for the live task events served under ASGI."""
+
+    fixtures = ['labels.json', 'statuses.json', 'tasks.json', 'users.json']
+
+    def setUp(self) -> None:
+        clear_caches()
+        self.client = Client()
+        self.client.force_login(User.objects.get(pk=1))
+        self.cookie = self.client.cookies[settings.SESSION_COOKIE_NAME].value
+
+    def get_communicator(self, query='', cookie=True):
+        headers = []
+        if cookie:
+            headers.append((
+                b'cookie',
+                f'{settings.SESSION_COOKIE_NAME}={self.cookie}'.encode(),
+            ))
+        return ApplicationCommunicator(application, {
+            'type': 'http',
+            'method': 'GET',
+            'path': live.EVENTS_PATH,
+            'query_string': query.encode(),
+            'headers': headers,
+        })
+
+    async def connect(self, query=''):
+        communicator = self.get_communicator(query)
+        await communicator.send_input({'type': 'http.request'})
+        start = await communicator.receive_output(timeout=5)
+        self.assertEqual(start['status'], HTTPStatus.OK)
+        await communicator.receive_output(timeout=5)
+        return communicator
+
+    async def receive_event(self, communicator):
+        message = await communicator.receive_output(timeout=5)
+        kind, data = message['body'].decode().splitlines()[:2]
+        return kind.split(': ')[1], json.loads(data.split(': ', 1)[1])
+
+    async def disconnect(self, communicator):
+        await communicator.send_input({'type': 'http.disconnect'})
+        await communicator.wait(timeout=5)
+        self.assertFalse(live.hub)
+
+    def save_task(self, pk, **fields) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            task = Task.objects.get(pk=pk)
+            for name, value in fields.items():
+                setattr(task, name, value)
+            task.save()
+
+    async def test_updates_are_pushed(self) -> None:
+        communicator = await self.connect()
+        await sync_to_async(self.save_task)(2, name='renamed')
+        kind, data = await self.receive_event(communicator)
+        self.assertEqual(kind, live.UPDATED)
+        self.assertEqual(data['id'], 2)
+        self.assertEqual(data['name'], 'renamed')
+        self.assertEqual(data['status'], 'status_2')
+        await self.disconnect(communicator)
+
+    async def test_deltas_are_filtered(self) -> None:
+        communicator = await self.connect('status=3&label=2')
+        await sync_to_async(self.save_task)(2, name='not shown')
+        await sync_to_async(self.save_task)(3, status_id=1)
+        kind, data = await self.receive_event(communicator)
+        self.assertEqual((kind, data), (live.REMOVED, {'id': 2}))
+        kind, data = await self.receive_event(communicator)
+        self.assertEqual((kind, data), (live.REMOVED, {'id': 3}))
+        await self.disconnect(communicator)
+
+    async def test_created_and_deleted(self) -> None:
+        communicator = await self.connect('self_tasks=on&q=deplo')
+
+        def create_and_delete():
+            with self.captureOnCommitCallbacks(execute=True):
+                Task.objects.create(name='other', author_id=1, status_id=1)
+                Task.objects.create(name='Deploy', author_id=1, status_id=1)
+                Task.objects.create(name='Deploy', author_id=2, status_id=1)
+            with self.captureOnCommitCallbacks(execute=True):
+                Task.objects.get(pk=1).delete()
+
+        await sync_to_async(create_and_delete)()
+        kind, data = await self.receive_event(communicator)
+        self.assertEqual(kind, live.CREATED)
+        self.assertEqual(data['name'], 'Deploy')
+        kind, data = await self.receive_event(communicator)
+        self.assertEqual((kind, data), (live.REMOVED, {'id': 1}))
+        await self.disconnect(communicator)
+
+    async def test_requires_authentication(self) -> None:
+        communicator = self.get_communicator(cookie=False)
+        await communicator.send_input({'type': 'http.request'})
+        start = await communicator.receive_output(timeout=5)
+        self.assertEqual(start['status'], HTTPStatus.UNAUTHORIZED)
+
+    def test_placeholder_outside_asgi(self) -> None:
+        response = self.client.get(reverse('task_events'))
+        self.assertEqual(response.status_code, HTTPStatus.NOT_IMPLEMENTED)
+
+    def test_list_subscribes_when_enabled(self) -> None:
+        with self.settings(TASK_LIVE_UPDATES=False):
+            response = self.client.get(reverse('task_list'))
+        self.assertNotContains(response, 'EventSource')
+        self.assertNotContains(response, 'task-changes')
+        with self.settings(TASK_LIVE_UPDATES=True):
+            response = self.client.get(reverse('task_list'))
+        self.assertContains(response, reverse('task_events'))
+
+
+@override_settings(ROOT_URLCONF='task_manager.tasks.tests.async_urls')
+class AsyncTaskViewsTest(TestCase):
+    """Test case for the async task list and detail views."""
+
+    fixtures = ['labels.json', 'statuses.json', 'tasks.json', 'users.json']
+
+    def setUp(self) -> None:
+        clear_caches()
+        self.async_client.force_login(User.objects.get(pk=1))
+
+    async def test_list(self) -> None:
+        response = await self.async_client.get(reverse('task_list'))
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertTemplateUsed(response, 'tasks/task_list.html')
+        self.assertEqual([task.id for task in response.context['tasks']],
+                         [1, 2, 3])
+        self.assertContains(response, 'task_3')
+
+    async def test_list_filter_and_pagination(self) -> None:
+        url = reverse('task_list')
+        with patch.object(AsyncTaskListView, 'paginate_by', 1):
+            response = await self.async_client.get(url, {'status': 3})
+            self.assertEqual([task.id for task in response.context['tasks']],
+                             [1])
+            cursor = response.context['page_obj'].next_cursor
+            response = await self.async_client.get(
+                url, {'status': 3, 'cursor': cursor},
+            )
+        self.assertEqual([task.id for task in response.context['tasks']],
+                         [3])
+        self.assertFalse(response.context['page_obj'].has_next())
+
+        response = await self.async_client.get(url, {'cursor': 'bogus'})
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+        response = await self.async_client.get(url, {'status': 99})
+        self.assertEqual(list(response.context['tasks']), [])
+
+    async def test_search(self) -> None:
+        response = await self.async_client.get(reverse('task_list'),
+                                               {'q': 'task_2'})
+        self.assertEqual([task.id for task in response.context['tasks']],
+                         [2])
+
+    @patch('task_manager.tasks.versions.is_shared', lambda: True)
+    async def test_detail(self) -> None:
+        url = reverse('task_detail', args=[3])
+        response = await self.async_client.get(url)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertContains(response, 'label_2')
+        self.assertContains(response, 'label_3')
+
+        response = await self.async_client.get(
+            url, **{'If-None-Match': response['ETag']},
+        )
+        self.assertEqual(response.status_code, HTTPStatus.NOT_MODIFIED)
+
+        response = await self.async_client.get(
+            reverse('task_detail', args=[99]),
+        )
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+    async def test_redirect_if_not_logged_in(self) -> None:
+        await sync_to_async(self.async_client.logout)()
+        response = await self.async_client.get(reverse('task_list'))
+        self.assertRedirects(response, reverse('login'),
+                             fetch_redirect_response=False)
+
+
+class TaskViewsBenchmarkTest(TransactionTestCase):
+    """Test case for the benchmark of the sync and async task views."""
+
+    # The ASGI handler serves the requests from other threads, which only
+    # see committed data.
+    fixtures = ['labels.json', 'statuses.json', 'tasks.json', 'users.json']
+
+    def test_benchmark_command(self) -> None:
+        out = StringIO()
+        call_command('benchmark_task_views', requests=2, stdout=out)
+        self.assertIn('AsyncTaskListView', out.getvalue())
+        self.assertIn('TaskDetailView', out.getvalue())
+
+
 class TaskCreateViewTest(TestCase):
     """"Test case for TaskCreateView."""
 
@@ -227,6 +994,58 @@ class TaskCreateViewTest(TestCase):
         self.assertEqual(message.tags, 'error')
 
 
+class TaskChoicesCacheTest(TestCase):
+    """Test case for the cached choice lists of the task form and filter."""
+
+    fixtures = ['labels.json', 'statuses.json', 'tasks.json', 'users.json']
+
+    def setUp(self) -> None:
+        # Rolled back changes of the previous tests do not bump versions.
+        clear_caches()
+        self.client = Client()
+        self.client.force_login(User.objects.get(pk=1))
+
+    def test_choices_are_not_queried_again(self) -> None:
+        self.client.get(reverse('task_create'))
+        # Session and user only.
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('task_create'))
+        self.assertContains(response, 'label_3')
+
+    def test_choices_invalidated_on_change(self) -> None:
+        self.client.get(reverse('task_list'))
+        Status.objects.create(name='status_4')
+        Label.objects.filter(pk=1).delete()
+        user = User.objects.get(pk=3)
+        user.first_name = 'Renamed'
+        user.save()
+
+        response = self.client.get(reverse('task_list'))
+        self.assertContains(response, 'status_4')
+        self.assertNotContains(response, 'label_1')
+        self.assertContains(response, 'Renamed')
+
+    def test_unknown_choice_is_invalid(self) -> None:
+        response = self.client.post(reverse('task_create'), {
+            'name': 'task_4',
+            'status': 1,
+            'labels': [1, 42],
+        })
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertFalse(Task.objects.filter(name='task_4').exists())
+
+    def test_labels_saved(self) -> None:
+        self.client.post(reverse('task_create'), {
+            'name': 'task_4',
+            'status': 1,
+            'labels': [1, 3],
+        })
+        task = Task.objects.get(name='task_4')
+        self.assertEqual(
+            list(task.labels.values_list('pk', flat=True)), [1, 3],
+        )
+
+
 class TaskDetailViewTest(TestCase):
     """"Test case for TaskDetailView."""
 
@@ -338,6 +1157,22 @@ class TaskUpdateViewTest(TestCase):
         self.assertEqual(message.message, _('The task successfully updated'))
         self.assertEqual(message.tags, 'success')
 
+    def test_update_task_labels(self) -> None:
+        url = reverse('task_update', args=[3])
+        data = {'name': 'task_3', 'status': 3, 'labels': [2, 3]}
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(url, data)
+        self.assertFalse([
+            query for query in queries if 'tasks_tasklabel' in query['sql']
+            and not query['sql'].startswith('SELECT')
+        ])
+
+        self.client.post(url, {**data, 'labels': [1, 3]})
+        self.assertEqual(
+            sorted(Task.objects.get(pk=3).labels.values_list('pk', flat=True)),
+            [1, 3],
+        )
+
     def test_update_task_without_description(self) -> None:
         valid_data = self.valid_data
         del valid_data['description']
@@ -468,6 +1303,20 @@ class TaskDeleteViewTest(TestCase):
         self.assertEqual(response.status_code, HTTPStatus.OK)
         self.assertTemplateUsed(response, 'tasks/task_delete.html')
 
+    def test_task_fetched_once(self) -> None:
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('task_delete', args=[1]))
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        selects = [query['sql'] for query in queries
+                   if query['sql'].startswith('SELECT')]
+
+        def count(table):
+            return len([sql for sql in selects if f'FROM "{table}"' in sql])
+
+        self.assertEqual(count(Task._meta.db_table), 1)
+        # The session user only, the author of the task is not loaded.
+        self.assertEqual(count(User._meta.db_table), 1)
+
     def test_delete_task(self) -> None:
         length_of_task_list_before = len(Task.objects.all())
 
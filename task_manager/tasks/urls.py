@@ -1,17 +1,30 @@
+from django.conf import settings
 from django.urls import path
 
+from .async_views import AsyncTaskDetailView, AsyncTaskListView
 from .views import (
+    TaskBulkView,
     TaskCreateView,
     TaskDeleteView,
     TaskDetailView,
+    TaskEventsView,
+    TaskExportView,
     TaskListView,
     TaskUpdateView,
 )
 
+if settings.TASK_ASYNC_VIEWS:
+    list_view, detail_view = AsyncTaskListView, AsyncTaskDetailView
+else:
+    list_view, detail_view = TaskListView, TaskDetailView
+
 urlpatterns = [
-    path('', TaskListView.as_view(), name='task_list'),
+    path('', list_view.as_view(), name='task_list'),
+    path('bulk/', TaskBulkView.as_view(), name='task_bulk'),
+    path('events/', TaskEventsView.as_view(), name='task_events'),
+    path('export/', TaskExportView.as_view(), name='task_export'),
     path('create/', TaskCreateView.as_view(), name='task_create'),
-    path('<int:pk>/', TaskDetailView.as_view(), name='task_detail'),
+    path('<int:pk>/', detail_view.as_view(), name='task_detail'),
     path('<int:pk>/update/', TaskUpdateView.as_view(), name='task_update'),
     path('<int:pk>/delete/', TaskDeleteView.as_view(), name='task_delete'),
 ]
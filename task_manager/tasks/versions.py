@@ -0,0 +1,65 @@
+"""
+Version counters of the tables shown on the task pages.
+
+Cached data built from a table is stored under a key that includes the
+current version of the table, bumping the version from a signal handler
+makes all of it stale at once. Versions live in the default cache, so it
+has to be shared between the worker processes in production.
+"""
+import time
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from task_manager import metrics
+
+STATUSES = 'statuses'
+LABELS = 'labels'
+USERS = 'users'
+TASKS = 'tasks'
+
+
+def _key(name):
+    return f'version:{name}'
+
+
+def get_versions(*names):
+    """Return a mapping of names to versions with a single cache lookup."""
+    versions = cache.get_many([_key(name) for name in names])
+    metrics.count_cache('versions', len(versions), len(names) - len(versions))
+    result = {}
+    for name in names:
+        version = versions.get(_key(name))
+        if version is None:
+            # Start from the clock, so an evicted counter never goes back.
+            cache.add(_key(name), time.time_ns(), None)
+            version = cache.get(_key(name))
+        result[name] = version
+    return result
+
+
+def is_shared():
+    """
+    Whether every worker sees the same versions. The local-memory cache
+    keeps separate versions per process, the dummy cache none at all.
+    """
+    return not isinstance(caches[DEFAULT_CACHE_ALIAS],
+                          (LocMemCache, DummyCache))
+
+
+def get_version(name):
+    return get_versions(name)[name]
+
+
+def _increment(name):
+    try:
+        cache.incr(_key(name))
+    except ValueError:
+        cache.set(_key(name), time.time_ns(), None)
+
+
+def bump_version(name):
+    _increment(name)
+    # Bump again on commit, so data cached before the commit goes stale too.
+    transaction.on_commit(lambda: _increment(name))
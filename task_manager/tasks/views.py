@@ -1,26 +1,191 @@
+from http import HTTPStatus
+
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import get_user_model
 from django.contrib.messages.views import SuccessMessageMixin
+from django.core.exceptions import PermissionDenied
+from django.http import (
+    HttpResponse,
+    HttpResponseBadRequest,
+    StreamingHttpResponse,
+)
 from django.shortcuts import redirect
-from django.urls import reverse_lazy
+from django.urls import reverse, reverse_lazy
+from django.utils.html import escape
 from django.utils.translation import gettext as _
 from django.views import generic
-from django_filters.views import FilterView
-from task_manager.mixins import CustomLoginRequiredMixin
+from django_filters.views import FilterMixin, FilterView
+from task_manager.mixins import (
+    ConditionalGetMixin,
+    CustomLoginRequiredMixin,
+    OwnerOnlyAccessMixin,
+)
+from task_manager.pagination import KeysetPaginationMixin
 
-from .filters import TaskFilter
-from .models import Task
+from . import bulk, export, versions
+from .facets import add_facet_counts
+from .filters import TaskFilter, TaskListEntryFilter
+from .forms import TaskBulkForm, TaskForm
+from .models import Task, TaskListEntry
+from .rows import render_rows
 
 User = get_user_model()
 
 
-class TaskListView(CustomLoginRequiredMixin, FilterView):
+class TaskListView(CustomLoginRequiredMixin,
+                   ConditionalGetMixin,
+                   KeysetPaginationMixin,
+                   FilterView):
     """Generic class-based view for a list of tasks."""
 
     model = Task
     template_name = 'tasks/task_list.html'
     context_object_name = 'tasks'
     filterset_class = TaskFilter
+    query_budget = 9
+
+    def get_etag_parts(self):
+        if not versions.is_shared():
+            # Another worker would not see the changes handled by this one.
+            return None
+        return (
+            settings.TASK_LIST_READ_MODEL,
+            *versions.get_versions(versions.TASKS, versions.STATUSES,
+                                   versions.LABELS, versions.USERS).values(),
+        )
+
+    def get_queryset(self):
+        if settings.TASK_LIST_READ_MODEL:
+            return TaskListEntry.objects.all()
+        return Task.objects.with_related()
+
+    def get_filterset_class(self):
+        if settings.TASK_LIST_READ_MODEL:
+            return TaskListEntryFilter
+        return super().get_filterset_class()
+
+    def get_keyset_ordering(self):
+        if self.filterset.is_ranked():
+            return ('-search_rank', 'pk')
+        return super().get_keyset_ordering()
+
+    def get_context_data(self, **kwargs):
+        add_facet_counts(self.filterset)
+        kwargs.setdefault('bulk_form', TaskBulkForm())
+        context = super().get_context_data(**kwargs)
+        context['task_rows'] = render_rows(context['object_list'])
+        context['live_updates'] = settings.TASK_LIVE_UPDATES
+        return context
+
+
+class TaskExportView(CustomLoginRequiredMixin,
+                     FilterMixin,
+                     generic.View):
+    """Generic class-based view for streaming filtered tasks to a file."""
+
+    filterset_class = TaskFilter
+    format_kwarg = 'format'
+
+    def get_queryset(self):
+        return Task.objects.all()
+
+    def get(self, request, *args, **kwargs):
+        export_format = request.GET.get(self.format_kwarg, export.CSV)
+        if export_format not in export.WRITERS:
+            return self.bad_request(
+                _('Unknown export format: %(format)s')
+                % {'format': export_format}
+            )
+
+        filterset = self.get_filterset(self.get_filterset_class())
+        if filterset.is_bound and not filterset.is_valid():
+            return self.bad_request(filterset.errors.as_text())
+
+        response = StreamingHttpResponse(
+            export.export_tasks(filterset.qs, export_format),
+            content_type=export.CONTENT_TYPES[export_format],
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="tasks.{export_format}"'
+        )
+        return response
+
+    def bad_request(self, message):
+        # The message repeats the submitted values, it must not be HTML.
+        return HttpResponseBadRequest(
+            escape(message), content_type='text/plain; charset=utf-8',
+        )
+
+
+class TaskEventsView(CustomLoginRequiredMixin, generic.View):
+    """
+    Placeholder of the live task events outside of the ASGI application.
+
+    Under ASGI the path is served by `live.events_app` before it reaches
+    Django, other servers answer that the events are not available.
+    """
+
+    def get(self, request, *args, **kwargs):
+        return HttpResponse(
+            _('Live updates are only available under ASGI'),
+            status=HTTPStatus.NOT_IMPLEMENTED,
+        )
+
+
+class TaskBulkView(CustomLoginRequiredMixin,
+                   FilterMixin,
+                   generic.FormView):
+    """Generic class-based view for changing many tasks at once."""
+
+    form_class = TaskBulkForm
+    filterset_class = TaskFilter
+    http_method_names = ['post']
+    success_message = _('Tasks changed: %(count)d')
+    error_message = _('Only your own tasks can be changed in bulk')
+    invalid_message = _('The tasks could not be changed: %(errors)s')
+
+    def get_queryset(self):
+        return Task.objects.all()
+
+    def get_success_url(self):
+        # The filters of the list travel in the query string of the form.
+        querystring = self.request.GET.urlencode()
+        url = reverse('task_list')
+        return f'{url}?{querystring}' if querystring else url
+
+    def get_tasks(self, form):
+        if form.cleaned_data['select_all']:
+            filterset = self.get_filterset(self.get_filterset_class())
+            if filterset.is_bound and not filterset.is_valid():
+                return None
+            return filterset.qs
+        return Task.objects.filter(pk__in=form.cleaned_data['ids'])
+
+    def form_valid(self, form):
+        tasks = self.get_tasks(form)
+        if tasks is None:
+            return self.form_invalid(form)
+        try:
+            count = bulk.apply(
+                tasks,
+                self.request.user,
+                form.cleaned_data['action'],
+                form.cleaned_data['value'],
+            )
+        except PermissionDenied:
+            messages.error(self.request, self.error_message)
+        else:
+            messages.success(self.request,
+                             self.success_message % {'count': count})
+        return redirect(self.get_success_url())
+
+    def form_invalid(self, form):
+        errors = ' '.join(
+            str(error) for errors in form.errors.values() for error in errors
+        ) or _('Invalid filters')
+        messages.error(self.request, self.invalid_message % {'errors': errors})
+        return redirect(self.get_success_url())
 
 
 class TaskCreateView(CustomLoginRequiredMixin,
@@ -29,7 +194,7 @@ class TaskCreateView(CustomLoginRequiredMixin,
     """Generic class-based view for creating tasks."""
 
     model = Task
-    fields = ('name', 'description', 'status', 'executor', 'labels')
+    form_class = TaskForm
     template_name = 'tasks/task_create.html'
     success_url = reverse_lazy('task_list')
     success_message = _('The task successfully created')
@@ -44,15 +209,32 @@ class TaskCreateView(CustomLoginRequiredMixin,
 
 
 class TaskDetailView(CustomLoginRequiredMixin,
+                     ConditionalGetMixin,
                      SuccessMessageMixin,
                      generic.DetailView):
     """Generic class-based view for detail displaying a task."""
 
     model = Task
+    queryset = Task.objects.with_related().with_labels()
     template_name = 'tasks/task_detail.html'
     extra_context = {
         'header': _('Task view'),
     }
+    query_budget = 5
+
+    def get_etag_parts(self):
+        if not versions.is_shared():
+            return None
+        updated_at = Task.objects.filter(pk=self.kwargs['pk']) \
+            .values_list('updated_at', flat=True).first()
+        if updated_at is None:
+            return None
+        return (
+            self.kwargs['pk'],
+            updated_at,
+            *versions.get_versions(versions.STATUSES, versions.LABELS,
+                                   versions.USERS).values(),
+        )
 
 
 class TaskUpdateView(CustomLoginRequiredMixin,
@@ -61,7 +243,7 @@ class TaskUpdateView(CustomLoginRequiredMixin,
     """Generic class-based view for updating tasks."""
 
     model = Task
-    fields = ('name', 'description', 'status', 'executor', 'labels')
+    form_class = TaskForm
     template_name = 'tasks/task_create.html'
     success_url = reverse_lazy('task_list')
     success_message = _('The task successfully updated')
@@ -72,6 +254,7 @@ class TaskUpdateView(CustomLoginRequiredMixin,
 
 
 class TaskDeleteView(CustomLoginRequiredMixin,
+                     OwnerOnlyAccessMixin,
                      SuccessMessageMixin,
                      generic.DeleteView):
     """Generic class-based view for deleting tasks."""
@@ -81,10 +264,4 @@ class TaskDeleteView(CustomLoginRequiredMixin,
     success_url = reverse_lazy('task_list')
     success_message = _('The task successfully deleted')
     error_message = _("The task can only be deleted by its author")
-
-    def dispatch(self, request, *args, **kwargs):
-        if request.user.id != self.get_object().author.id and \
-                request.user.is_authenticated:
-            messages.error(self.request, self.error_message)
-            return redirect(self.success_url)
-        return super().dispatch(request, *args, **kwargs)
+    owner_field = 'author_id'
@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+
+def local_memory_caches(name):
+    """
+    Settings override replacing every configured cache with a local-memory
+    one named after `name`, so nothing is shared with a running server.
+    """
+    return override_settings(CACHES={
+        alias: {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': f'{name}-{alias}',
+        }
+        for alias in settings.CACHES
+    })
+
+
+class TestRunner(DiscoverRunner):
+    """
+    Test runner replacing the configured caches with local-memory ones,
+    so the tests neither read the file-based cache of a running server or
+    of a previous run nor leave files behind.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self.caches = local_memory_caches('test')
+        self.caches.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self.caches.disable()
+        super().teardown_test_environment(**kwargs)
@@ -0,0 +1,66 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.db.models import Count
+from django.test import TestCase
+from task_manager import datagen
+from task_manager.tasks.models import Task, TaskLabel, TaskListEntry
+
+User = get_user_model()
+
+
+class DataGeneratorTest(TestCase):
+    """Test case for the synthetic data generator."""
+
+    sizes = datagen.Sizes(users=20, statuses=3, labels=10, tasks=500,
+                          labels_per_task=2)
+
+    def generate(self, **options) -> dict:
+        return datagen.generate(
+            self.sizes, datagen.Options(chunk_size=200, **options),
+        )
+
+    def test_sizes(self) -> None:
+        counts = self.generate()
+        self.assertEqual(User.objects.count(), 20)
+        self.assertEqual(Task.objects.count(), 500)
+        self.assertEqual(TaskLabel.objects.count(), counts['task labels'])
+        self.assertEqual(TaskListEntry.objects.count(), 500)
+        self.assertTrue(User.objects.first().check_password(datagen.PASSWORD))
+
+        # The sequence continues after the explicit ids.
+        task = Task.objects.create(name='new', author=User.objects.first(),
+                                   status_id=Task.objects.first().status_id)
+        self.assertEqual(task.pk, 501)
+
+    def test_skewed_distribution(self) -> None:
+        self.generate(skew=1.5)
+        authors = list(Task.objects.values('author').annotate(
+            tasks=Count('pk'),
+        ).order_by('-tasks').values_list('tasks', flat=True))
+        self.assertGreater(authors[0], 5 * authors[-1])
+
+    def test_deterministic(self) -> None:
+        def build(seed):
+            chunk = (0, 1, 50, [1, 2, 3], [1, 2], [1, 2, 3], self.sizes,
+                     datagen.Options(seed=seed))
+            return datagen.build_tasks(chunk)
+
+        self.assertEqual(build(7), build(7))
+        self.assertNotEqual(build(7), build(8))
+
+    def test_command(self) -> None:
+        out = StringIO()
+        call_command('generate_data', users=2, statuses=1, labels=1,
+                     tasks=10, stdout=out)
+        self.assertIn('10 tasks', out.getvalue())
+
+    def test_command_until(self) -> None:
+        call_command('generate_data', users=2, statuses=1, labels=1,
+                     tasks=10, days=1, until='2030-06-01', stdout=StringIO())
+        dates = {task.created_at.date().isoformat()
+                 for task in Task.objects.all()}
+        self.assertLessEqual(dates, {'2030-05-31', '2030-06-01'})
+        with self.assertRaises(CommandError):
+            call_command('generate_data', until='June', stdout=StringIO())
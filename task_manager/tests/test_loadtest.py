@@ -0,0 +1,45 @@
+from unittest.mock import patch
+
+from django.conf import settings
+from django.db import connection
+from django.test import TransactionTestCase
+from task_manager import datagen, loadtest
+from task_manager.management.commands.loadtest import Command
+
+
+class LoadTestTest(TransactionTestCase):
+    """Test case for the load test harness."""
+
+    def test_run(self) -> None:
+        datagen.generate(datagen.Sizes(users=2, statuses=1, labels=1, tasks=5),
+                         datagen.Options())
+        report = loadtest.run(requests=4, concurrency=2, logged_in=1,
+                              anonymous=1, urls=['task_list', 'login'])
+        self.assertEqual(set(report['urls']), {'task_list', 'login'})
+        task_list = report['urls']['task_list']
+        self.assertEqual(task_list['statuses'], {'200': 2, '302': 2})
+        self.assertGreater(task_list['queries_per_request'], 0)
+        self.assertGreater(task_list['bytes_per_response'], 0)
+        self.assertEqual(report['total']['requests'], 8)
+
+    def test_percentile(self) -> None:
+        values = list(range(1, 101))
+        self.assertEqual(loadtest.percentile(values, 50), 50)
+        self.assertEqual(loadtest.percentile(values, 99), 99)
+        self.assertEqual(loadtest.percentile([7], 95), 7)
+
+    def test_command_uses_local_memory_caches(self) -> None:
+        options = {name: 1 for name in ('users', 'statuses', 'labels',
+                                        'tasks', 'labels_per_task')}
+        options['seed'] = 0
+        creation = connection.creation
+        with patch.dict(connection.settings_dict['TEST']), \
+                patch.object(creation, 'create_test_db'), \
+                patch.object(creation, 'destroy_test_db'), \
+                patch.object(datagen, 'generate'), \
+                patch.object(Command, 'run',
+                             side_effect=lambda _: dict(settings.CACHES)):
+            caches = Command().run_on_test_database(options)
+        self.assertEqual(set(caches), set(settings.CACHES))
+        for alias, cache in caches.items():
+            self.assertEqual(cache['LOCATION'], f'loadtest-{alias}')
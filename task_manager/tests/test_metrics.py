@@ -0,0 +1,119 @@
+import multiprocessing
+import tempfile
+from http import HTTPStatus
+
+from django.contrib.auth import get_user_model
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse
+from task_manager import metrics
+
+User = get_user_model()
+
+
+def increment_in_child(registry, counter):
+    counter.inc(2, view='task_list')
+    registry.flush()
+
+
+class RegistryTest(TestCase):
+    """Test case for the metrics registry and its exposition."""
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.registry = metrics.Registry(self.directory.name)
+        self.counter = metrics.Counter(self.registry, 'requests_total',
+                                       'Requests.', ('view',))
+        self.histogram = metrics.Histogram(self.registry, 'duration_seconds',
+                                           'Duration.', buckets=(0.1, 1))
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_exposition(self) -> None:
+        self.counter.inc(view='task_list')
+        self.counter.inc(view='say "hi"')
+        self.histogram.observe_many([0.05, 0.5, 5])
+        self.assertEqual(self.registry.expose(), '\n'.join([
+            '# HELP requests_total Requests.',
+            '# TYPE requests_total counter',
+            'requests_total{view="task_list"} 1',
+            r'requests_total{view="say \"hi\""} 1',
+            '# HELP duration_seconds Duration.',
+            '# TYPE duration_seconds histogram',
+            'duration_seconds_bucket{le="0.1"} 1',
+            'duration_seconds_bucket{le="1"} 2',
+            'duration_seconds_bucket{le="+Inf"} 3',
+            'duration_seconds_sum 5.55',
+            'duration_seconds_count 3',
+        ]) + '\n')
+
+    def test_processes_aggregated(self) -> None:
+        self.counter.inc(view='task_list')
+        process = multiprocessing.get_context('fork').Process(
+            target=increment_in_child, args=(self.registry, self.counter),
+        )
+        process.start()
+        process.join()
+        self.assertIn('requests_total{view="task_list"} 3',
+                      self.registry.expose())
+
+    def test_per_process_without_directory(self) -> None:
+        registry = metrics.Registry('')
+        counter = metrics.Counter(registry, 'requests_total', 'Requests.')
+        counter.inc()
+        self.assertIn('requests_total 1', registry.expose())
+
+
+class MetricsViewTest(TestCase):
+    """Test case for the metrics endpoint."""
+
+    fixtures = ['labels.json', 'statuses.json', 'tasks.json', 'users.json']
+
+    def setUp(self) -> None:
+        self.client = Client()
+        self.url = reverse('metrics')
+
+    def test_requires_superuser_or_token(self) -> None:
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+        self.client.force_login(User.objects.get(pk=1))
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+        with override_settings(METRICS_TOKEN='secret'):
+            response = self.client.get(self.url,
+                                       HTTP_AUTHORIZATION='Bearer wrong')
+            self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+            response = self.client.get(self.url,
+                                       HTTP_AUTHORIZATION='Bearer secret')
+            self.assertEqual(response.status_code, HTTPStatus.OK)
+
+        User.objects.filter(pk=1).update(is_superuser=True)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+
+    def test_requests_counted(self) -> None:
+        user = User.objects.get(pk=1)
+        user.is_superuser = True
+        user.save()
+        self.client.force_login(user)
+        self.client.get(reverse('task_list'))
+        self.client.get('/missing/')
+
+        content = self.client.get(self.url).content.decode()
+        self.assertIn(
+            'django_http_requests_total{view="task_list",method="GET",'
+            'status="200"}', content,
+        )
+        self.assertIn(
+            'django_http_requests_total{view="unresolved",method="GET",'
+            'status="404"}', content,
+        )
+        self.assertIn('django_db_queries_per_request_bucket{'
+                      'view="task_list",le="+Inf"}', content)
+        self.assertIn('django_session_loads_total{result="hit"}', content)
+        self.assertIn('django_cache_lookups_total{cache="versions",'
+                      'result="hit"}', content)
+        self.assertEqual(self.client.get(self.url)['Content-Type'],
+                         metrics.CONTENT_TYPE)
@@ -0,0 +1,91 @@
+from http import HTTPStatus
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.test import Client, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils.module_loading import import_string
+
+User = get_user_model()
+
+
+@override_settings(SERVER_TIMING_SAMPLE_RATE=1)
+class ServerTimingTest(TestCase):
+    """Test case for the Server-Timing instrumentation of the requests."""
+
+    fixtures = ['labels.json', 'statuses.json', 'tasks.json', 'users.json']
+
+    def setUp(self) -> None:
+        self.client = Client()
+        self.client.force_login(User.objects.get(pk=1))
+        self.async_client.force_login(User.objects.get(pk=1))
+
+    def get_timings(self, response):
+        timings = {}
+        for entry in response['Server-Timing'].split(', '):
+            name, *params = entry.split(';')
+            timings[name] = dict(param.split('=', 1) for param in params)
+        return timings
+
+    def test_header(self) -> None:
+        response = self.client.get(reverse('task_list'))
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        timings = self.get_timings(response)
+        self.assertEqual(set(timings),
+                         {'db', 'view', 'render', 'middleware', 'total'})
+        self.assertGreater(float(timings['render']['dur']), 0)
+        self.assertGreaterEqual(
+            float(timings['total']['dur']),
+            float(timings['view']['dur']) + float(timings['render']['dur']),
+        )
+
+    def test_queries_counted(self) -> None:
+        with self.assertNumQueries(3) as context:
+            response = self.client.get(reverse('status_list'))
+        self.assertEqual(self.get_timings(response)['db']['desc'],
+                         f'"{len(context.captured_queries)} queries"')
+
+    def test_log_tagged_with_url_name(self) -> None:
+        with self.assertLogs('task_manager.timing', 'INFO') as logs:
+            self.client.get(reverse('user_update', args=[1]))
+        record = logs.records[0]
+        self.assertEqual(record.timing['url_name'], 'user_update')
+        self.assertEqual(record.timing['status'], HTTPStatus.OK)
+        self.assertIn('url_name=user_update method=GET status=200',
+                      record.getMessage())
+
+    async def test_async_queries_counted(self) -> None:
+        response = await self.async_client.get(reverse('status_list'))
+        self.assertNotEqual(self.get_timings(response)['db']['desc'],
+                            '"0 queries"')
+
+    @override_settings(SERVER_TIMING_SAMPLE_RATE=0)
+    def test_not_sampled(self) -> None:
+        with self.assertNoLogs('task_manager.timing', 'INFO'):
+            response = self.client.get(reverse('task_list'))
+        self.assertNotIn('Server-Timing', response)
+
+
+class AsyncCapableMiddlewareTest(SimpleTestCase):
+    """Test case for the project middleware under the ASGI handler."""
+
+    def test_async_mode(self) -> None:
+        async def get_response(request):
+            pass
+
+        def sync_get_response(request):
+            pass
+
+        for path in settings.MIDDLEWARE:
+            if not path.startswith('task_manager.'):
+                continue
+            with self.subTest(path):
+                middleware = import_string(path)
+                self.assertTrue(middleware.async_capable)
+                self.assertTrue(
+                    iscoroutinefunction(middleware(get_response))
+                )
+                self.assertFalse(
+                    iscoroutinefunction(middleware(sync_get_response))
+                )
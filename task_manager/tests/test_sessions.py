@@ -0,0 +1,71 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.models import Session
+from django.core.management import call_command
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.translation import gettext as _
+
+User = get_user_model()
+
+
+class MessageStorageTest(TestCase):
+    """Test case for the messages kept out of the session."""
+
+    fixtures = ['labels.json', 'statuses.json', 'tasks.json', 'users.json']
+
+    def setUp(self) -> None:
+        self.client = Client()
+        self.client.force_login(User.objects.get(pk=1))
+
+    def test_message_does_not_change_session(self) -> None:
+        session = Session.objects.get()
+        response = self.client.post(reverse('status_create'),
+                                    {'name': 'new status'}, follow=True)
+        message = list(response.context.get('messages'))[0]
+        self.assertEqual(message.message, _('The status successfully created'))
+        self.assertEqual(Session.objects.get().expire_date,
+                         session.expire_date)
+        self.assertEqual(Session.objects.get().session_data,
+                         session.session_data)
+
+
+class PurgeSessionsTest(TestCase):
+    """Test case for the batched purge of expired sessions."""
+
+    def setUp(self) -> None:
+        now = timezone.now()
+        Session.objects.bulk_create(
+            [Session(session_key=f'expired{number:03}', session_data='',
+                     expire_date=now - timedelta(days=1))
+             for number in range(25)]
+            + [Session(session_key='active', session_data='',
+                       expire_date=now + timedelta(days=1))]
+        )
+
+    def test_purge(self) -> None:
+        out = StringIO()
+        call_command('purge_sessions', '--batch-size', '10', stdout=out)
+        self.assertEqual(out.getvalue(),
+                         'Deleted 25 expired sessions in 3 batches.\n')
+        self.assertEqual(
+            list(Session.objects.values_list('session_key', flat=True)),
+            ['active'],
+        )
+
+    def test_incremental(self) -> None:
+        call_command('purge_sessions', '--batch-size', '10',
+                     '--max-batches', '2', stdout=StringIO())
+        self.assertEqual(Session.objects.count(), 6)
+
+    @override_settings(
+        SESSION_ENGINE='django.contrib.sessions.backends.signed_cookies',
+    )
+    def test_cookie_sessions(self) -> None:
+        out = StringIO()
+        call_command('purge_sessions', stdout=out)
+        self.assertIn('nothing to purge', out.getvalue())
+        self.assertEqual(Session.objects.count(), 26)
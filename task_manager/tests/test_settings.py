@@ -0,0 +1,68 @@
+import os
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from task_manager.settings import (
+    LOCAL_MEMORY_CACHE,
+    get_build_id,
+    get_cache,
+    get_flag,
+)
+
+
+class GetFlagTest(TestCase):
+    """Test case for the boolean settings read from the environment."""
+
+    def test_values(self) -> None:
+        for value, expected in (('1', True), ('true', True), ('True', True),
+                                ('on', True), ('0', False),
+                                ('False', False), ('false', False),
+                                ('', False)):
+            with self.subTest(value=value), \
+                    patch.dict(os.environ, {'TEST_FLAG': value}):
+                self.assertIs(get_flag('TEST_FLAG', True), expected)
+
+    def test_default(self) -> None:
+        with patch.dict(os.environ):
+            os.environ.pop('TEST_FLAG', None)
+            self.assertIs(get_flag('TEST_FLAG'), False)
+            self.assertIs(get_flag('TEST_FLAG', 'yes'), True)
+
+
+class GetCacheTest(TestCase):
+    """Test case for the cache settings read from the environment."""
+
+    def test_culled_backend_bounded(self) -> None:
+        with patch.dict(os.environ, {'TEST_CACHE_MAX_ENTRIES': '50'}):
+            cache = get_cache('TEST_CACHE', 'test', 100)
+        self.assertEqual(cache['OPTIONS'], {'MAX_ENTRIES': 50})
+
+    def test_other_backend_without_options(self) -> None:
+        backend = 'django.core.cache.backends.redis.RedisCache'
+        with patch.dict(os.environ, {'TEST_CACHE_BACKEND': backend}):
+            cache = get_cache('TEST_CACHE', 'test', 100)
+        self.assertEqual(cache['BACKEND'], backend)
+        self.assertNotIn('OPTIONS', cache)
+
+    def test_local_memory_backend_named(self) -> None:
+        cache = get_cache('TEST_CACHE', 'test', 100, LOCAL_MEMORY_CACHE)
+        self.assertEqual(cache['BACKEND'], LOCAL_MEMORY_CACHE)
+        self.assertEqual(cache['LOCATION'], 'test')
+        self.assertEqual(cache['OPTIONS'], {'MAX_ENTRIES': 100})
+
+
+class GetBuildIdTest(TestCase):
+    """Test case for the digest identifying the deployed sources."""
+
+    def test_changes_with_sources(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            template = Path(directory) / 'page.html'
+            template.write_text('old')
+            (Path(directory) / 'notes.txt').write_text('old')
+            build_id = get_build_id(directory)
+            (Path(directory) / 'notes.txt').write_text('new')
+            self.assertEqual(get_build_id(directory), build_id)
+            template.write_text('new')
+            self.assertNotEqual(get_build_id(directory), build_id)
@@ -0,0 +1,50 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.template import engines
+from django.test import TestCase
+from task_manager import warmup
+
+
+class WarmupTest(TestCase):
+    """Test case for the warm-up of templates and URLs."""
+
+    def test_all_project_templates_compiled(self) -> None:
+        names = {timing.name for timing in warmup.warm_templates()}
+        self.assertIn('base.html', names)
+        self.assertIn('tasks/task_row.html', names)
+        self.assertIn('users/user_list.html', names)
+        self.assertFalse(any(name.startswith('admin/') for name in names))
+
+    def test_templates_are_cached(self) -> None:
+        warmup.warm_templates()
+        loader = engines['django'].engine.template_loaders[0]
+        self.assertIn('tasks/task_list.html', {
+            template.origin.template_name
+            for template in loader.get_template_cache.values()
+            if hasattr(template, 'origin')
+        })
+
+    def test_failure_does_not_stop_warm_up(self) -> None:
+        engine = engines['django']
+        get_template = engine.get_template
+
+        def broken(name):
+            if name == 'base.html':
+                raise UnicodeDecodeError('utf-8', b'', 0, 1, 'invalid')
+            return get_template(name)
+
+        with patch.object(engine, 'get_template', broken), \
+                self.assertLogs('task_manager.warmup', 'ERROR') as logs:
+            timings = warmup.warm_up()
+        errors = {timing.name for timing in timings if timing.error}
+        self.assertEqual(errors, {'base.html'})
+        self.assertGreater(len(timings), 1)
+        self.assertIn('base.html', logs.output[0])
+
+    def test_command(self) -> None:
+        out = StringIO()
+        call_command('warmup', stdout=out)
+        self.assertIn('ms  tasks/task_list.html', out.getvalue())
+        self.assertIn('URL names', out.getvalue())
@@ -33,4 +33,10 @@ urlpatterns = [
     path('statuses/', include('task_manager.statuses.urls')),
     path('tasks/', include('task_manager.tasks.urls')),
     path('labels/', include('task_manager.labels.urls')),
+
+    # API
+    path('api/', include('task_manager.api.urls')),
+
+    # Metrics
+    path('metrics/', views.MetricsView.as_view(), name='metrics'),
 ]
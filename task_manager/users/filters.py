@@ -0,0 +1,22 @@
+import django_filters
+from django.contrib.auth import get_user_model
+from django.utils.translation import gettext as _
+
+from .search import search_users
+
+User = get_user_model()
+
+
+class UserFilter(django_filters.FilterSet):
+
+    q = django_filters.CharFilter(
+        method="search",
+        label=_("Search"),
+    )
+
+    def search(self, queryset, field_name, value):
+        return search_users(queryset, value)
+
+    class Meta:
+        model = User
+        fields = []
@@ -0,0 +1,87 @@
+# Generated by Django 4.1.7 on 2026-10-18 02:05
+
+import unicodedata
+
+from django.db import migrations, models
+
+# Copied from task_manager.users.search, the migration has to keep working
+# when that module changes.
+NAME_FIELDS = ('username', 'first_name', 'last_name')
+
+POSTGRESQL_FORWARD = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    *(
+        f"CREATE INDEX users_customuser_{field}_trgm_idx "
+        f"ON users_customuser USING gin (UPPER({field}::text) gin_trgm_ops)"
+        for field in NAME_FIELDS
+    ),
+)
+POSTGRESQL_BACKWARD = tuple(
+    f"DROP INDEX IF EXISTS users_customuser_{field}_trgm_idx"
+    for field in NAME_FIELDS
+)
+
+
+def normalize(text):
+    decomposed = unicodedata.normalize('NFKD', text or '')
+    return ''.join(
+        char for char in decomposed if not unicodedata.combining(char)
+    ).casefold().strip()
+
+
+def set_search_keys(apps, schema_editor):
+    CustomUser = apps.get_model('users', 'CustomUser')
+    users = list(CustomUser.objects.only(*NAME_FIELDS))
+    for user in users:
+        for field in NAME_FIELDS:
+            setattr(user, f'{field}_key', normalize(getattr(user, field)))
+    CustomUser.objects.bulk_update(
+        users, [f'{field}_key' for field in NAME_FIELDS], batch_size=500,
+    )
+
+
+def run(statements):
+    def operation(apps, schema_editor):
+        if schema_editor.connection.vendor == 'postgresql':
+            for statement in statements:
+                schema_editor.execute(statement)
+    return operation
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customuser',
+            name='first_name_key',
+            field=models.CharField(default='', editable=False, max_length=150),
+        ),
+        migrations.AddField(
+            model_name='customuser',
+            name='last_name_key',
+            field=models.CharField(default='', editable=False, max_length=150),
+        ),
+        migrations.AddField(
+            model_name='customuser',
+            name='username_key',
+            field=models.CharField(default='', editable=False, max_length=150),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['username_key'], name='user_username_key_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['first_name_key'], name='user_first_name_key_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['last_name_key'], name='user_last_name_key_idx'),
+        ),
+        migrations.RunPython(set_search_keys, migrations.RunPython.noop),
+        migrations.RunPython(run(POSTGRESQL_FORWARD), run(POSTGRESQL_BACKWARD)),
+    ]
@@ -2,6 +2,8 @@ from django.contrib.auth.models import AbstractUser
 from django.db import models
 from django.utils.translation import gettext as _
 
+from .search import NAME_FIELDS, get_key_field, normalize
+
 MAX_LENGTH = 150
 
 
@@ -18,6 +20,39 @@ class CustomUser(AbstractUser):
         blank=False,
         verbose_name=_('last name')
     )
+    # Normalized names matched by the user search, see `search.py`.
+    username_key = models.CharField(
+        max_length=MAX_LENGTH, editable=False, default='',
+    )
+    first_name_key = models.CharField(
+        max_length=MAX_LENGTH, editable=False, default='',
+    )
+    last_name_key = models.CharField(
+        max_length=MAX_LENGTH, editable=False, default='',
+    )
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(fields=['username_key'],
+                         name='user_username_key_idx'),
+            models.Index(fields=['first_name_key'],
+                         name='user_first_name_key_idx'),
+            models.Index(fields=['last_name_key'],
+                         name='user_last_name_key_idx'),
+        ]
 
     def __str__(self):
         return self.get_full_name()
+
+    def save(self, *args, **kwargs):
+        for field in NAME_FIELDS:
+            setattr(self, get_key_field(field),
+                    normalize(getattr(self, field)))
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {
+                *update_fields,
+                *(get_key_field(field) for field in NAME_FIELDS
+                  if field in update_fields),
+            }
+        super().save(*args, **kwargs)
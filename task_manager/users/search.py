@@ -0,0 +1,55 @@
+"""
+Search of users by username, first and last name.
+
+Every word of the query has to start one of the names. SQLite matches the
+words against the normalized `*_key` columns of `CustomUser` with an index
+range scan, PostgreSQL matches them anywhere in the names with the trigram
+indexes created by the `0002_customuser_search_keys` migration.
+"""
+import unicodedata
+
+from django.db import connection
+from django.db.models import Q
+
+NAME_FIELDS = ('username', 'first_name', 'last_name')
+# Greater than any character, so `key < prefix + PREFIX_END` is a prefix.
+PREFIX_END = '\U0010ffff'
+
+
+def normalize(text):
+    """Lowercase the text and strip the diacritics from it."""
+    decomposed = unicodedata.normalize('NFKD', text or '')
+    return ''.join(
+        char for char in decomposed if not unicodedata.combining(char)
+    ).casefold().strip()
+
+
+def get_key_field(field):
+    return f'{field}_key'
+
+
+def _prefix_condition(word):
+    prefix = normalize(word)
+    condition = Q()
+    for field in NAME_FIELDS:
+        key = get_key_field(field)
+        condition |= Q(**{f'{key}__gte': prefix,
+                          f'{key}__lt': prefix + PREFIX_END})
+    return condition
+
+
+def _contains_condition(word):
+    condition = Q()
+    for field in NAME_FIELDS:
+        condition |= Q(**{f'{field}__icontains': word})
+    return condition
+
+
+def search_users(queryset, query):
+    if connection.vendor == 'postgresql':
+        make_condition = _contains_condition
+    else:
+        make_condition = _prefix_condition
+    for word in (query or '').split():
+        queryset = queryset.filter(make_condition(word))
+    return queryset
@@ -1,10 +1,15 @@
 from http import HTTPStatus
+from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import connection
 from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.translation import gettext as _
+from django.utils.translation import ngettext
+from task_manager.users.views import UserListView
 
 User = get_user_model()
 
@@ -44,6 +49,36 @@ class UserListViewTest(TestCase):
             self.assertContains(response, f'/users/{user_id}/update/')
             self.assertContains(response, f'/users/{user_id}/delete/')
 
+    def test_search(self) -> None:
+        user = User.objects.get(pk=2)
+        user.last_name = 'Müller'
+        user.save()
+        for query, expected in (('user_2', [2]), ('muller', [2]),
+                                ('first_name_user', [1, 2, 3]),
+                                ('first user_3', [3]), ('name_user', [])):
+            response = self.client.get(reverse('user_list'), {'q': query})
+            self.assertEqual(
+                [user.pk for user in response.context['users']], expected,
+            )
+
+    def test_pagination_and_count(self) -> None:
+        with patch.object(UserListView, 'paginate_by', 2), \
+                patch.object(UserListView, 'count_limit', 2):
+            response = self.client.get(reverse('user_list'))
+            self.assertEqual(
+                [user.pk for user in response.context['users']], [1, 2],
+            )
+            self.assertContains(
+                response, _('More than %(count_limit)s users')
+                % {'count_limit': 2},
+            )
+
+            cursor = response.context['page_obj'].next_cursor
+            response = self.client.get(reverse('user_list'),
+                                       {'cursor': cursor})
+        self.assertEqual([user.pk for user in response.context['users']],
+                         [3])
+
 
 class UserCreateViewTest(TestCase):
     """"Test case for UserCreateView."""
@@ -149,6 +184,17 @@ class UserUpdateViewTest(TestCase):
         response = self.client.get(reverse('user_update', args=[1]))
         self.assertEqual(response.status_code, HTTPStatus.OK)
 
+    def test_user_fetched_once(self) -> None:
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('user_update', args=[1]))
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        # The session user and the user being updated.
+        self.assertEqual(len([
+            query for query in queries
+            if query['sql'].startswith('SELECT')
+            and f'FROM "{User._meta.db_table}"' in query['sql']
+        ]), 2)
+
     def test_view_uses_correct_template(self) -> None:
         response = self.client.get(reverse('user_update', args=[1]))
         self.assertEqual(response.status_code, HTTPStatus.OK)
@@ -323,6 +369,16 @@ class UserDeleteViewTest(TestCase):
         )
         self.assertEqual(message.tags, 'error')
 
+    def test_view_shows_blocking_tasks(self) -> None:
+        self.client.force_login(User.objects.get(pk=1))
+        response = self.client.get(reverse('user_delete', args=[1]))
+        # Author of one task and executor of two others.
+        self.assertEqual(response.context['blocking_count'], 3)
+        self.assertContains(response, ngettext(
+            'It is used by %(counter)s task and cannot be deleted.',
+            'It is used by %(counter)s tasks and cannot be deleted.', 3,
+        ) % {'counter': 3})
+
     def test_do_not_delete_user_linked_to_task(self) -> None:
         self.client.force_login(User.objects.get(pk=1))
         user_before = User.objects.get(pk=1)
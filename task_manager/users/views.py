@@ -3,23 +3,36 @@ from django.contrib.messages.views import SuccessMessageMixin
 from django.urls import reverse_lazy
 from django.utils.translation import gettext as _
 from django.views import generic
+from django_filters.views import FilterView
 from task_manager.mixins import (
     CustomLoginRequiredMixin,
     DeletionProtectionMixin,
     OwnerOnlyAccessMixin,
 )
+from task_manager.pagination import KeysetPaginationMixin, bounded_count
 
+from .filters import UserFilter
 from .forms import UserCreationAndChangeForm
 
 User = get_user_model()
 
 
-class UserListView(generic.ListView):
+class UserListView(KeysetPaginationMixin, FilterView):
     """Generic class-based view for a list of users."""
 
     model = User
     template_name = 'users/user_list.html'
     context_object_name = 'users'
+    filterset_class = UserFilter
+    keyset_ordering = ('pk',)
+    count_limit = 1000
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['user_count'] = bounded_count(self.object_list,
+                                              self.count_limit)
+        context['count_limit'] = self.count_limit
+        return context
 
 
 class UserCreateView(SuccessMessageMixin, generic.CreateView):
@@ -1,8 +1,14 @@
+import hmac
+
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.views import LoginView, LogoutView
 from django.contrib.messages.views import SuccessMessageMixin
+from django.core.exceptions import PermissionDenied
+from django.http import HttpResponse
 from django.utils.translation import gettext as _
-from django.views.generic.base import TemplateView
+from django.views.generic.base import TemplateView, View
+from task_manager import metrics
 
 
 class HomePageView(TemplateView):
@@ -27,3 +33,22 @@ class UserLogoutView(SuccessMessageMixin, LogoutView):
     def dispatch(self, request, *args, **kwargs):
         messages.info(self.request, _('You are logged out'))
         return super().dispatch(request, *args, **kwargs)
+
+
+class MetricsView(View):
+    """View of the metrics of all workers in the Prometheus text format."""
+
+    def get(self, request, *args, **kwargs):
+        if not self.is_authorized(request):
+            raise PermissionDenied
+        return HttpResponse(metrics.registry.expose(),
+                            content_type=metrics.CONTENT_TYPE)
+
+    def is_authorized(self, request):
+        if request.user.is_superuser:
+            return True
+        token = settings.METRICS_TOKEN
+        authorization = request.headers.get('Authorization', '')
+        return bool(token) and hmac.compare_digest(
+            authorization.encode(), f'Bearer {token}'.encode(),
+        )
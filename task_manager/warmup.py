@@ -0,0 +1,97 @@
+"""
+Warm-up of a worker process before it accepts requests.
+
+Templates of the project are compiled into the cached template loader and
+the URL resolver builds its reverse lookup tables, so that the first
+request to every page does not pay for it.
+"""
+import logging
+import os
+import time
+from dataclasses import dataclass
+
+from django.template import engines
+from django.urls import NoReverseMatch, get_resolver, reverse
+
+logger = logging.getLogger(__name__)
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+@dataclass
+class TemplateTiming:
+    name: str
+    seconds: float
+    error: Exception = None
+
+
+def get_template_dirs():
+    """Template directories of the project, third-party apps excluded."""
+    for engine in engines.all():
+        seen = set()
+        for loader in engine.engine.template_loaders:
+            # The cached loader wraps the loaders that know the directories.
+            for inner in getattr(loader, 'loaders', [loader]):
+                for directory in map(str, inner.get_dirs()):
+                    if directory.startswith(PROJECT_DIR) and \
+                            directory not in seen:
+                        seen.add(directory)
+                        yield engine, directory
+
+
+def get_template_names():
+    for engine, directory in get_template_dirs():
+        for root, _dirs, files in os.walk(directory):
+            for file in sorted(files):
+                path = os.path.join(root, file)
+                yield engine, os.path.relpath(path, directory)
+
+
+def warm_templates():
+    """Compile every template of the project and time each one."""
+    timings = []
+    for engine, name in get_template_names():
+        start = time.perf_counter()
+        error = None
+        try:
+            engine.get_template(name)
+        except Exception as exc:
+            # A broken or unreadable file must not stop the worker from
+            # starting, the request to it fails the same way later.
+            error = exc
+        timings.append(
+            TemplateTiming(name, time.perf_counter() - start, error)
+        )
+    return timings
+
+
+def warm_urls():
+    """Reverse every named URL and return the number of names."""
+    resolver = get_resolver()
+    names = [key for key in resolver.reverse_dict if isinstance(key, str)]
+    for name in names:
+        for _bits, _pattern, _defaults, converters in \
+                resolver.reverse_dict.getlist(name):
+            try:
+                reverse(name, kwargs={key: 1 for key in converters})
+            except NoReverseMatch:
+                pass
+            except Exception as error:
+                logger.error('URL %s failed to reverse: %s', name, error)
+    return len(names)
+
+
+def warm_up():
+    """Warm up the templates and URLs, log how long it took."""
+    start = time.perf_counter()
+    timings = warm_templates()
+    urls = warm_urls()
+    for timing in timings:
+        if timing.error is not None:
+            logger.error('Template %s failed to compile: %s',
+                         timing.name, timing.error)
+    logger.info(
+        'Warm-up compiled %d templates and %d URL names in %.1f ms',
+        len(timings), urls, (time.perf_counter() - start) * 1000,
+    )
+    return timings